@@ -0,0 +1,2 @@
+# Benchmarks for the coordinate geometry toolkit
+# Run from the project root, e.g.  python -m benchmarks.bench_rtree
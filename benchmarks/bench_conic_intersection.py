@@ -0,0 +1,78 @@
+# Conic–line intersection benchmark
+# Closed-form quadratic solve (intersect_lines) against the old brute-force approach:
+# walk each segment in small steps with the scalar membership test and take the
+# midpoint of every inside/outside flip. Reports time per line and the worst
+# distance between the two answers.
+#
+#   python -m benchmarks.bench_conic_intersection --lines 100000 --sampled-lines 500 --steps 2000
+
+import argparse
+import time
+
+import numpy as np
+
+from coordinate_geometry_toolkit.point import Point
+from coordinate_geometry_toolkit.ellipse import Ellipse
+from coordinate_geometry_toolkit.hyperbola import Hyperbola
+from coordinate_geometry_toolkit.parabola import Parabola
+
+
+def sampled_intersections(inside, x1, y1, x2, y2, steps):
+    # brute force: sign changes of the membership test along the segment
+    hits = []
+    prev = inside(Point(x1, y1))
+    px, py = x1, y1
+    for i in range(1, steps + 1):
+        t = i / steps
+        x, y = x1 + t * (x2 - x1), y1 + t * (y2 - y1)
+        cur = inside(Point(x, y))
+        if cur != prev:
+            hits.append(((px + x) / 2, (py + y) / 2))
+        prev, px, py = cur, x, y
+    return hits
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Conic-line intersection benchmark")
+    parser.add_argument("--lines", type=int, default=100000, help="lines for the closed-form solve")
+    parser.add_argument("--sampled-lines", type=int, default=500, help="lines for the sampling baseline")
+    parser.add_argument("--steps", type=int, default=2000, help="samples per line for the baseline")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args(argv)
+
+    rng = np.random.default_rng(args.seed)
+    conics = [
+        ("Ellipse", Ellipse(Point(0, 0), 4, 2), "is_point_inside"),
+        ("Hyperbola", Hyperbola(Point(0, 0), 2, 1), "is_between_branches"),
+        ("Parabola", Parabola(Point(0, 0), Point(0, 1)), "is_point_inside"),
+    ]
+    x1, y1, x2, y2 = rng.uniform(-8, 8, (4, args.lines))
+
+    for name, conic, test in conics:
+        start = time.perf_counter()
+        xs, ys, counts = conic.intersect_lines((x1, y1, x2, y2), segment=True)
+        closed = (time.perf_counter() - start) / args.lines
+
+        m = args.sampled_lines
+        inside = getattr(conic, test)
+        start = time.perf_counter()
+        sampled = [sampled_intersections(inside, x1[i], y1[i], x2[i], y2[i], args.steps) for i in range(m)]
+        brute = (time.perf_counter() - start) / m
+
+        # accuracy of the baseline, measured against the closed form
+        worst, missed = 0.0, 0
+        for i, hits in enumerate(sampled):
+            exact = [(xs[i, j], ys[i, j]) for j in range(counts[i])]
+            if len(hits) != len(exact):
+                missed += 1
+                continue
+            for (hx, hy), (ex, ey) in zip(hits, exact):
+                worst = max(worst, float(np.hypot(hx - ex, hy - ey)))
+
+        print(f"{name:<10} closed form {closed * 1e6:>8.3f} us/line   "
+              f"sampling {brute * 1e6:>10.1f} us/line   speedup {brute / closed:>8.0f}x   "
+              f"sampling error {worst:.2e} (count mismatches {missed}/{m})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+# Import-time benchmark
+# Imports each toolkit module in a fresh interpreter with `python -X importtime` and
+# reports its cumulative import cost, the part spent in the toolkit's own modules,
+# and the heaviest dependencies it pulls in. Each module is measured --repeat times
+# and the fastest run is kept, since cold-start noise only ever adds time.
+#
+#   python -m benchmarks.bench_import_time
+#   python -m benchmarks.bench_import_time --modules circle scene --top 5
+
+import argparse
+import os
+import subprocess
+import sys
+
+PACKAGE = "coordinate_geometry_toolkit"
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+# scripts rather than library modules: importing them runs an app or a CLI
+SKIP = {"main", "web_app"}
+
+
+def toolkit_modules():
+    names = sorted(f[:-3] for f in os.listdir(os.path.join(ROOT, PACKAGE))
+                   if f.endswith(".py") and f != "__init__.py")
+    return [n for n in names if n not in SKIP]
+
+
+def import_profile(statement):
+    """{module: (self_us, cumulative_us)} from one fresh `python -X importtime -c statement`"""
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", statement],
+                            cwd=ROOT, capture_output=True, text=True)
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.strip().splitlines()[-1])
+    profile = {}
+    for line in result.stderr.splitlines():
+        # "import time:   self [us] | cumulative | imported package"
+        if not line.startswith("import time:") or "imported package" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        profile[name.strip()] = (int(self_us), int(cumulative_us))
+    return profile
+
+
+def measure(statement, target, repeat):
+    """Fastest of repeat runs: (total_us, toolkit_us, profile of that run)"""
+    best = None
+    for _ in range(repeat):
+        profile = import_profile(statement)
+        total = profile[target][1]
+        if best is None or total < best[0]:
+            own = sum(s for name, (s, _) in profile.items() if name.split(".")[0] == PACKAGE)
+            best = (total, own, profile)
+    return best
+
+
+def heaviest_dependencies(profile, startup, top):
+    # top-level third-party/stdlib packages by cumulative time, leaving out what
+    # every interpreter imports at startup (site, encodings, ...)
+    outside = [(c, name) for name, (_, c) in profile.items()
+               if "." not in name and name != PACKAGE and name not in startup]
+    return sorted(outside, reverse=True)[:top]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Per-module import time of the toolkit")
+    parser.add_argument("--modules", nargs="*", help="module names (default: every library module)")
+    parser.add_argument("--repeat", type=int, default=5, help="fresh interpreters per module")
+    parser.add_argument("--top", type=int, default=3, help="heaviest dependencies listed per module")
+    args = parser.parse_args(argv)
+
+    rows = [("(package)", f"import {PACKAGE}", PACKAGE)]
+    rows += [(name, f"import {PACKAGE}.{name}", f"{PACKAGE}.{name}")
+             for name in (args.modules or toolkit_modules())]
+
+    startup = set(import_profile("pass"))
+    print(f"{'module':<16}{'total ms':>10}{'toolkit ms':>12}   heaviest dependencies (cumulative ms)")
+    for label, statement, target in rows:
+        total, own, profile = measure(statement, target, args.repeat)
+        deps = ", ".join(f"{name} {us / 1000:.1f}" for us, name in heaviest_dependencies(profile, startup, args.top))
+        print(f"{label:<16}{total / 1000:>10.2f}{own / 1000:>12.2f}   {deps or '-'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+# R-tree query latency benchmark
+# Builds an index over random Rectangles/Squares and reports p50/p90/p99 latency
+# for point, window and nearest queries against a plain loop over all shapes.
+#
+#   python -m benchmarks.bench_rtree --n 100000 --queries 2000
+
+import argparse
+import random
+import time
+
+from coordinate_geometry_toolkit.point import Point
+from coordinate_geometry_toolkit.rectangle import Rectangle
+from coordinate_geometry_toolkit.square import Square
+from coordinate_geometry_toolkit.rtree import RTree
+
+
+def percentile(samples, q):
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, int(round(q / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def latency(fn, args_list):
+    samples = []
+    for args in args_list:
+        start = time.perf_counter_ns()
+        fn(*args)
+        samples.append((time.perf_counter_ns() - start) / 1000)  # microseconds
+    return samples
+
+
+def report(name, samples):
+    print(f"{name:<24} p50 {percentile(samples, 50):>10.1f} us   "
+          f"p90 {percentile(samples, 90):>10.1f} us   p99 {percentile(samples, 99):>10.1f} us")
+
+
+def make_shapes(n, world, rng):
+    shapes = []
+    for i in range(n):
+        x, y = rng.uniform(0, world), rng.uniform(0, world)
+        w, h = rng.uniform(0.1, 5), rng.uniform(0.1, 5)
+        if i % 4 == 0:
+            shapes.append(Square(Point(x, y), Point(x + w, y + w)))
+        else:
+            shapes.append(Rectangle(Point(x, y), Point(x + w, y + h)))
+    return shapes
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="R-tree query latency benchmark")
+    parser.add_argument("--n", type=int, default=100000, help="number of shapes")
+    parser.add_argument("--queries", type=int, default=1000, help="queries per kind")
+    parser.add_argument("--scan-queries", type=int, default=50, help="queries for the linear-scan baseline")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args(argv)
+
+    rng = random.Random(args.seed)
+    world = 1000.0
+    shapes = make_shapes(args.n, world, rng)
+
+    start = time.perf_counter()
+    tree = RTree.bulk_load(shapes)
+    print(f"STR bulk load of {args.n} shapes: {time.perf_counter() - start:.3f} s")
+
+    start = time.perf_counter()
+    dynamic = RTree()
+    for s in shapes[:min(args.n, 20000)]:
+        dynamic.insert(s)
+    print(f"dynamic insert of {len(dynamic)} shapes: {time.perf_counter() - start:.3f} s")
+
+    points = [(rng.uniform(0, world), rng.uniform(0, world)) for _ in range(args.queries)]
+    windows = [((x, y, x + 20, y + 20),) for x, y in points]
+
+    report("point query", latency(tree.query_point, points))
+    report("window query (20x20)", latency(tree.query_window, windows))
+    report("nearest (k=1)", latency(tree.nearest, points))
+    report("nearest (k=10)", latency(lambda x, y: tree.nearest(x, y, 10), points))
+
+    boxes = [s.bounding_box() for s in shapes]
+
+    def scan_point(x, y):
+        return [s for s, b in zip(shapes, boxes) if b[0] <= x <= b[2] and b[1] <= y <= b[3]]
+
+    report("linear scan point", latency(scan_point, points[:args.scan_queries]))
+
+    start = time.perf_counter()
+    for s in shapes[:min(args.n, 5000)]:
+        tree.delete(s)
+    print(f"delete of {min(args.n, 5000)} shapes: {time.perf_counter() - start:.3f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+# Vector object-churn benchmark
+# Integrates pos = pos + vel * dt with the immutable Vector and with MutableVector
+# and reports wall time and how many Vector objects each loop creates.
+#
+#   python -m benchmarks.bench_vector_churn --steps 1000000
+
+import argparse
+import time
+
+from coordinate_geometry_toolkit import vector as vector_module
+from coordinate_geometry_toolkit.vector import Vector, MutableVector
+
+
+def immutable_loop(steps, dt):
+    pos, vel = Vector(0.0, 0.0), Vector(1.0, 0.5)
+    for _ in range(steps):
+        pos = pos + vel * dt
+    return pos
+
+
+def mutable_operator_loop(steps, dt):
+    # += is in place, but vel * dt still builds a temporary Vector
+    pos, vel = MutableVector(0.0, 0.0), Vector(1.0, 0.5)
+    for _ in range(steps):
+        pos += vel * dt
+    return pos
+
+
+def mutable_scaled_loop(steps, dt):
+    pos, vel = MutableVector(0.0, 0.0), Vector(1.0, 0.5)
+    for _ in range(steps):
+        pos.iadd_scaled(vel, dt)
+    return pos
+
+
+def count_vectors(fn, steps, dt):
+    # count Vector constructions (MutableVector included) by wrapping __init__
+    original = vector_module.Vector.__init__
+    created = [0]
+
+    def counting_init(self, x, y):
+        created[0] += 1
+        original(self, x, y)
+
+    vector_module.Vector.__init__ = counting_init
+    try:
+        fn(steps, dt)
+    finally:
+        vector_module.Vector.__init__ = original
+    return created[0]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Vector vs MutableVector churn benchmark")
+    parser.add_argument("--steps", type=int, default=1000000)
+    parser.add_argument("--dt", type=float, default=0.001)
+    args = parser.parse_args(argv)
+
+    loops = [
+        ("Vector: pos = pos + vel * dt", immutable_loop),
+        ("MutableVector: pos += vel * dt", mutable_operator_loop),
+        ("MutableVector: pos.iadd_scaled(vel, dt)", mutable_scaled_loop),
+    ]
+    for name, fn in loops:
+        start = time.perf_counter()
+        pos = fn(args.steps, args.dt)
+        elapsed = time.perf_counter() - start
+        created = count_vectors(fn, min(args.steps, 100000), args.dt)
+        per_step = created / min(args.steps, 100000)
+        print(f"{name:<42} {elapsed:8.3f} s   {per_step:5.2f} vectors/step   final {pos}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,429 @@
+# Benchmark suite with regression baselines
+# Times the main operations of every shape class at several input sizes, writes the
+# results as JSON and compares them with a stored baseline. Any case slower than
+# the baseline by more than --threshold (a fraction, 0.5 = 50%) is reported as a
+# regression and the run exits with status 1. Everything runs offline.
+#
+# Every sample is divided by a fixed calibration workload timed right after it, and
+# cases are compared on that relative time, which absorbs overall machine speed
+# drift. Timings still only compare on the machine that recorded them. The committed
+# baseline.json was recorded with `python -m benchmarks.run --record` on the
+# machine named in its "environment" block; on any other machine record your own
+# first (on an unchanged tree), then compare against it. A run warns when the
+# baseline's environment differs from the current one.
+#
+#   python -m benchmarks.run --record                     # record this machine's baseline
+#   python -m benchmarks.run                              # run, compare with benchmarks/baseline.json
+#   python -m benchmarks.run --output results.json        # also save this run
+#   python -m benchmarks.run --filter polygon --sizes 1000 --threshold 1.0
+#
+# The result cache (cache.py) is switched off unless --with-cache is given, so the
+# cases time the computations themselves rather than repeated cache hits.
+
+import argparse
+import json
+import math
+import os
+import platform
+import random
+import statistics
+import sys
+import time
+
+import numpy as np
+
+from coordinate_geometry_toolkit.point import Point
+from coordinate_geometry_toolkit.line import Line
+from coordinate_geometry_toolkit.circle import Circle
+from coordinate_geometry_toolkit.triangle import Triangle
+from coordinate_geometry_toolkit.polygon import Polygon
+from coordinate_geometry_toolkit.rectangle import Rectangle
+from coordinate_geometry_toolkit.square import Square
+from coordinate_geometry_toolkit.vector import Vector
+from coordinate_geometry_toolkit.vector_array import VectorArray
+from coordinate_geometry_toolkit.ellipse import Ellipse, ellipse_perimeters
+from coordinate_geometry_toolkit.hyperbola import Hyperbola
+from coordinate_geometry_toolkit.parabola import Parabola
+from coordinate_geometry_toolkit.parabola_array import ParabolaArray
+from coordinate_geometry_toolkit.simplify import simplify_polygon
+from coordinate_geometry_toolkit.cache import shape_cache
+
+BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+SIZES = (100, 1000, 10000)
+
+# ---------- cases ----------
+# Each case takes (n, rng) and returns a zero-argument function doing the timed work.
+# Set-up (building inputs) happens outside the timed function.
+
+CASES = {}
+
+
+def case(name):
+    def register(fn):
+        CASES[name] = fn
+        return fn
+    return register
+
+
+def random_points(n, rng, span=100.0):
+    return [Point(rng.uniform(-span, span), rng.uniform(-span, span)) for _ in range(n)]
+
+
+def random_columns(n, rng, span=10.0):
+    return np.array([rng.uniform(-span, span) for _ in range(n)]), np.array([rng.uniform(-span, span) for _ in range(n)])
+
+
+def regular_polygon(n, radius=50.0):
+    return Polygon([Point(radius * math.cos(2 * math.pi * i / n), radius * math.sin(2 * math.pi * i / n))
+                    for i in range(n)])
+
+
+@case("point.distance_bw_two_points")
+def _(n, rng):
+    pts = random_points(n, rng)
+    origin = Point(1.0, 2.0)
+    return lambda: [origin.distance_bw_two_points(p) for p in pts]
+
+
+@case("point.midpoint_and_quadrant")
+def _(n, rng):
+    pts = random_points(n, rng)
+    origin = Point(1.0, 2.0)
+    return lambda: [(origin.midpoint(p), p.get_quadrant()) for p in pts]
+
+
+@case("line.length_and_perpendicular")
+def _(n, rng):
+    lines = [Line(a, b) for a, b in zip(random_points(n, rng), random_points(n, rng))]
+    other = Line(Point(-3, -7), Point(5, 11))
+    return lambda: [(line.length_of_the_line_segment(), line.is_perpendicular(other)) for line in lines]
+
+
+@case("line.distance_from_point")
+def _(n, rng):
+    line = Line(Point(-3, -7), Point(5, 11))
+    pts = random_points(n, rng)
+    return lambda: [line.distance_from_point(p) for p in pts]
+
+
+@case("circle.generate_points")
+def _(n, rng):
+    circle = Circle(Point(1, 2), 5)
+    return lambda: circle.generate_points(n)
+
+
+@case("circle.is_point_on_circle")
+def _(n, rng):
+    circle = Circle(Point(1, 2), 50)
+    pts = random_points(n, rng)
+    return lambda: [circle.is_point_on_circle(p) for p in pts]
+
+
+@case("triangle.area_and_circumcenter")
+def _(n, rng):
+    triangles = [Triangle(*random_points(3, rng)) for _ in range(n)]
+    return lambda: [(t.area(), t.circumcenter()) for t in triangles]
+
+
+@case("polygon.area_perimeter")
+def _(n, rng):
+    polygon = regular_polygon(n)
+    return lambda: (polygon.area(), polygon.perimeter())
+
+
+@case("polygon.is_point_inside")
+def _(n, rng):
+    polygon = regular_polygon(n)
+    pts = random_points(100, rng, span=60.0)
+    return lambda: [polygon.is_point_inside(p) for p in pts]
+
+
+@case("polygon.simplify_douglas_peucker")
+def _(n, rng):
+    polygon = Polygon([Point((50 + rng.uniform(-1, 1)) * math.cos(2 * math.pi * i / n),
+                             (50 + rng.uniform(-1, 1)) * math.sin(2 * math.pi * i / n)) for i in range(n)])
+    return lambda: simplify_polygon(polygon, 0.5)
+
+
+@case("rectangle.is_point_inside")
+def _(n, rng):
+    rect = Rectangle(Point(-20, -10), Point(30, 40))
+    pts = random_points(n, rng)
+    return lambda: [rect.is_point_inside(p) for p in pts]
+
+
+@case("rectangle.contains_many")
+def _(n, rng):
+    rect = Rectangle(Point(-20, -10), Point(30, 40))
+    pts = random_points(n, rng)
+    return lambda: rect.contains_many(pts)
+
+
+@case("rectangle.contains_many_columns")
+def _(n, rng):
+    rect = Rectangle(Point(-20, -10), Point(30, 40))
+    xs, ys = random_columns(n, rng, span=100.0)
+    return lambda: rect.contains_many(xs, ys)
+
+
+@case("square.construct_and_area")
+def _(n, rng):
+    corners = [(rng.uniform(-50, 50), rng.uniform(-50, 50), rng.uniform(1, 10)) for _ in range(n)]
+    return lambda: [Square(Point(x, y), Point(x + s, y + s)).area() for x, y, s in corners]
+
+
+@case("vector.add_dot_rotate")
+def _(n, rng):
+    vectors = [Vector(rng.uniform(-5, 5), rng.uniform(-5, 5)) for _ in range(n)]
+    w = Vector(0.3, -1.2)
+    return lambda: [((v + w).dot(w), v.rotate(30)) for v in vectors]
+
+
+@case("vector_array.rotate")
+def _(n, rng):
+    arr = VectorArray(*random_columns(n, rng))
+    out = VectorArray.empty(n)
+    return lambda: arr.rotate(30, out=out)
+
+
+@case("ellipse.generate_points")
+def _(n, rng):
+    ellipse = Ellipse(Point(1, 2), 5, 3)
+    return lambda: ellipse.generate_points(n)
+
+
+@case("ellipse.perimeters_agm")
+def _(n, rng):
+    a = np.array([rng.uniform(1, 10) for _ in range(n)])
+    b = a * np.array([rng.uniform(0.01, 1) for _ in range(n)])
+    return lambda: ellipse_perimeters(a, b)
+
+
+@case("ellipse.classify_points")
+def _(n, rng):
+    ellipse = Ellipse(Point(1, 2), 5, 3)
+    xs, ys = random_columns(n, rng)
+    return lambda: ellipse.classify_points(xs, ys)
+
+
+@case("ellipse.distance_to_points")
+def _(n, rng):
+    ellipse = Ellipse(Point(1, 2), 5, 3)
+    xs, ys = random_columns(n, rng)
+    return lambda: ellipse.distance_to_points(xs, ys)
+
+
+@case("hyperbola.generate_points")
+def _(n, rng):
+    hyperbola = Hyperbola(Point(0, 0), 2, 1)
+    return lambda: hyperbola.generate_points(n)
+
+
+@case("hyperbola.sample_branches")
+def _(n, rng):
+    hyperbola = Hyperbola(Point(0, 0), 2, 1)
+    return lambda: hyperbola.sample_branches(n)
+
+
+@case("hyperbola.classify_points")
+def _(n, rng):
+    hyperbola = Hyperbola(Point(0, 0), 2, 1)
+    xs, ys = random_columns(n, rng)
+    return lambda: hyperbola.classify_points(xs, ys)
+
+
+@case("parabola.construct")
+def _(n, rng):
+    vertices = [(rng.uniform(-5, 5), rng.uniform(-5, 5), rng.uniform(0.5, 3)) for _ in range(n)]
+    return lambda: [Parabola(Point(x, y), Point(x, y + a)) for x, y, a in vertices]
+
+
+@case("parabola.parabola_array")
+def _(n, rng):
+    h, k = random_columns(n, rng)
+    return lambda: ParabolaArray(h, k, h, k + 1.0).directrix()
+
+
+@case("parabola.distance_to_points")
+def _(n, rng):
+    parabola = Parabola(Point(0, 0), Point(0, 1))
+    xs, ys = random_columns(n, rng)
+    return lambda: parabola.distance_to_points(xs, ys)
+
+
+@case("parabola.arc_length")
+def _(n, rng):
+    parabola = Parabola(Point(0, 0), Point(0, 1))
+    t0, t1 = random_columns(n, rng)
+    return lambda: parabola.arc_length(t0, t1)
+
+
+# ---------- timing ----------
+
+def _calibration_work():
+    # fixed mix of Python-level object work and small numpy calls, like the cases
+    pts = [Point(i * 0.5, i * 0.25) for i in range(200)]
+    total = sum(p.distance_from_origin() for p in pts)
+    arr = np.arange(200.0)
+    return total + float(np.hypot(arr, arr).sum())
+
+
+def calibrate(samples=3):
+    """Best time of the fixed calibration workload"""
+    best = math.inf
+    for _ in range(samples):
+        start = time.perf_counter()
+        for _ in range(10):
+            _calibration_work()
+        best = min(best, (time.perf_counter() - start) / 10)
+    return best
+
+
+def time_case(fn, repeat, min_sample):
+    """
+    Median and best seconds per call over `repeat` samples of at least min_sample seconds,
+    plus the median of sample / calibration time, with the calibration workload timed
+    right after every sample so both see the same machine speed
+    """
+    fn()  # warm-up (imports, caches)
+    number = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(number):
+            fn()
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_sample or number >= 1 << 20:
+            break
+        number *= 2
+    samples = [elapsed / number]
+    relative = [samples[0] / calibrate()]
+    for _ in range(repeat - 1):
+        start = time.perf_counter()
+        for _ in range(number):
+            fn()
+        samples.append((time.perf_counter() - start) / number)
+        relative.append(samples[-1] / calibrate())
+    return statistics.median(samples), min(samples), statistics.median(relative), number
+
+
+def run(names, sizes, repeat, min_sample, seed):
+    results = {}
+    for name in names:
+        for n in sizes:
+            fn = CASES[name](n, random.Random(seed))
+            median, best, relative, number = time_case(fn, repeat, min_sample)
+            key = f"{name}[n={n}]"
+            results[key] = {"case": name, "n": n, "median_s": median, "min_s": best,
+                            "relative": relative, "repeat": repeat, "number": number}
+            print(f"{key:<48} {median * 1e6:>14.1f} us", flush=True)
+    return results
+
+
+def environment():
+    return {
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "shape_cache": shape_cache.enabled,
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+    }
+
+
+# ---------- baseline comparison ----------
+
+def warn_environment(recorded, current):
+    fields = [f for f in ("platform", "machine", "python", "numpy", "shape_cache")
+              if recorded.get(f) != current.get(f)]
+    if fields:
+        print("\nwarning: the baseline was recorded in a different environment (" +
+              ", ".join(f"{f}: {recorded.get(f)} -> {current.get(f)}" for f in fields) +
+              "); record one on this machine with --record before trusting the ratios")
+
+
+def compare(results, baseline, threshold):
+    """
+    Print a comparison table; returns the keys that regressed beyond the threshold
+    Cases are compared on their time relative to the calibration workload (see
+    time_case), so a machine that is slower overall (CPU frequency, busy neighbours)
+    does not read as a regression; baselines without it fall back to the best sample
+    """
+    regressions = []
+    print("\nratio = current / baseline, each relative to the calibration workload timed alongside")
+    print(f"{'case (best of samples)':<48} {'baseline us':>14} {'current us':>14} {'ratio':>8}")
+    for key, current in results.items():
+        base = baseline.get(key)
+        if base is None:
+            print(f"{key:<48} {'-':>14} {current['min_s'] * 1e6:>14.1f} {'new':>8}")
+            continue
+        field = "relative" if "relative" in base and "relative" in current else "min_s"
+        ratio = current[field] / base[field] if base[field] > 0 else math.inf
+        flag = ""
+        if ratio > 1 + threshold:
+            regressions.append(key)
+            flag = "  REGRESSION"
+        print(f"{key:<48} {base['min_s'] * 1e6:>14.1f} {current['min_s'] * 1e6:>14.1f} {ratio:>8.2f}{flag}")
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Toolkit benchmark suite with baseline comparison")
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(SIZES), help="input sizes to run")
+    parser.add_argument("--filter", default="", help="only run cases whose name contains this text")
+    parser.add_argument("--repeat", type=int, default=9, help="timed samples per case")
+    parser.add_argument("--min-sample", type=float, default=0.05, help="minimum seconds per sample")
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--output", help="write this run's results to a JSON file")
+    parser.add_argument("--baseline", default=BASELINE, help="baseline JSON to compare against")
+    parser.add_argument("--threshold", type=float, default=0.5,
+                        help="allowed slowdown before a case counts as a regression (0.5 = 50%%)")
+    parser.add_argument("--record", "--update-baseline", dest="record", action="store_true",
+                        help="save this run as the baseline for this machine")
+    parser.add_argument("--list", action="store_true", help="list the case names and exit")
+    parser.add_argument("--with-cache", action="store_true", help="keep the shape result cache enabled")
+    args = parser.parse_args(argv)
+
+    if args.list:
+        print("\n".join(CASES))
+        return 0
+
+    names = [name for name in CASES if args.filter in name]
+    if not names:
+        parser.error(f"No benchmark case matches {args.filter!r}")
+
+    shape_cache.configure(enabled=args.with_cache)
+    report = {"environment": environment(), "results": run(names, args.sizes, args.repeat, args.min_sample, args.seed)}
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"\nresults written to {args.output}")
+
+    if args.record:
+        stored = {"environment": report["environment"], "results": {}}
+        if os.path.exists(args.baseline):
+            with open(args.baseline) as f:
+                stored["results"] = json.load(f).get("results", {})
+        stored["results"].update(report["results"])   # a filtered run only replaces its own cases
+        with open(args.baseline, "w") as f:
+            json.dump(stored, f, indent=2, sort_keys=True)
+        print(f"\nbaseline updated: {args.baseline}")
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print(f"\nno baseline at {args.baseline}; run with --record to create one")
+        return 0
+    with open(args.baseline) as f:
+        stored = json.load(f)
+    warn_environment(stored.get("environment", {}), report["environment"])
+    baseline = stored.get("results", {})
+    regressions = compare(report["results"], baseline, args.threshold)
+    if regressions:
+        print(f"\n{len(regressions)} regression(s) beyond {args.threshold:.0%}: " + ", ".join(regressions))
+        return 1
+    print(f"\nno regressions beyond {args.threshold:.0%}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
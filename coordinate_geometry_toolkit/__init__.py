@@ -0,0 +1,44 @@
+# Package-level exports, loaded lazily (PEP 562)
+# `from coordinate_geometry_toolkit import Circle` imports circle.py (and what it
+# needs) on first use only, so importing the package itself costs next to nothing.
+import importlib
+
+# exported name -> module that defines it
+_EXPORTS = {
+    "Shape": "base",
+    "Point": "point",
+    "Line": "line",
+    "Circle": "circle",
+    "Triangle": "triangle",
+    "Rectangle": "rectangle",
+    "Square": "square",
+    "Polygon": "polygon",
+    "Vector": "vector",
+    "MutableVector": "vector",
+    "VectorArray": "vector_array",
+    "Ellipse": "ellipse",
+    "Hyperbola": "hyperbola",
+    "Parabola": "parabola",
+    "ParabolaArray": "parabola_array",
+    "GeneralConic": "conic",
+    "Transform": "transform",
+    "RTree": "rtree",
+    "Scene": "scene",
+    "PolygonStream": "streaming",
+    "ShapeCache": "cache",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f"{__name__}.{module}"), name)
+    globals()[name] = value   # later lookups skip __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
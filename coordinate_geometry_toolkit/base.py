@@ -1,5 +1,6 @@
-# base.py
 from abc import ABC, abstractmethod
+from coordinate_geometry_toolkit.point import Point
+from coordinate_geometry_toolkit.cache import shape_cache
 
 class Shape(ABC):
 
@@ -11,3 +12,61 @@ class Shape(ABC):
     @abstractmethod
     def perimeter(self):
         raise NotImplementedError("Subclasses must implement perimeter method")
+
+    # Shapes keep a version counter. Their setters bump it, and any Point setter
+    # bumps Point.generation, so _stamp() changes whenever a shape may have moved.
+    # Checking it is O(1) whatever the shape's size. Classes whose defining
+    # attributes are public add those to their _stamp(). Replacing items of a
+    # vertex list in place is not seen: call invalidate().
+    _version = 0
+
+    def invalidate(self):
+        """Drop cached results after changing the shape in a way its setters do not see"""
+        self._version += 1
+
+    def _stamp(self):
+        return (self._version, Point.generation)
+
+    # per-shape cached value stored under attr together with the _stamp() it was built at
+    def _stamped(self, attr, build):
+        stamp = self._stamp()
+        cached = getattr(self, attr, None)
+        if cached is None or cached[0] != stamp:
+            cached = (stamp, build())
+            setattr(self, attr, cached)
+        return cached[1]
+
+    # axis-aligned bounding box (xmin, ymin, xmax, ymax), cached (see _stamp)
+    def bounding_box(self):
+        return self._stamped("_bbox", self._compute_bounding_box)
+
+    def _compute_bounding_box(self):
+        raise NotImplementedError("Subclasses must implement _compute_bounding_box method")
+
+    def _invalidate_bounding_box(self):
+        self._version += 1
+
+    # O(1) quick reject used by the containment methods before their full test
+    def _outside_bounding_box(self, point):
+        xmin, ymin, xmax, ymax = self.bounding_box()
+        return point.x < xmin or point.x > xmax or point.y < ymin or point.y > ymax
+
+    # general-conic export cache for the conic classes (see conic.py)
+    # key holds the defining parameters, so a changed shape rebuilds its conic
+    def _cached_general_conic(self, key, build):
+        cached = getattr(self, "_conic_cache", None)
+        if cached is None or cached[0] != key:
+            cached = (key, build())
+            self._conic_cache = cached
+        return cached[1]
+
+    # memoized query results, shared by all equal shapes (see cache.py)
+    # subclasses using it define _cache_key(): the current values of their defining parameters
+    def _memoized(self, method, args, build, copy=None):
+        if not shape_cache.enabled:
+            return build()
+        key = (type(self), method, args, self._cache_key())
+        return shape_cache.get_or_compute(key, build, copy)
+
+    def _cache_key(self):
+        raise NotImplementedError("Subclasses must implement _cache_key method")
@@ -0,0 +1,138 @@
+import threading
+from collections import OrderedDict
+from coordinate_geometry_toolkit.point import Point
+
+# Result cache for repeated shape queries
+# Entries are keyed on the shape's class, the method and its arguments, and the
+# values of the shape's defining parameters (its _cache_key(), read afresh on
+# every call). A shape that changes - through a Point, Line or Circle setter, or a
+# plain attribute assignment - therefore produces a new key and can never be
+# served a stale result; equal shapes share entries. Old keys simply age out of
+# the bounded LRU. Only fixed-size shapes use it: a polygon's key would hold every
+# vertex, so Polygon caches on the instance instead (Shape._stamped).
+#
+# Mutable results (Points, lists of Points) are stored and returned as copies, so
+# callers may modify what they get back.
+#
+#   from coordinate_geometry_toolkit.cache import shape_cache
+#   shape_cache.configure(maxsize=4096)     # or maxsize=0 / enabled=False to turn it off
+#   shape_cache.stats()                     # {'hits': ..., 'misses': ..., 'evictions': ..., ...}
+
+DEFAULT_MAXSIZE = 1024
+_MISSING = object()
+
+
+class _Key:
+    # a key tuple with its hash computed once; the lookup, LRU reordering and
+    # insertion would otherwise each rehash it
+    __slots__ = ("parts", "hash")
+
+    def __init__(self, parts):
+        self.parts = parts
+        self.hash = hash(parts)
+
+    def __hash__(self):
+        return self.hash
+
+    def __eq__(self, other):
+        return self.hash == other.hash and self.parts == other.parts
+
+
+class ShapeCache:
+
+    def __init__(self, maxsize: int = DEFAULT_MAXSIZE, enabled: bool = True):
+        if maxsize < 0:
+            raise ValueError("maxsize must be >= 0")
+        self._entries = OrderedDict()    # key -> value, least recently used first
+        self._lock = threading.Lock()
+        self._maxsize = maxsize
+        self._enabled = enabled
+        self.reset_stats()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __str__(self):
+        return f"ShapeCache with {len(self._entries)}/{self._maxsize} entries"
+
+    @property
+    def maxsize(self):
+        return self._maxsize
+
+    @property
+    def enabled(self):
+        return self._enabled and self._maxsize > 0
+
+    def configure(self, maxsize=None, enabled=None):
+        """Change the capacity (evicting the oldest entries if it shrinks) and/or switch caching on or off"""
+        with self._lock:
+            if maxsize is not None:
+                if maxsize < 0:
+                    raise ValueError("maxsize must be >= 0")
+                self._maxsize = maxsize
+                self._evict()
+            if enabled is not None:
+                self._enabled = enabled
+                if not enabled:
+                    self._entries.clear()
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def reset_stats(self):
+        self._hits = self._misses = self._evictions = 0
+
+    def stats(self):
+        lookups = self._hits + self._misses
+        return {
+            "hits": self._hits,
+            "misses": self._misses,
+            "evictions": self._evictions,
+            "size": len(self._entries),
+            "maxsize": self._maxsize,
+            "hit_rate": self._hits / lookups if lookups else 0.0,
+        }
+
+    def get_or_compute(self, key, build, copy=None):
+        """
+        Cached value for key, calling build() on a miss
+        copy : applied to every value handed out, for results the caller may mutate
+        """
+        if not self.enabled:
+            return build()
+        try:
+            key = _Key(key)
+        except TypeError:         # unhashable argument: not cacheable
+            return build()
+        with self._lock:
+            value = self._entries.get(key, _MISSING)
+            if value is not _MISSING:
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return copy(value) if copy else value
+            self._misses += 1
+        value = build()       # outside the lock: builds may be slow or re-enter the cache
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            self._evict()
+        return copy(value) if copy else value
+
+    def _evict(self):
+        while len(self._entries) > self._maxsize:
+            self._entries.popitem(last=False)
+            self._evictions += 1
+
+
+# copy helpers for Point results
+def copy_point(value):
+    return Point(value.x, value.y) if isinstance(value, Point) else value
+
+
+def copy_points(points):
+    return [Point(p.x, p.y) for p in points]
+
+
+# the cache used by the shape classes
+shape_cache = ShapeCache()
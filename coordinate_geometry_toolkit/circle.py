@@ -3,6 +3,9 @@
 import math
 from coordinate_geometry_toolkit.point import Point  # added import for Point class
 from coordinate_geometry_toolkit.base import Shape    # added import for Shape class
+from coordinate_geometry_toolkit.cache import copy_points
+# numpy and conic.py are imported inside the methods that need them, so a plain
+# `import coordinate_geometry_toolkit.circle` does not load numpy
 
 class Circle(Shape):
 
@@ -18,6 +21,7 @@ class Circle(Shape):
     @radius.setter
     def radius(self, value):
         self._radius = value
+        self._invalidate_bounding_box()
     
     # Getter and Setter for center
     @property
@@ -27,10 +31,51 @@ class Circle(Shape):
     @center.setter
     def center(self, value):
         self._center = value
+        self._invalidate_bounding_box()
+
+    def _compute_bounding_box(self):
+        cx, cy, r = self._center.x, self._center.y, abs(self._radius)
+        return (cx - r, cy - r, cx + r, cy + r)
+
+    def _cache_key(self):
+        return (self._center.x, self._center.y, self._radius)
 
     def __str__(self):
         return f" Circle with center at {self._center} and radius {self._radius}"
 
+# general conic form, scaled by 1/r²: ((x-h)² + (y-k)²)/r² - 1 (negative inside)
+    def to_general_conic(self):
+        from coordinate_geometry_toolkit.conic import GeneralConic
+        h, k, r = self._center.x, self._center.y, self._radius
+        if r == 0:
+            raise ValueError("A circle of radius 0 has no general conic form")
+        return self._cached_general_conic((h, k, r), lambda: GeneralConic(
+            1 / r**2, 0.0, 1 / r**2, 0.0, 0.0, -1.0, origin=(h, k)))
+
+# intersections with many lines: (xs, ys, counts), see GeneralConic.intersect_lines
+    def intersect_lines(self, lines, segment=False):
+        return self.to_general_conic().intersect_lines(lines, segment)
+
+# tangents / outward normals at angles t (radians, as generate_points) or at points (xs, ys)
+    # returns (px, py, ux, uy) unit arrays, or Line objects with as_lines=True (see conic.py)
+    def tangents(self, t=None, points=None, as_lines=False, length=1.0):
+        from coordinate_geometry_toolkit.conic import curve_tangents
+        return curve_tangents(self, t, points, as_lines=as_lines, length=length)
+
+    def normals(self, t=None, points=None, as_lines=False, length=1.0):
+        from coordinate_geometry_toolkit.conic import curve_normals
+        return curve_normals(self, t, points, as_lines=as_lines, length=length)
+
+    def _curve_parameters(self, xs, ys):
+        import numpy as np
+        return np.arctan2(ys - self.center.y, xs - self.center.x), None
+
+    def _curve_derivative(self, t, branch):
+        import numpy as np
+        c, s = np.cos(t), np.sin(t)
+        r = self.radius
+        return self.center.x + r * c, self.center.y + r * s, -r * s, r * c
+
 # area of circle
     def area(self):
         return round(math.pi * self.radius**2, 2)
@@ -69,8 +114,11 @@ class Circle(Shape):
 
         return cls(center, half_radius)
 
-# generate points on circle
+# generate points on circle (memoized per n, see cache.py)
     def generate_points(self, n=100):
+        return self._memoized("generate_points", (n,), lambda: self._generate_points(n), copy_points)
+
+    def _generate_points(self, n):
         points = []
         for i in range(n):
             angle = 2 * math.pi * i / n
@@ -0,0 +1,34 @@
+import numpy as np
+
+# Point classification codes shared by the batch classify_points() methods
+# Every conic reduces to a residual that is negative inside, zero on the curve
+# and positive outside (its general conic value, see conic.py); these helpers
+# turn residual arrays into codes.
+#
+# - Ellipse   : inside is the region around the center (is_point_inside)
+# - Parabola  : inside is the focus side of the curve (is_point_inside)
+# - Hyperbola : inside is the focus side of each branch, so the region
+#               between the branches (is_between_branches) counts as OUTSIDE
+
+INSIDE = -1
+ON = 0
+OUTSIDE = 1
+
+
+def as_columns(xs, ys):
+    """Coordinate arrays as float ndarrays of the same shape"""
+    xs = np.asarray(xs, dtype=float)
+    ys = np.asarray(ys, dtype=float)
+    if xs.shape != ys.shape:
+        raise ValueError("xs and ys must have the same shape")
+    return xs, ys
+
+
+def codes_from_residual(residual, on):
+    """
+    INSIDE / ON / OUTSIDE codes (int8) from a residual array and an on-curve mask
+    ON wins over the sign of the residual
+    """
+    codes = np.where(residual < 0, INSIDE, OUTSIDE).astype(np.int8)
+    codes[on] = ON
+    return codes
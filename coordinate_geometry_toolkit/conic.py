@@ -0,0 +1,311 @@
+import math
+import numpy as np
+from coordinate_geometry_toolkit.classify import as_columns, codes_from_residual
+from coordinate_geometry_toolkit.line import Line
+
+# General conic  A x² + B xy + C y² + D x + E y + F = 0
+# Circle, Ellipse, Hyperbola and Parabola export themselves with to_general_conic(),
+# scaled and signed so that the value is negative inside, zero on the curve and
+# positive outside, and matches the residual each class already tests:
+# - Circle    : ((x-h)² + (y-k)²)/r² - 1
+# - Ellipse   : (x-h)²/rx² + (y-k)²/ry² - 1
+# - Hyperbola : 1 - [(x-h)²/a² - (y-k)²/b²]   (inside = focus side of a branch)
+# - Parabola  : (x-h)² - 4a(y-k)  (vertical), (y-k)² - 4a(x-h)  (horizontal)
+# One kernel then evaluates, classifies and differentiates any of them, and
+# transformed() gives rotated conics that the shape classes cannot represent.
+#
+# The coefficients are stored relative to a reference origin (the shapes use their
+# center or vertex) and points are translated before evaluating. Expanding about
+# the global origin instead cancels catastrophically far from (0, 0): at a center
+# of 1e7 the x², x and constant terms are ~1e14 and the residual of ~1 drowns.
+
+
+class GeneralConic:
+
+    def __init__(self, A, B, C, D, E, F, origin=(0.0, 0.0)):
+        """
+        A..F   : coefficients in coordinates relative to origin, i.e. the conic
+                 A u² + B uv + C v² + D u + E v + F = 0 with u = x - ox, v = y - oy
+        origin : (ox, oy) reference point, default the global origin
+        """
+        self._coef = np.array([A, B, C, D, E, F], dtype=float)
+        self._origin = np.array(origin, dtype=float).reshape(2)
+
+    @classmethod
+    def from_matrix(cls, q, origin=(0.0, 0.0)):
+        """From the symmetric 3x3 matrix [[A, B/2, D/2], [B/2, C, E/2], [D/2, E/2, F]] (relative to origin)"""
+        q = np.asarray(q, dtype=float)
+        return cls(q[0, 0], q[0, 1] + q[1, 0], q[1, 1], q[0, 2] + q[2, 0], q[1, 2] + q[2, 1], q[2, 2], origin)
+
+    @property
+    def origin(self):
+        return tuple(float(c) for c in self._origin)
+
+    @property
+    def coefficients(self):
+        """(A, B, C, D, E, F) about the global origin"""
+        return tuple(float(c) for c in _expanded(self._coef, self._origin))
+
+    def matrix(self):
+        """Symmetric 3x3 matrix about the global origin"""
+        return _matrix(_expanded(self._coef, self._origin))
+
+    def __str__(self):
+        return f"GeneralConic: {self.equation()}"
+
+    def __repr__(self):
+        return "GeneralConic({:.6g}, {:.6g}, {:.6g}, {:.6g}, {:.6g}, {:.6g}, origin=({:.6g}, {:.6g}))".format(
+            *self._coef, *self._origin)
+
+    def __eq__(self, other):
+        return isinstance(other, GeneralConic) and np.allclose(self.coefficients, other.coefficients)
+
+    def equation(self):
+        A, B, C, D, E, F = self.coefficients
+        return f"{A}x² + {B}xy + {C}y² + {D}x + {E}y + {F} = 0"
+
+    # discriminant B² - 4AC: < 0 ellipse, = 0 parabola, > 0 hyperbola
+    def discriminant(self):
+        A, B, C = self._coef[:3]
+        return float(B * B - 4 * A * C)
+
+    def kind(self, tol=1e-12):
+        """'circle', 'ellipse', 'parabola' or 'hyperbola' (from the quadratic part only)"""
+        A, B, C = self._coef[:3]
+        scale = max(abs(A), abs(B), abs(C))
+        if scale == 0:
+            raise ValueError("Conic has no quadratic terms (it is a line)")
+        disc = self.discriminant() / (scale * scale)
+        if abs(disc) <= tol:
+            return "parabola"
+        if disc > 0:
+            return "hyperbola"
+        if abs(B) <= tol * scale and math.isclose(A, C, rel_tol=tol):
+            return "circle"
+        return "ellipse"
+
+    # ---------- vectorized kernel ----------
+
+    def evaluate(self, xs, ys):
+        """A x² + B xy + C y² + D x + E y + F for coordinate arrays"""
+        us, vs = self._local(xs, ys)
+        A, B, C, D, E, F = self._coef
+        return (A * us + B * vs + D) * us + (C * vs + E) * vs + F
+
+    def _local(self, xs, ys):
+        xs, ys = as_columns(xs, ys)
+        return xs - self._origin[0], ys - self._origin[1]
+
+    def classify(self, xs, ys, tol=1e-6):
+        """INSIDE (-1) where the value is < -tol, ON (0) within tol, OUTSIDE (1) above tol"""
+        values = self.evaluate(xs, ys)
+        return codes_from_residual(values, np.abs(values) <= tol)
+
+    def gradient(self, xs, ys):
+        """(∂/∂x, ∂/∂y) = (2Ax + By + D, Bx + 2Cy + E), pointing from inside to outside"""
+        us, vs = self._local(xs, ys)
+        A, B, C, D, E, F = self._coef
+        return 2 * A * us + B * vs + D, B * us + 2 * C * vs + E
+
+    def normal(self, xs, ys):
+        """Unit outward normals (nx, ny); NaN where the gradient vanishes (e.g. a center)"""
+        gx, gy = self.gradient(xs, ys)
+        length = np.hypot(gx, gy)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            length = np.where(length > 0, length, np.nan)
+            return gx / length, gy / length
+
+    def intersect_lines(self, lines, segment=False, tol=1e-12):
+        """
+        Intersections with many lines at once by solving one quadratic per line
+        lines   : list of Line objects, or (x1, y1, x2, y2) coordinate arrays
+        segment : only keep hits between p1 and p2 (default: the infinite lines)
+        tol     : relative discriminant tolerance below which a line counts as tangent
+        Returns (xs, ys, counts): xs, ys have shape (n, 2) ordered along p1 -> p2 and
+        padded with NaN, counts holds 0, 1 or 2 per line
+        """
+        x1, y1, x2, y2 = line_columns(lines)
+        dx, dy = x2 - x1, y2 - y1
+        u1, v1 = x1 - self._origin[0], y1 - self._origin[1]
+        A, B, C, D, E, F = self._coef
+        # f(p1 + t d) = qa t² + qb t + qc, in coordinates relative to the origin
+        qa = A * dx * dx + B * dx * dy + C * dy * dy
+        qb = 2 * A * u1 * dx + B * (u1 * dy + v1 * dx) + 2 * C * v1 * dy + D * dx + E * dy
+        qc = (A * u1 + B * v1 + D) * u1 + (C * v1 + E) * v1 + F
+
+        disc = qb * qb - 4 * qa * qc
+        scale = qb * qb + np.abs(4 * qa * qc)
+        linear_scale = np.abs(qb) + np.abs(qc)
+        quadratic = np.abs(qa) > tol * np.maximum(linear_scale, 1e-300)
+        degenerate = (dx == 0) & (dy == 0)
+
+        t = np.full((len(x1), 2), np.nan)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            # numerically stable roots: q = -(b + sign(b)·√disc)/2, t = q/a and c/q
+            root = np.sqrt(np.maximum(disc, 0.0))
+            q = -0.5 * (qb + np.copysign(root, qb))
+            two = quadratic & (disc > tol * scale)
+            one = quadratic & ~two & (disc >= -tol * scale)
+            t[two, 0] = q[two] / qa[two]
+            t[two, 1] = qc[two] / q[two]
+            t[one, 0] = -qb[one] / (2 * qa[one])
+            # line parallel to an asymptote or to a parabola's axis: one crossing
+            linear = ~quadratic & (np.abs(qb) > 0)
+            t[linear, 0] = -qc[linear] / qb[linear]
+        t[degenerate] = np.nan
+        t.sort(axis=1)   # NaN sorts last
+        if segment:
+            t[(t < 0) | (t > 1)] = np.nan
+            t.sort(axis=1)
+
+        counts = np.count_nonzero(~np.isnan(t), axis=1)
+        xs = x1[:, None] + t * dx[:, None]
+        ys = y1[:, None] + t * dy[:, None]
+        return xs, ys, counts
+
+    # ---------- transforms ----------
+
+    def transformed(self, transform):
+        """
+        The image of this conic under an affine transform (a Transform or a 3x3 matrix)
+        Q' = M⁻ᵀ Q M⁻¹, so the value at a moved point equals the value at the original
+        point and inside/outside is preserved. The origin moves with the transform, so
+        relative to it only the linear part L applies: x' - o' = L (x - o)
+        """
+        m = np.asarray(getattr(transform, "matrix", transform), dtype=float)
+        if m.shape == (2, 3):
+            m = np.vstack([m, [0.0, 0.0, 1.0]])
+        if m.shape != (3, 3) or abs(np.linalg.det(m[:2, :2])) < 1e-12:
+            raise ValueError("Transform must be an invertible 3x3 (or 2x3) affine matrix")
+        linear = np.eye(3)
+        linear[:2, :2] = m[:2, :2]
+        inv = np.linalg.inv(linear)
+        origin = m[:2, :2] @ self._origin + m[:2, 2]
+        return GeneralConic.from_matrix(inv.T @ _matrix(self._coef) @ inv, origin)
+
+    def rotated(self, angle_degrees, about=None):
+        """Counter-clockwise rotation about the origin or about a Point"""
+        theta = math.radians(angle_degrees)
+        c, s = math.cos(theta), math.sin(theta)
+        px, py = (0.0, 0.0) if about is None else (about.x, about.y)
+        # rotate about p: x' = R (x - p) + p
+        m = np.array([[c, -s, px - c * px + s * py], [s, c, py - s * px - c * py], [0.0, 0.0, 1.0]])
+        return self.transformed(m)
+
+
+def _matrix(coef):
+    A, B, C, D, E, F = coef
+    return np.array([[A, B / 2, D / 2], [B / 2, C, E / 2], [D / 2, E / 2, F]])
+
+
+def _expanded(coef, origin):
+    # substitute u = x - h, v = y - k and collect the powers of x and y
+    A, B, C, D, E, F = coef
+    h, k = origin
+    return np.array([A, B, C,
+                     D - 2 * A * h - B * k,
+                     E - B * h - 2 * C * k,
+                     F + A * h * h + B * h * k + C * k * k - D * h - E * k])
+
+
+# ---------- mixed conic sets ----------
+
+def line_columns(lines):
+    """(x1, y1, x2, y2) float arrays from a list of Line objects or from four coordinate arrays"""
+    # a tuple of exactly four Line objects is still a list of lines, not four columns
+    if isinstance(lines, tuple) and len(lines) == 4 and not isinstance(lines[0], Line):
+        x1, y1, x2, y2 = (np.asarray(c, dtype=float).reshape(-1) for c in lines)
+        if not (x1.shape == y1.shape == x2.shape == y2.shape):
+            raise ValueError("Line coordinate arrays must have the same length")
+        return x1, y1, x2, y2
+    coords = np.array([(l.p1.x, l.p1.y, l.p2.x, l.p2.y) for l in lines], dtype=float).reshape(-1, 4)
+    return coords[:, 0], coords[:, 1], coords[:, 2], coords[:, 3]
+
+
+def _as_conics(conics):
+    return [c if isinstance(c, GeneralConic) else c.to_general_conic() for c in conics]
+
+
+def conic_coefficients(conics):
+    """(m, 6) coefficient array (about the global origin) from GeneralConic objects or shapes with to_general_conic()"""
+    rows = [c.coefficients for c in _as_conics(conics)]
+    return np.array(rows, dtype=float).reshape(-1, 6)
+
+
+def evaluate_many(conics, xs, ys):
+    """Values of every conic at every point, shape (len(conics), len(xs))"""
+    xs, ys = as_columns(xs, ys)
+    conics = _as_conics(conics)
+    coef = np.array([c._coef for c in conics], dtype=float).reshape(-1, 6)
+    origins = np.array([c._origin for c in conics], dtype=float).reshape(-1, 2)
+    A, B, C, D, E, F = (coef[:, i:i + 1] for i in range(6))
+    us = xs.reshape(1, -1) - origins[:, :1]
+    vs = ys.reshape(1, -1) - origins[:, 1:]
+    return (A * us + B * vs + D) * us + (C * vs + E) * vs + F
+
+
+def classify_many(conics, xs, ys, tol=1e-6):
+    """
+    INSIDE/ON/OUTSIDE codes of every point against every conic, shape (len(conics), len(xs))
+    Circles, ellipses, hyperbolas and parabolas can be mixed freely
+    tol : one tolerance, or one per conic
+    """
+    values = evaluate_many(conics, xs, ys)
+    tol = np.asarray(tol, dtype=float).reshape(-1, 1)
+    return codes_from_residual(values, np.abs(values) <= tol)
+
+
+# ---------- tangents and normals ----------
+# The shape classes supply _curve_parameters(xs, ys) -> (t, branch) and
+# _curve_derivative(t, branch) -> (px, py, dx, dy) for their own parameterization;
+# these functions turn that into unit tangents (direction of increasing t) and unit
+# outward normals (pointing the way the general-conic value increases, i.e. from
+# INSIDE to OUTSIDE).
+
+def curve_tangents(shape, t=None, points=None, branch=1, as_lines=False, length=1.0):
+    """
+    Unit tangents of a conic shape at curve parameters t, or at on-curve points
+    points   : (xs, ys) arrays; each point is mapped to its curve parameter first
+    as_lines : return Line objects from each contact point, `length` long, instead of arrays
+    Returns (px, py, tx, ty): contact points and unit tangent directions
+    """
+    px, py, tx, ty = _unit_tangents(shape, t, points, branch)
+    if as_lines:
+        return _lines(px, py, tx, ty, length)
+    return px, py, tx, ty
+
+
+def curve_normals(shape, t=None, points=None, branch=1, as_lines=False, length=1.0):
+    """
+    Unit outward normals of a conic shape, same arguments as curve_tangents
+    Returns (px, py, nx, ny)
+    """
+    px, py, tx, ty = _unit_tangents(shape, t, points, branch)
+    nx, ny = ty, -tx
+    gx, gy = shape.to_general_conic().gradient(px, py)
+    flip = nx * gx + ny * gy < 0
+    nx = np.where(flip, -nx, nx)
+    ny = np.where(flip, -ny, ny)
+    if as_lines:
+        return _lines(px, py, nx, ny, length)
+    return px, py, nx, ny
+
+
+def _unit_tangents(shape, t, points, branch):
+    if (t is None) == (points is None):
+        raise ValueError("Give exactly one of t or points")
+    if points is not None:
+        t, branch = shape._curve_parameters(*as_columns(*points))
+    else:
+        t = np.asarray(t, dtype=float)
+    px, py, dx, dy = shape._curve_derivative(t, branch)
+    speed = np.hypot(dx, dy)
+    return px, py, dx / speed, dy / speed
+
+
+def _lines(px, py, ux, uy, length):
+    from coordinate_geometry_toolkit.point import Point
+    from coordinate_geometry_toolkit.line import Line
+    ex, ey = px + length * ux, py + length * uy
+    return [Line(Point(float(a), float(b)), Point(float(c), float(d)))
+            for a, b, c, d in zip(px.ravel(), py.ravel(), ex.ravel(), ey.ravel())]
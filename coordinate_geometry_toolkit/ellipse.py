@@ -1,6 +1,10 @@
 import math
+from functools import lru_cache
 from coordinate_geometry_toolkit.point import Point   # added import for Point class
 from coordinate_geometry_toolkit.base import Shape    # added import for Shape class
+from coordinate_geometry_toolkit.cache import copy_points
+# numpy, conic.py and classify.py load on first use inside the vectorized methods
+# and sampling helpers below, keeping the import of this module cheap
 
 class Ellipse(Shape):
     
@@ -30,13 +34,37 @@ class Ellipse(Shape):
         # Eccentricity
         self.e = math.sqrt(1 - (self.b**2) / (self.a**2))
 
+    # the public defining attributes are part of the stamp, so assigning one is seen
+    def _stamp(self):
+        return (self._version, Point.generation, self.center, self.a, self.b, self.orientation)
+
+    def _cache_key(self):
+        return (self.center.x, self.center.y, self.a, self.b, self.orientation)
+
     def __str__(self):
             return f"Ellipse with center at {self.center}, semi-major axis {self.a}, semi-minor axis {self.b}, orientation {self.orientation}"
 
 
+    def _compute_bounding_box(self):
+        h, k = self.center.x, self.center.y
+        if self.orientation == "horizontal":
+            rx, ry = self.a, self.b
+        else:
+            rx, ry = self.b, self.a
+        return (h - rx, k - ry, h + rx, k + ry)
+
     def eccentricity(self):
         return self.e
 
+    def to_general_conic(self):
+        """
+        General conic form (x-h)²/rx² + (y-k)²/ry² - 1, negative inside (see conic.py)
+        Cached until center, a, b or orientation change
+        """
+        h, k = self.center.x, self.center.y
+        key = (h, k, self.a, self.b, self.orientation)
+        return self._cached_general_conic(key, lambda: _ellipse_conic(h, k, self.a, self.b, self.orientation))
+
     def equation(self):
         """
         Standard equation of the ellipse
@@ -87,11 +115,15 @@ class Ellipse(Shape):
     def area(self):
         return math.pi * self.a * self.b
 
-    def perimeter(self):
+    def perimeter(self, exact=False, rel_tol=1e-15):
         """
         Perimeter approximation using Ramanujan’s formula
         π [ 3(a+b) - sqrt((3a+b)(a+3b)) ]
+        exact=True uses the arithmetic–geometric mean series instead, accurate to
+        rel_tol even for very eccentric ellipses (see ellipse_perimeter_agm)
         """
+        if exact:
+            return ellipse_perimeter_agm(self.a, self.b, rel_tol)
         return math.pi * (3 * (self.a + self.b) -
                           math.sqrt((3 * self.a + self.b) * (self.a + 3 * self.b)))
 
@@ -113,6 +145,8 @@ class Ellipse(Shape):
         """
         Check if a point lies inside the ellipse
         """
+        if self._outside_bounding_box(point):
+            return False
         h, k = self.center.x, self.center.y  # changed get_x()/get_y() to x/y
         x, y = point.x, point.y              # changed get_x()/get_y() to x/y
 
@@ -123,6 +157,20 @@ class Ellipse(Shape):
 
         return lhs < 1.0
 
+    def classify_points(self, xs, ys, tol=1e-6):
+        """
+        Classify many points at once: INSIDE (-1), ON (0) or OUTSIDE (1), see classify.py
+        ON uses the same test as point_on_ellipse, INSIDE matches is_point_inside
+        """
+        return self.to_general_conic().classify(xs, ys, tol)
+
+    def intersect_lines(self, lines, segment=False):
+        """
+        Intersections with many lines (Line objects or (x1, y1, x2, y2) arrays) in closed form
+        Returns (xs, ys, counts), see GeneralConic.intersect_lines
+        """
+        return self.to_general_conic().intersect_lines(lines, segment)
+
     def distance_to_focus(self, point: Point):
         """
         Minimum distance from a point to either focus
@@ -132,12 +180,77 @@ class Ellipse(Shape):
         d2 = math.dist((point.x, point.y), (f2.x, f2.y))  # changed get_x()/get_y() to x/y
         return min(d1, d2)
 
+    def tangents(self, t=None, points=None, as_lines=False, length=1.0):
+        """
+        Unit tangents at parameters t (as generate_points) or at on-curve points (xs, ys)
+        Returns (px, py, tx, ty) arrays, or Line objects with as_lines=True (see conic.py)
+        """
+        from coordinate_geometry_toolkit.conic import curve_tangents
+        return curve_tangents(self, t, points, as_lines=as_lines, length=length)
+
+    def normals(self, t=None, points=None, as_lines=False, length=1.0):
+        """
+        Unit outward normals, same arguments as tangents(); returns (px, py, nx, ny)
+        """
+        from coordinate_geometry_toolkit.conic import curve_normals
+        return curve_normals(self, t, points, as_lines=as_lines, length=length)
+
+    def _radii(self):
+        # (x extent, y extent)
+        return (self.a, self.b) if self.orientation == "horizontal" else (self.b, self.a)
+
+    def _curve_parameters(self, xs, ys):
+        import numpy as np
+        rx, ry = self._radii()
+        return np.arctan2((ys - self.center.y) / ry, (xs - self.center.x) / rx), None
+
+    def _curve_derivative(self, t, branch):
+        import numpy as np
+        rx, ry = self._radii()
+        c, s = np.cos(t), np.sin(t)
+        return self.center.x + rx * c, self.center.y + ry * s, -rx * s, ry * c
+
+    def distance_to_points(self, xs, ys, max_iter=128):
+        """
+        Shortest distance from many points to the ellipse curve (Eberly's bisection method)
+        Each point is folded into the first quadrant of the ellipse frame and the foot of
+        the perpendicular is found by bisecting on the Lagrange multiplier; every point
+        runs at most max_iter bisection steps
+        Returns (distance, closest_x, closest_y, converged); converged is False where the
+        bracket had not collapsed to machine precision within max_iter steps
+        """
+        import numpy as np
+        from coordinate_geometry_toolkit.classify import as_columns
+        xs, ys = as_columns(xs, ys)
+        du = xs - self.center.x
+        dv = ys - self.center.y
+        if self.orientation == "vertical":
+            du, dv = dv, du
+        u, v, converged = _ellipse_closest(self.a, self.b, np.abs(du), np.abs(dv), max_iter)
+        u = np.copysign(u, du)
+        v = np.copysign(v, dv)
+        distance = np.hypot(u - du, v - dv)
+        if self.orientation == "vertical":
+            u, v = v, u
+        return distance, u + self.center.x, v + self.center.y, converged
+
+    def distance_to_curve(self, point: Point):
+        """
+        Shortest distance from a point to the ellipse curve (0 on the curve, > 0 inside and outside)
+        """
+        distance, _, _, _ = self.distance_to_points([point.x], [point.y])
+        return float(distance[0])
+
     def generate_points(self, n=200):
         """
         Generate n points along the ellipse using parametric equations
         Horizontal: x = h + a*cos(t), y = k + b*sin(t)
         Vertical  : x = h + b*cos(t), y = k + a*sin(t)
+        Memoized per n (see cache.py)
         """
+        return self._memoized("generate_points", (n,), lambda: self._generate_points(n), copy_points)
+
+    def _generate_points(self, n):
         h, k = self.center.x, self.center.y  # changed get_x()/get_y() to x/y
         points = []
         for i in range(n):
@@ -151,6 +264,35 @@ class Ellipse(Shape):
             points.append(Point(x, y))
         return points  # fixed from 'return point' to 'return points'  # changed
 
+    def sample_points(self, n=None, tolerance=None, spacing="curvature", closed=False):
+        """
+        Sample the ellipse as numpy arrays (xs, ys)
+        n         : number of points, or
+        tolerance : maximum distance between the curve and the polyline through the samples
+                    (the point count is chosen to meet it)
+        spacing   : 'curvature' puts more points where the ellipse bends sharply (the
+                    major-axis tips), 'arc_length' spaces them evenly along the curve
+        closed    : repeat the first point at the end (handy for plotting)
+        Sample positions are cached per (a, b, orientation, n/tolerance, spacing)
+        """
+        import numpy as np
+        if (n is None) == (tolerance is None):
+            raise ValueError("Give exactly one of n or tolerance")
+        if spacing not in ("curvature", "arc_length"):
+            raise ValueError("Spacing must be 'curvature' or 'arc_length'")
+        if n is not None and n < 3:
+            raise ValueError("n must be at least 3")
+        if tolerance is not None and tolerance <= 0:
+            raise ValueError("Tolerance must be positive")
+
+        ux, uy = _ellipse_samples(self.a, self.b, self.orientation, n, tolerance, spacing)
+        xs = ux + self.center.x
+        ys = uy + self.center.y
+        if closed:
+            xs = np.append(xs, xs[0])
+            ys = np.append(ys, ys[0])
+        return xs, ys
+
     def axis_of_symmetry(self):
         """
         Axis of symmetry
@@ -216,4 +358,181 @@ class Ellipse(Shape):
         Reflect the ellipse about the Y-axis
         """
         new_center = Point(-self.center.x, self.center.y)  # changed get_x()/get_y() to x/y
-        return Ellipse(new_center, self.a, self.b, self.orientation)
\ No newline at end of file
+        return Ellipse(new_center, self.a, self.b, self.orientation)
+
+
+# fine parameter grid used to build the sampling density
+_DENSITY_GRID = 4096
+
+
+@lru_cache(maxsize=256)
+def _ellipse_samples(a, b, orientation, n, tolerance, spacing):
+    """
+    Center-relative sample coordinates for Ellipse.sample_points (cached, read-only arrays)
+    Sagitta of a chord of length ds on a curve of curvature κ is about κ·ds²/8, so
+    the density sqrt(κ)·ds spreads the chord error evenly ('curvature'); 'arc_length'
+    uses ds alone and sizes the step for the sharpest point
+    """
+    import numpy as np
+    rx, ry = (a, b) if orientation == "horizontal" else (b, a)
+    t = np.linspace(0.0, 2 * math.pi, _DENSITY_GRID + 1)
+    speed = np.hypot(rx * np.sin(t), ry * np.cos(t))       # |dr/dt|
+    curvature = rx * ry / speed ** 3
+
+    if spacing == "curvature":
+        density = np.sqrt(curvature) * speed
+    else:
+        density = speed
+    cumulative = np.concatenate(([0.0], np.cumsum((density[1:] + density[:-1]) / 2 * np.diff(t))))
+    total = cumulative[-1]
+
+    if n is None:
+        if spacing == "curvature":
+            n = math.ceil(total / math.sqrt(8 * tolerance))
+        else:
+            n = math.ceil(total / math.sqrt(8 * tolerance / curvature.max()))
+        n = max(n, 8)
+
+    targets = np.arange(n) * (total / n)
+    ts = np.interp(targets, cumulative, t)
+    xs, ys = rx * np.cos(ts), ry * np.sin(ts)
+    xs.flags.writeable = False
+    ys.flags.writeable = False
+    return xs, ys
+
+
+# Exact perimeter via the arithmetic–geometric mean
+# a0 = a, b0 = b, c0² = a² - b²
+# a(n+1) = (an + bn)/2, b(n+1) = √(an·bn), c(n+1) = (an - bn)/2
+# Perimeter = 2π / AGM(a, b) · [ a² - Σ 2^(n-1) cn² ]
+# The iteration converges quadratically: double precision needs ~5 steps.
+# Stopping once a term is rel_tol of the bracket [ ... ] bounds the relative error;
+# comparing the term with rel_tol alone is an absolute test, too loose for thin ellipses.
+_AGM_MAX_ITER = 64
+
+
+@lru_cache(maxsize=4096)
+def _unit_perimeter(ratio, rel_tol):
+    # perimeter of the ellipse with a = 1, b = ratio; every other ellipse is a scaled copy
+    # b = 0 is the segment [-1, 1] traced twice; there AGM(1, 0) = 0 and the series never settles
+    if ratio == 0:
+        return 4.0
+    an, bn = 1.0, ratio
+    total = 0.5 * (1.0 - ratio * ratio)
+    power = 0.5
+    for _ in range(_AGM_MAX_ITER):
+        cn = (an - bn) / 2
+        an, bn = (an + bn) / 2, math.sqrt(an * bn)
+        power *= 2
+        term = power * cn * cn
+        total += term
+        if term <= rel_tol * (1.0 - total):
+            break
+    return 2 * math.pi / an * (1.0 - total)
+
+
+def ellipse_perimeter_agm(a, b, rel_tol=1e-15):
+    """
+    Perimeter of an ellipse with semi-axes a, b (either order) via the AGM
+    Memoized on the normalized ratio b/a, so equal-shaped ellipses share the work
+    A degenerate ellipse (b = 0) is a segment of length 2a, so its perimeter is 4a
+    rel_tol is relative to the perimeter
+    """
+    # b = 0 gives 4a; a = b gives the circle's 2πa
+    a, b = abs(a), abs(b)
+    if a < b:
+        a, b = b, a
+    if a == 0:
+        return 0.0
+    return a * _unit_perimeter(b / a, rel_tol)
+
+
+def ellipse_perimeters(a, b, rel_tol=1e-15):
+    """
+    Vectorized AGM perimeter over arrays of semi-axes (broadcast like numpy)
+    """
+    # same values as ellipse_perimeter_agm element-wise, e.g. b = 0 gives 4a
+    import numpy as np
+    a = np.abs(np.asarray(a, dtype=float))
+    b = np.abs(np.asarray(b, dtype=float))
+    a, b = np.maximum(a, b), np.minimum(a, b)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        ratio = np.where(a > 0, b / a, 1.0)
+    an, bn = np.ones_like(ratio), ratio.copy()
+    total = 0.5 * (1.0 - ratio * ratio)
+    power = 0.5
+    for _ in range(_AGM_MAX_ITER):
+        cn = (an - bn) / 2
+        an, bn = (an + bn) / 2, np.sqrt(an * bn)
+        power *= 2
+        term = power * cn * cn
+        total += term
+        if not np.any((term > rel_tol * (1.0 - total)) & (ratio > 0)):   # b = 0 never converges, handled below
+            break
+    with np.errstate(invalid="ignore", divide="ignore"):
+        unit = np.where(ratio == 0, 4.0, 2 * math.pi / an * (1.0 - total))
+    return a * unit
+
+
+def _ellipse_conic(h, k, a, b, orientation):
+    from coordinate_geometry_toolkit.conic import GeneralConic
+    rx, ry = (a, b) if orientation == "horizontal" else (b, a)
+    A, C = 1 / rx**2, 1 / ry**2
+    return GeneralConic(A, 0.0, C, 0.0, 0.0, -1.0, origin=(h, k))
+
+
+# Closest point on the ellipse (u/e0)² + (v/e1)² = 1, e0 >= e1, for query points
+# (y0, y1) in the first quadrant (D. Eberly, "Distance from a Point to an Ellipse").
+# The foot is x0 = r0·y0/(s + r0), x1 = y1/(s + 1) with r0 = (e0/e1)², where s is the
+# root of G(s) = (r0·z0/(s + r0))² + (z1/(s + 1))² - 1, z = y/e; G is monotone on
+# [z1 - 1, |(r0·z0, z1)| - 1], so bisection always converges.
+def _ellipse_closest(e0, e1, y0, y1, max_iter):
+    import numpy as np
+    x0 = np.empty_like(y0)
+    x1 = np.empty_like(y1)
+    converged = np.ones(y0.shape, dtype=bool)
+
+    z0, z1 = y0 / e0, y1 / e1
+    g = z0 * z0 + z1 * z1 - 1
+    r0 = (e0 / e1) ** 2
+
+    # points off both axes and off the curve: bisect
+    general = (y0 > 0) & (y1 > 0) & (g != 0)
+    n0 = r0 * z0[general]
+    w1 = z1[general]
+    s0 = w1 - 1
+    s1 = np.where(g[general] < 0, 0.0, np.hypot(n0, w1) - 1)
+    s = s0.copy()
+    active = np.ones(s.shape, dtype=bool)
+    for _ in range(max_iter):
+        if not active.any():
+            break
+        mid = (s0 + s1) / 2
+        collapsed = (mid == s0) | (mid == s1)
+        value = (n0 / (mid + r0)) ** 2 + (w1 / (mid + 1)) ** 2 - 1
+        step = active & ~collapsed
+        s0 = np.where(step & (value > 0), mid, s0)
+        s1 = np.where(step & (value < 0), mid, s1)
+        s = np.where(active, mid, s)
+        active &= ~collapsed & (value != 0)
+    converged[general] = ~active
+    x0[general] = r0 * y0[general] / (s + r0)
+    x1[general] = y1[general] / (s + 1)
+
+    # already on the curve
+    on = (y0 > 0) & (y1 > 0) & (g == 0)
+    x0[on], x1[on] = y0[on], y1[on]
+
+    # on the minor axis: nearest point is the co-vertex
+    minor = (y0 == 0) & (y1 > 0)
+    x0[minor], x1[minor] = 0.0, e1
+
+    # on the major axis: inside the evolute the foot leaves the axis, else the vertex
+    major = y1 == 0
+    numer = e0 * y0[major]
+    denom = e0 * e0 - e1 * e1
+    with np.errstate(invalid="ignore", divide="ignore"):
+        xde = np.where(numer < denom, numer / denom, 1.0)
+    x0[major] = e0 * xde
+    x1[major] = e1 * np.sqrt(np.maximum(1 - xde * xde, 0.0))
+    return x0, x1, converged
@@ -1,6 +1,9 @@
 import math
 from coordinate_geometry_toolkit.point import Point   # added import for Point class
 from coordinate_geometry_toolkit.base import Shape    # added import for Shape class
+from coordinate_geometry_toolkit.cache import copy_points
+# numpy and conic.py are imported where they are used (conic export, tangents,
+# sample_branches), not at module level
 
 class Hyperbola(Shape):
    
@@ -19,10 +22,37 @@ class Hyperbola(Shape):
         # Eccentricity
         self.e = math.sqrt(1 + (self.b**2) / (self.a**2))
 
+    # the public defining attributes are part of the stamp, so assigning one is seen
+    def _stamp(self):
+        return (self._version, Point.generation, self.center, self.a, self.b, self.orientation)
+
+    def _cache_key(self):
+        return (self.center.x, self.center.y, self.a, self.b, self.orientation)
+
 # String representation of Hyperbola
     def __str__(self):
         return f"Hyperbola with center at {self.center}, semi-major axis {self.a}, semi-minor axis {self.b}, orientation {self.orientation}"
     
+# bounding box of both branches inside a window (the curve itself is unbounded)
+    # span: distance from the center along the transverse axis, default 5a
+    def bounding_box(self, span=None):
+        if span is None:
+            return super().bounding_box()
+        return self._window_bounding_box(span)
+
+    def _compute_bounding_box(self):
+        return self._window_bounding_box(5 * self.a)
+
+    def _window_bounding_box(self, span):
+        h, k = self.center.x, self.center.y
+        span = max(span, self.a)
+        # conjugate-direction half width where the branches leave the window
+        width = self.b * math.sqrt((span / self.a) ** 2 - 1)
+        if self.orientation == "horizontal":
+            return (h - span, k - width, h + span, k + width)
+        else:
+            return (h - width, k - span, h + width, k + span)
+
 # equation of hyperbola
     def equation(self):
        h, k = self.center.x, self.center.y  # changed get_x()/get_y() to x/y
@@ -103,6 +133,66 @@ class Hyperbola(Shape):
 
         return lhs < 1
 
+# classify many points at once: INSIDE (-1), ON (0) or OUTSIDE (1), see classify.py
+    # ON uses the same test as point_on_hyperbola; INSIDE is the focus side of a branch,
+    # so every point with is_between_branches() True (and not ON) is OUTSIDE
+    def classify_points(self, xs, ys, tol=1e-6):
+        return self.to_general_conic().classify(xs, ys, tol)
+
+# intersections with many lines in closed form: (xs, ys, counts), see GeneralConic.intersect_lines
+    # a line parallel to an asymptote crosses one branch once
+    def intersect_lines(self, lines, segment=False):
+        return self.to_general_conic().intersect_lines(lines, segment)
+
+# general conic form 1 - [(x-h)²/a² - (y-k)²/b²] (horizontal), negative on the focus side
+    # cached until center, a, b or orientation change (see conic.py)
+    def to_general_conic(self):
+        h, k = self.center.x, self.center.y
+        key = (h, k, self.a, self.b, self.orientation)
+        return self._cached_general_conic(key, self._build_general_conic)
+
+    def _build_general_conic(self):
+        from coordinate_geometry_toolkit.conic import GeneralConic
+        h, k = self.center.x, self.center.y
+        ta, tb = -1 / self.a**2, 1 / self.b**2   # coefficients of the transverse / conjugate squares
+        if self.orientation == "horizontal":
+            A, C = ta, tb
+        else:
+            A, C = tb, ta
+        return GeneralConic(A, 0.0, C, 0.0, 0.0, 1.0, origin=(h, k))
+
+# tangents / outward normals at parameters t or at on-curve points (xs, ys)
+    # t follows sample_branches: transverse offset branch*a*cosh(t), conjugate offset b*sinh(t)
+    # branch: 1 for the branch through vertices()[0], -1 for the other (scalar or array);
+    # with points the branch is taken from the side of the center each point is on
+    # normals point away from the focus, into the region between the branches
+    # returns (px, py, ux, uy) unit arrays, or Line objects with as_lines=True (see conic.py)
+    def tangents(self, t=None, points=None, branch=1, as_lines=False, length=1.0):
+        from coordinate_geometry_toolkit.conic import curve_tangents
+        return curve_tangents(self, t, points, branch, as_lines=as_lines, length=length)
+
+    def normals(self, t=None, points=None, branch=1, as_lines=False, length=1.0):
+        from coordinate_geometry_toolkit.conic import curve_normals
+        return curve_normals(self, t, points, branch, as_lines=as_lines, length=length)
+
+    def _curve_parameters(self, xs, ys):
+        import numpy as np
+        du, dv = xs - self.center.x, ys - self.center.y
+        if self.orientation == "vertical":
+            du, dv = dv, du
+        return np.arcsinh(dv / self.b), np.where(du < 0, -1.0, 1.0)
+
+    def _curve_derivative(self, t, branch):
+        import numpy as np
+        branch = np.asarray(branch, dtype=float)
+        c, s = np.cosh(t), np.sinh(t)
+        u, v = branch * self.a * c, self.b * s
+        du, dv = branch * self.a * s, self.b * c
+        h, k = self.center.x, self.center.y
+        if self.orientation == "horizontal":
+            return h + u, k + v, du, dv
+        return h + v, k + u, dv, du
+
 # distance to foci
     # returns the distance to the nearest focus
     def distance_to_focus(self, point: Point):
@@ -111,8 +201,11 @@ class Hyperbola(Shape):
         d2 = math.dist((point.x, point.y), (f2.x, f2.y))  # changed get_x()/get_y() to x/y
         return min(d1, d2)
 
-# generate points on hyperbola
+# generate points on hyperbola (memoized per n and t_max, see cache.py)
     def generate_points(self, n=200, t_max=2.0):
+        return self._memoized("generate_points", (n, t_max), lambda: self._generate_points(n, t_max), copy_points)
+
+    def _generate_points(self, n, t_max):
         h, k = self.center.x, self.center.y  # changed get_x()/get_y() to x/y
         points = []
 
@@ -134,6 +227,79 @@ class Hyperbola(Shape):
             points.append(Point(x, y))
         return points  # corrected 'point' → 'points'  # changed return variable
 
+# sample both branches as numpy arrays with the hyperbolic parameterization
+    # transverse offset u = a*cosh(t), conjugate offset v = b*sinh(t): no secant blow-up
+    # viewport : (xmin, ymin, xmax, ymax) window the samples are clipped to
+    # span     : distance from the center along the transverse axis, default 5a
+    #            (the same window as bounding_box()) when no viewport is given
+    # Returns ((xs, ys), (xs, ys)) for the branch through vertices()[0] and the other one.
+    # The t range of each branch is cut to the window, so all n points are spent on the
+    # visible part. Where the near edge of the viewport splits a branch in two, the n
+    # points are shared between the pieces by parameter length and a single NaN sits
+    # between them (matplotlib breaks the line there), so that branch has n + 1 entries.
+    # A branch that misses the viewport comes back as empty arrays.
+    def sample_branches(self, n=200, viewport=None, span=None):
+        import numpy as np
+        if n < 2:
+            raise ValueError("n must be at least 2")
+        if viewport is None and span is None:
+            span = 5 * self.a
+        h, k = self.center.x, self.center.y
+        horizontal = self.orientation == "horizontal"
+        if viewport is None:
+            window = (-math.inf, -math.inf, math.inf, math.inf)
+        else:
+            xmin, ymin, xmax, ymax = viewport
+            if xmin > xmax or ymin > ymax:
+                raise ValueError("Viewport must be (xmin, ymin, xmax, ymax)")
+            window = (xmin - h, ymin - k, xmax - h, ymax - k)
+        # window in (transverse, conjugate) offsets from the center
+        if horizontal:
+            u_lo, v_lo, u_hi, v_hi = window
+        else:
+            v_lo, u_lo, v_hi, u_hi = window
+
+        branches = []
+        for sign in (1, -1):
+            # this branch has u = sign * a*cosh(t), so mirror the transverse range
+            lo, hi = (u_lo, u_hi) if sign == 1 else (-u_hi, -u_lo)
+            if span is not None:
+                hi = min(hi, span)
+            if hi < self.a or lo > hi:
+                branches.append((np.empty(0), np.empty(0)))
+                continue
+            t_max = math.acosh(hi / self.a)
+            t0 = max(-t_max, math.asinh(v_lo / self.b) if v_lo > -math.inf else -t_max)
+            t1 = min(t_max, math.asinh(v_hi / self.b) if v_hi < math.inf else t_max)
+            if t0 > t1:
+                branches.append((np.empty(0), np.empty(0)))
+                continue
+            pieces = [(t0, t1)]
+            if lo > self.a:
+                # u >= lo leaves |t| >= t_gap: up to two pieces either side of the vertex
+                t_gap = math.acosh(lo / self.a)
+                pieces = [(p0, p1) for p0, p1 in ((t0, min(t1, -t_gap)), (max(t0, t_gap), t1)) if p0 <= p1]
+                if not pieces:
+                    branches.append((np.empty(0), np.empty(0)))
+                    continue
+                if len(pieces) == 2 and min(p1 - p0 for p0, p1 in pieces) == 0:
+                    pieces = [max(pieces, key=lambda piece: piece[1] - piece[0])]
+            if len(pieces) == 1:
+                t = np.linspace(pieces[0][0], pieces[0][1], n)
+            else:
+                # n split by parameter length, one NaN between the pieces
+                (a0, a1), (b0, b1) = pieces
+                n_first = min(max(round(n * (a1 - a0) / (a1 - a0 + b1 - b0)), 1), n - 1)
+                t = np.concatenate([np.linspace(a0, a1, n_first), [np.nan], np.linspace(b0, b1, n - n_first)])
+            u = self.a * np.cosh(t)
+            v = self.b * np.sinh(t)
+            u *= sign
+            if horizontal:
+                branches.append((h + u, k + v))
+            else:
+                branches.append((h + v, k + u))
+        return branches[0], branches[1]
+
 # check if point is on hyperbola
     def is_point_on_hyperbola(self, point: Point):
         h, k = self.center.x, self.center.y  # changed get_x()/get_y() to x/y
@@ -35,6 +35,7 @@ class Line(Shape):
     def p1(self, value):
         self._p1 = value
         self._update_properties()
+        self._invalidate_bounding_box()
         
     @property
     def p2(self):
@@ -44,6 +45,7 @@ class Line(Shape):
     def p2(self, value):
         self._p2 = value
         self._update_properties()
+        self._invalidate_bounding_box()
         
     @property
     def dx(self):
@@ -81,6 +83,10 @@ class Line(Shape):
         return self.length()
 
 
+    def _compute_bounding_box(self):
+        return (min(self._p1.x, self._p2.x), min(self._p1.y, self._p2.y),
+                max(self._p1.x, self._p2.x), max(self._p1.y, self._p2.y))
+
     # how line object look
     def __str__(self):
         return f"Line from {self.p1} to {self.p2}"
@@ -348,6 +348,7 @@ def test_parabola():
         vertex = Point(0, 0)
         focus = Point(0, 2)   # Focus 2 units above vertex for upward-opening parabola
         parabola = Parabola(vertex, focus)
+        print(parabola.describe())
         print("Parabola:", parabola)
         print("Vertex:", parabola.vertex)
         print("Focus:", parabola.focus)
@@ -1,12 +1,11 @@
 import math
 from coordinate_geometry_toolkit.point import Point   # added import for Point class
 from coordinate_geometry_toolkit.base import Shape    # added import for Shape class
+from coordinate_geometry_toolkit.cache import copy_points
+# numpy, conic.py and classify.py are imported inside the array methods below
 
-class Parabola(Shape):
-    def __init__(self, vertex: Point, focus: Point):
-        self.vertex = vertex
-        self.focus = focus
-        print("""
+# Educational summary shown by Parabola.describe() (and printed when verbose=True)
+BASIC_KNOWLEDGE = """
         Basic knowledge about the Parabola :
 
         1. x,y →  Coordinates of any point P(x, y) lying on the parabola.
@@ -20,7 +19,17 @@ class Parabola(Shape):
                     a> 0 → opens upward
                     a<0 → opens downward
 
-        """)
+        """
+
+
+class Parabola(Shape):
+    def __init__(self, vertex: Point, focus: Point, verbose: bool = False):
+        """
+        vertex, focus : Point objects; the focus must line up with the vertex
+        verbose       : print the describe() text (construction is silent by default)
+        """
+        self.vertex = vertex
+        self.focus = focus
 
         h, k = self.vertex.x, self.vertex.y  # changed get_x()/get_y() to x/y
         xf, yf = focus.x, focus.y            # changed get_x()/get_y() to x/y
@@ -44,17 +53,50 @@ class Parabola(Shape):
         if math.isclose(self.a, 0.0, abs_tol=1e-9):
             self.a = 0.1  # Set minimum focal length for valid parabola
 
-        # find the orientation of parabola about the axis
+        if verbose:
+            print(self.describe())
+
+    # find the orientation of parabola about the axis
+    def opening(self):
         if self.orientation == "vertical":
             if self.a > 0:
-                print("Focus is ABOVE the vertex and Parabola opens UPWARD")
+                return "Focus is ABOVE the vertex and Parabola opens UPWARD"
             else:
-                print("Focus is BELOW the vertex and Parabola opens DOWNWARD")
+                return "Focus is BELOW the vertex and Parabola opens DOWNWARD"
         else: # horizontal
             if self.a > 0:
-                print("Focus is RIGHT of the vertex and Parabola opens RIGHT")
+                return "Focus is RIGHT of the vertex and Parabola opens RIGHT"
             else:
-                print("Focus is LEFT of the vertex and Parabola opens LEFT")
+                return "Focus is LEFT of the vertex and Parabola opens LEFT"
+
+    # educational summary of parabola terms plus which way this one opens
+    def describe(self):
+        return BASIC_KNOWLEDGE + "\n" + self.opening()
+
+    # bounding box of the window generate_points draws (the curve itself is unbounded)
+    # span: distance from vertex in both directions, perpendicular to the axis
+    def bounding_box(self, span=None):
+        if span is None:
+            return super().bounding_box()
+        return self._window_bounding_box(span)
+
+    def _compute_bounding_box(self):
+        return self._window_bounding_box(max(5.0, abs(self.a) * 5))
+
+    # the public defining attributes are part of the stamp, so assigning one is seen
+    def _stamp(self):
+        return (self._version, Point.generation, self.vertex, self.a, self.orientation)
+
+    def _cache_key(self):
+        return (self.vertex.x, self.vertex.y, self.a, self.orientation)
+
+    def _window_bounding_box(self, span):
+        h, k = self.vertex.x, self.vertex.y
+        reach = span ** 2 / (4 * self.a)   # how far the curve gets along the axis at the window edge
+        if self.orientation == "vertical":
+            return (h - span, min(k, k + reach), h + span, max(k, k + reach))
+        else:
+            return (min(h, h + reach), k - span, max(h, h + reach), k + span)
 
 # find the eq. of the parabola
     def equation(self):
@@ -132,6 +174,100 @@ class Parabola(Shape):
         else:
             return abs(x - (h - self.a))
 
+    # shortest distance from many points to the curve, in closed form
+    # with X, Y measured from the vertex (X across the axis, Y along it) the foot of the
+    # perpendicular is (t, t²/4a) where t solves the depressed cubic
+    #     t³ + p t + q = 0,   p = 8a² - 4aY,   q = -8a²X
+    # solved by Cardano (one real root) or the trigonometric form (three real roots,
+    # the nearest is kept), then polished with up to newton_steps Newton steps
+    # returns (distance, closest_x, closest_y, converged); converged reports whether the
+    # polished root satisfies the cubic to rounding precision
+    def distance_to_points(self, xs, ys, newton_steps=2):
+        import numpy as np
+        from coordinate_geometry_toolkit.classify import as_columns
+        xs, ys = as_columns(xs, ys)
+        h, k = self.vertex.x, self.vertex.y
+        if self.orientation == "vertical":
+            X, Y = xs - h, ys - k
+        else:
+            X, Y = ys - k, xs - h
+        t, converged = _parabola_foot(self.a, X, Y, newton_steps)
+        across, along = t, t * t / (4 * self.a)
+        distance = np.hypot(across - X, along - Y)
+        if self.orientation == "vertical":
+            return distance, h + across, k + along, converged
+        return distance, h + along, k + across, converged
+
+    # shortest distance from a point to the curve (distance_to_focus measures to the focus only)
+    def distance_to_curve(self, point: Point):
+        distance, _, _, _ = self.distance_to_points([point.x], [point.y])
+        return float(distance[0])
+
+    # tangents / outward normals (away from the focus side) at parameters t or points (xs, ys)
+    # t is the offset across the axis, as generate_points: (h + t, k + t²/4a) when vertical
+    # returns (px, py, ux, uy) unit arrays, or Line objects with as_lines=True (see conic.py)
+    def tangents(self, t=None, points=None, as_lines=False, length=1.0):
+        from coordinate_geometry_toolkit.conic import curve_tangents
+        return curve_tangents(self, t, points, as_lines=as_lines, length=length)
+
+    def normals(self, t=None, points=None, as_lines=False, length=1.0):
+        from coordinate_geometry_toolkit.conic import curve_normals
+        return curve_normals(self, t, points, as_lines=as_lines, length=length)
+
+    def _curve_parameters(self, xs, ys):
+        if self.orientation == "vertical":
+            return xs - self.vertex.x, None
+        return ys - self.vertex.y, None
+
+    def _curve_derivative(self, t, branch):
+        import numpy as np
+        h, k = self.vertex.x, self.vertex.y
+        along, slope = t * t / (4 * self.a), t / (2 * self.a)
+        ones = np.ones_like(t)
+        if self.orientation == "vertical":
+            return h + t, k + along, ones, slope
+        return h + along, k + t, slope, ones
+
+    # arc length between curve parameters t0 and t1 (arrays broadcast), same t as tangents()
+    # S(t) = (t/2)·√(1 + t²/4a²) + |a|·asinh(t/2|a|) is the length from the vertex, so
+    # arc_length = S(t1) - S(t0) in O(1) per interval (negative when t1 < t0)
+    def arc_length(self, t0, t1):
+        import numpy as np
+        return _parabola_arc(self.a, np.asarray(t1, dtype=float)) - _parabola_arc(self.a, np.asarray(t0, dtype=float))
+
+    # inverse of arc_length: parameters t with arc_length(t0, t) = s (s may be negative)
+    # Newton on the monotone S(t), started above the root so it cannot overshoot
+    # returns (t, converged)
+    def parameter_at_arc_length(self, s, t0=0.0, max_iter=50, tol=1e-12):
+        import numpy as np
+        target = np.asarray(s, dtype=float) + _parabola_arc(self.a, np.asarray(t0, dtype=float))
+        size = np.abs(target)
+        # S(t) >= max(|t|, t²/4|a|), so this start is never closer to 0 than the root
+        t = np.copysign(np.minimum(size, np.sqrt(4 * abs(self.a) * size)), target)
+        converged = np.zeros(t.shape, dtype=bool)
+        for _ in range(max_iter):
+            error = _parabola_arc(self.a, t) - target
+            converged = np.abs(error) <= tol * np.maximum(size, 1.0)
+            if converged.all():
+                break
+            t = t - error / np.sqrt(1 + (t / (2 * self.a)) ** 2)
+        return t, converged
+
+    # n points spaced evenly by arc length between parameters t0 and t1
+    # (default: the generate_points window, t from -span to span); returns (xs, ys)
+    def resample_uniform(self, n=100, t0=None, t1=None):
+        import numpy as np
+        if n < 2:
+            raise ValueError("n must be at least 2")
+        if t0 is None or t1 is None:
+            span = max(5.0, abs(self.a) * 5)
+            t0 = -span if t0 is None else t0
+            t1 = span if t1 is None else t1
+        total = self.arc_length(t0, t1)
+        t, _ = self.parameter_at_arc_length(np.linspace(0.0, total, n), t0)
+        xs, ys, _, _ = self._curve_derivative(t, None)
+        return xs, ys
+
     # check point inside the parabola
     def is_point_inside(self, point: Point):
         h, k = self.vertex.x, self.vertex.y  # changed get_x()/get_y() to x/y
@@ -144,8 +280,39 @@ class Parabola(Shape):
             boundary_x = A * (y - k)**2 + h
             return x > boundary_x if self.a > 0 else x < boundary_x
 
-    # generate points
+    # classify many points at once: INSIDE (-1), ON (0) or OUTSIDE (1), see classify.py
+    # residual (x-h)² - 4a(y-k) is negative exactly where is_point_inside() is True,
+    # ON uses the same tolerance as point_on_parabola
+    def classify_points(self, xs, ys, tol=1e-9):
+        import numpy as np
+        from coordinate_geometry_toolkit.classify import codes_from_residual
+        residual = self.to_general_conic().evaluate(xs, ys)
+        return codes_from_residual(residual, np.abs(residual) < tol)
+
+    # intersections with many lines in closed form: (xs, ys, counts), see GeneralConic.intersect_lines
+    # a line parallel to the axis crosses the parabola once
+    def intersect_lines(self, lines, segment=False):
+        return self.to_general_conic().intersect_lines(lines, segment)
+
+    # general conic form (x-h)² - 4a(y-k) (vertical) or (y-k)² - 4a(x-h) (horizontal)
+    # cached until vertex, a or orientation change (see conic.py)
+    def to_general_conic(self):
+        h, k = self.vertex.x, self.vertex.y
+        key = (h, k, self.a, self.orientation)
+        return self._cached_general_conic(key, self._build_general_conic)
+
+    def _build_general_conic(self):
+        from coordinate_geometry_toolkit.conic import GeneralConic
+        h, k, a = self.vertex.x, self.vertex.y, self.a
+        if self.orientation == "vertical":
+            return GeneralConic(1.0, 0.0, 0.0, 0.0, -4 * a, 0.0, origin=(h, k))
+        return GeneralConic(0.0, 0.0, 1.0, -4 * a, 0.0, 0.0, origin=(h, k))
+
+    # generate points (memoized per n and span, see cache.py)
     def generate_points(self, n=100, span=None):
+        return self._memoized("generate_points", (n, span), lambda: self._generate_points(n, span), copy_points)
+
+    def _generate_points(self, n, span):
         h, k = self.vertex.x, self.vertex.y  # changed get_x()/get_y() to x/y
         points = []
 # span: distance from vertex in both directions (x-range if vertical, y-range if horizontal).
@@ -193,4 +360,51 @@ class Parabola(Shape):
         # Parabola has infinite perimeter, but we can return a symbolic representation
         return float('inf')
 
-    
\ No newline at end of file
+
+# Arc length of (t, t²/4a) from the vertex to parameter t (odd in t)
+def _parabola_arc(a, t):
+    import numpy as np
+    a = abs(a)
+    return t / 2 * np.sqrt(1 + (t / (2 * a)) ** 2) + a * np.arcsinh(t / (2 * a))
+
+
+# Foot parameter t of the perpendicular from (X, Y) to the curve (t, t²/4a), see
+# Parabola.distance_to_points. Fully vectorized; returns (t, converged).
+def _parabola_foot(a, X, Y, newton_steps):
+    import numpy as np
+    p = 8 * a * a - 4 * a * Y
+    q = -8 * a * a * X
+    half_q = q / 2
+    third_p = p / 3
+    disc = half_q * half_q + third_p ** 3
+    t = np.empty_like(X)
+
+    # one real root (Cardano); u is taken on the side without cancellation
+    one = disc > 0
+    w = -half_q[one] - np.copysign(np.sqrt(disc[one]), half_q[one])
+    u = np.cbrt(w)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        t[one] = np.where(u != 0, u - third_p[one] / u, 0.0)
+
+    # three real roots (trigonometric form): keep the one nearest to (X, Y)
+    three = ~one
+    if three.any():
+        r = np.sqrt(np.maximum(-third_p[three], 0.0))
+        with np.errstate(invalid="ignore", divide="ignore"):
+            cos_arg = np.where(r > 0, -half_q[three] / np.where(r > 0, r, 1.0) ** 3, 0.0)
+        phi = np.arccos(np.clip(cos_arg, -1.0, 1.0)) / 3
+        roots = 2 * r[:, None] * np.cos(phi[:, None] - 2 * np.pi * np.arange(3) / 3)
+        Xt, Yt = X[three][:, None], Y[three][:, None]
+        dist_sq = (roots - Xt) ** 2 + (roots * roots / (4 * a) - Yt) ** 2
+        t[three] = roots[np.arange(roots.shape[0]), np.argmin(dist_sq, axis=1)]
+
+    for _ in range(newton_steps):
+        slope = 3 * t * t + p
+        with np.errstate(invalid="ignore", divide="ignore"):
+            step = np.where(slope != 0, (t * t * t + p * t + q) / slope, 0.0)
+        t = t - step
+
+    residual = np.abs(t * t * t + p * t + q)
+    scale = np.abs(t) ** 3 + np.abs(p * t) + np.abs(q)
+    converged = residual <= 1e-12 * np.maximum(scale, 1e-300)
+    return t, converged
@@ -0,0 +1,104 @@
+import numpy as np
+from coordinate_geometry_toolkit.point import Point
+from coordinate_geometry_toolkit.parabola import Parabola
+
+# Columnar parabolas
+# ParabolaArray holds many axis-aligned parabolas as vertex/focus coordinate
+# arrays and computes the Parabola properties for all of them at once.
+# The rules match Parabola.__init__: the focus must line up with the vertex
+# (same x -> vertical axis, same y -> horizontal axis, within 1e-9) and a zero
+# focal length is replaced by 0.1.
+
+_ALIGN_TOL = 1e-9
+
+
+class ParabolaArray:
+
+    def __init__(self, vertex_x, vertex_y, focus_x, focus_y):
+        """
+        vertex_x, vertex_y : vertex coordinates (h, k), one entry per parabola
+        focus_x, focus_y   : focus coordinates, same length
+        """
+        self._h = np.array(vertex_x, dtype=float, copy=True).reshape(-1)
+        self._k = np.array(vertex_y, dtype=float, copy=True).reshape(-1)
+        self._fx = np.array(focus_x, dtype=float, copy=True).reshape(-1)
+        self._fy = np.array(focus_y, dtype=float, copy=True).reshape(-1)
+        n = self._h.shape[0]
+        if any(arr.shape[0] != n for arr in (self._k, self._fx, self._fy)):
+            raise ValueError("Vertex and focus arrays must have the same length")
+
+        # same x as the focus -> vertical axis (checked first, like Parabola)
+        self._vertical = np.abs(self._h - self._fx) <= _ALIGN_TOL
+        horizontal = np.abs(self._k - self._fy) <= _ALIGN_TOL
+        bad = ~(self._vertical | horizontal)
+        if bad.any():
+            raise ValueError(f"Focus needs to line up with the vertex either horizontally or vertically "
+                             f"(first bad index {int(np.argmax(bad))})")
+
+        a = np.where(self._vertical, self._fy - self._k, self._fx - self._h)
+        a[np.abs(a) <= _ALIGN_TOL] = 0.1   # minimum focal length for a valid parabola
+        self._a = a
+
+    @classmethod
+    def from_parabolas(cls, parabolas: list[Parabola]):
+        return cls([p.vertex.x for p in parabolas], [p.vertex.y for p in parabolas],
+                   [p.focus.x for p in parabolas], [p.focus.y for p in parabolas])
+
+    def to_parabolas(self):
+        return [self[i] for i in range(len(self))]
+
+    def __len__(self):
+        return self._h.shape[0]
+
+    def __getitem__(self, index):
+        if isinstance(index, (int, np.integer)):
+            return Parabola(Point(float(self._h[index]), float(self._k[index])),
+                            Point(float(self._fx[index]), float(self._fy[index])))
+        return ParabolaArray(self._h[index], self._k[index], self._fx[index], self._fy[index])
+
+    def __str__(self):
+        return f"ParabolaArray of {len(self)} parabolas"
+
+    def __repr__(self):
+        return self.__str__()
+
+    # ---------- properties ----------
+
+    @property
+    def vertex(self):
+        """(h, k) arrays"""
+        return self._h, self._k
+
+    @property
+    def focus(self):
+        """(x, y) arrays of the focus points"""
+        return self._fx, self._fy
+
+    @property
+    def a(self):
+        """Signed focal length (positive opens up/right, negative down/left)"""
+        return self._a
+
+    @property
+    def vertical(self):
+        """Boolean array, True where the axis is vertical"""
+        return self._vertical
+
+    @property
+    def orientation(self):
+        """'vertical' / 'horizontal' per parabola"""
+        return np.where(self._vertical, "vertical", "horizontal")
+
+    def directrix(self):
+        """
+        Directrix position per parabola: the y of y = k - a for vertical parabolas,
+        the x of x = h - a for horizontal ones
+        """
+        return np.where(self._vertical, self._k - self._a, self._h - self._a)
+
+    def latus_rectum_length(self):
+        return np.abs(4 * self._a)
+
+    def axis_of_symmetry(self):
+        """x = h for vertical parabolas, y = k for horizontal ones"""
+        return np.where(self._vertical, self._h, self._k)
@@ -1,6 +1,10 @@
 import math
 
 class Point:
+    # bumped by every x/y assignment; shapes compare it to tell when a Point they
+    # hold may have moved (see Shape._stamp)
+    generation = 0
+
     def __init__(self, x, y):
         self._x = x           # x is an attribute
         self._y = y           # y is an attribute
@@ -15,6 +19,7 @@ class Point:
     @x.setter
     def x(self, value):
         self._x = value
+        Point.generation += 1
 
     # Getter and Setter for y
     @property
@@ -24,6 +29,7 @@ class Point:
     @y.setter
     def y(self, value):
         self._y = value
+        Point.generation += 1
 
     # str magic method
     # it show that how my point object look
@@ -106,6 +112,10 @@ class Point:
         from coordinate_geometry_toolkit.vector import Vector
         return Vector(self._x, self._y)
     
+    # bounding box of a single point (xmin, ymin, xmax, ymax)
+    def bounding_box(self):
+        return (self._x, self._y, self._x, self._y)
+
     # Alias methods for web_app.py compatibility
     def reflection_of_point_about_X_Axis(self):
         return self.reflect_about_x_axis()
@@ -118,5 +128,12 @@ class Point:
     
     def quadrant_of_a_point(self):
         return self.get_quadrant()
-    
-    
+
+
+# bounding box of a list of points (xmin, ymin, xmax, ymax)
+def bounding_box_of_points(points: list[Point]):
+    if not points:
+        raise ValueError("Bounding box needs at least one point")
+    xs = [p.x for p in points]
+    ys = [p.y for p in points]
+    return (min(xs), min(ys), max(xs), max(ys))
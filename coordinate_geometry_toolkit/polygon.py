@@ -1,6 +1,7 @@
 import math
-from coordinate_geometry_toolkit.point import Point
+from coordinate_geometry_toolkit.point import Point, bounding_box_of_points
 from coordinate_geometry_toolkit.base import Shape
+from coordinate_geometry_toolkit.cache import shape_cache
 
 class Polygon(Shape):
     """
@@ -10,6 +11,7 @@ class Polygon(Shape):
     def __init__(self, vertices: list[Point]):
         # Polygon vertices (points) ka list store kar rahe hain
         self._vertices = vertices  # Changed to protected attribute
+        self._lod_cache = {}       # (method, tolerance) -> (_stamp(), Polygon, report)
         
     # Getter and setter for encapsulation
     @property
@@ -19,6 +21,15 @@ class Polygon(Shape):
     @vertices.setter
     def vertices(self, value):
         self._vertices = value
+        self._lod_cache = {}
+        self._invalidate_bounding_box()
+
+    def _compute_bounding_box(self):
+        return bounding_box_of_points(self._vertices)
+
+    # the vertex count catches appends and pops on the vertex list too
+    def _stamp(self):
+        return (self._version, Point.generation, len(self._vertices))
 
     def perimeter(self):
         # Formula: sum of all side lengths
@@ -30,7 +41,15 @@ class Polygon(Shape):
             peri += p1.distance_bw_two_points(p2)
         return peri
 
+    # cached on this polygon against its O(1) _stamp(), not in the shared cache.py
+    # LRU, whose key would hold and hash every vertex coordinate; the cache's on/off
+    # switch still applies
     def area(self):
+        if not shape_cache.enabled:
+            return self._area()
+        return self._stamped("_area_cache", self._area)
+
+    def _area(self):
         # Formula (Shoelace theorem):
         # Area = 1/2 * |(x1*y2 + x2*y3 + ... + xn*y1) - (y1*x2 + y2*x3 + ... + yn*x1)|
         n = len(self._vertices)
@@ -49,9 +68,16 @@ class Polygon(Shape):
         cy = sum(p._y for p in self.vertices) / n
         return Point(cx, cy)
 
-    def is_point_inside(self, point: Point):
+    # tolerance: test against the cached simplify(tolerance) outline instead, far fewer
+    # vertices for big polygons; only points within about tolerance of an edge can
+    # get a different answer (Douglas–Peucker keeps the outline within tolerance)
+    def is_point_inside(self, point: Point, tolerance: float = None):
         # Ray Casting Algorithm:
         # Ek horizontal line draw karo point se → agar odd times intersect karti hai polygon ke sides ko → andar
+        if self._outside_bounding_box(point):
+            return False
+        if tolerance:
+            return self.simplify(tolerance)[0].is_point_inside(point)
         n = len(self.vertices)
         count = 0
         for i in range(n):
@@ -66,6 +92,24 @@ class Polygon(Shape):
                     count += 1
         return count % 2 == 1  # odd → inside, even → outside
 
+    def simplify(self, tolerance: float, method: str = "douglas_peucker"):
+        """
+        Level-of-detail version of this polygon
+        method : 'douglas_peucker' (tolerance = distance) or 'visvalingam_whyatt' (tolerance = area)
+        Returns (Polygon, report), cached per (method, tolerance) and rebuilt once the
+        polygon changes (see Shape._stamp). The cached result is shared by every call:
+        treat it as read-only and copy it before modifying
+        """
+        key = (method, tolerance)
+        stamp = self._stamp()
+        cached = self._lod_cache.get(key)
+        if cached is None or cached[0] != stamp:
+            # Import inside method to avoid circular import
+            from coordinate_geometry_toolkit.simplify import simplify_polygon
+            cached = (stamp,) + simplify_polygon(self, tolerance, method)
+            self._lod_cache[key] = cached
+        return cached[1], cached[2]
+
     def __repr__(self):
         # Polygon ko readable form me print karne ke liye
         return f"Polygon({self.vertices})"
@@ -0,0 +1,225 @@
+import collections
+import functools
+import json
+import threading
+import time
+import tracemalloc
+
+from coordinate_geometry_toolkit.point import Point
+from coordinate_geometry_toolkit.line import Line
+from coordinate_geometry_toolkit.circle import Circle
+from coordinate_geometry_toolkit.triangle import Triangle
+from coordinate_geometry_toolkit.rectangle import Rectangle
+from coordinate_geometry_toolkit.square import Square
+from coordinate_geometry_toolkit.polygon import Polygon
+from coordinate_geometry_toolkit.vector import Vector, MutableVector
+from coordinate_geometry_toolkit.vector_array import VectorArray
+from coordinate_geometry_toolkit.ellipse import Ellipse
+from coordinate_geometry_toolkit.hyperbola import Hyperbola
+from coordinate_geometry_toolkit.parabola import Parabola
+from coordinate_geometry_toolkit.parabola_array import ParabolaArray
+
+# Opt-in per-method profiling
+# Nothing is instrumented until enable() is called: it swaps the public methods of
+# the shape classes for timing wrappers, and disable() puts the originals back, so
+# the disabled toolkit runs exactly the original code.
+#
+# For every wrapped method we keep the call count, total time, p50/p99 latency
+# (over the most recent SAMPLE_LIMIT calls) and, with enable(allocations=True),
+# the peak memory each call allocated above what was in use when it started, as
+# seen by tracemalloc, so temporaries freed before returning count too. Times and
+# allocations are inclusive: a method that calls other wrapped methods also counts
+# theirs. tracemalloc's peak is process-wide, so allocations are only exact when
+# one thread runs profiled code at a time.
+#
+#   from coordinate_geometry_toolkit import profiling
+#   with profiling.profiled():
+#       run_workload()
+#   print(profiling.export_json())
+
+DEFAULT_CLASSES = (Point, Line, Circle, Triangle, Rectangle, Square, Polygon, Vector, MutableVector,
+                   VectorArray, Ellipse, Hyperbola, Parabola, ParabolaArray)
+SAMPLE_LIMIT = 10000
+
+_lock = threading.Lock()
+_stats = {}          # "Class.method" -> _MethodStats
+_originals = []      # (class, attribute name, original class-dict entry) for disable()
+_state = {"allocations": False, "started_tracemalloc": False}
+_local = threading.local()   # per-thread stack of open calls, for nested peaks
+
+
+class _MethodStats:
+    __slots__ = ("calls", "total", "samples", "alloc_bytes", "max_alloc_bytes")
+
+    def __init__(self):
+        self.calls = 0
+        self.total = 0.0
+        self.samples = collections.deque(maxlen=SAMPLE_LIMIT)
+        self.alloc_bytes = 0
+        self.max_alloc_bytes = 0
+
+    def summary(self):
+        ordered = sorted(self.samples)
+        return {
+            "calls": self.calls,
+            "total_s": self.total,
+            "mean_s": self.total / self.calls if self.calls else 0.0,
+            "p50_s": _percentile(ordered, 50),
+            "p99_s": _percentile(ordered, 99),
+            "alloc_bytes": self.alloc_bytes,
+            "alloc_bytes_per_call": self.alloc_bytes / self.calls if self.calls else 0.0,
+            "max_alloc_bytes": self.max_alloc_bytes,
+        }
+
+
+def _percentile(ordered, q):
+    if not ordered:
+        return 0.0
+    return ordered[min(len(ordered) - 1, int(round(q / 100 * (len(ordered) - 1))))]
+
+
+def _wrap(name, fn):
+    stats = _stats.setdefault(name, _MethodStats())
+    track = _state["allocations"]
+
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        frame = _enter_allocations() if track else None
+        start = time.perf_counter()
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            elapsed = time.perf_counter() - start
+            allocated = _exit_allocations(frame) if track else 0
+            with _lock:
+                stats.calls += 1
+                stats.total += elapsed
+                stats.samples.append(elapsed)
+                stats.alloc_bytes += allocated
+                stats.max_alloc_bytes = max(stats.max_alloc_bytes, allocated)
+
+    wrapper.__wrapped_by_profiling__ = True
+    return wrapper
+
+
+# Peak allocation per call: reset tracemalloc's peak on entry and read it on exit.
+# A nested call resets the peak too, so each open call keeps the highest peak its
+# callees reached ([memory in use at entry, carried peak]) and takes the max on exit.
+def _enter_allocations():
+    current, peak = tracemalloc.get_traced_memory()
+    stack = getattr(_local, "stack", None)
+    if stack is None:
+        stack = _local.stack = []
+    if stack:
+        stack[-1][1] = max(stack[-1][1], peak)
+    tracemalloc.reset_peak()
+    frame = [current, current]
+    stack.append(frame)
+    return frame
+
+
+def _exit_allocations(frame):
+    peak = max(tracemalloc.get_traced_memory()[1], frame[1])
+    stack = _local.stack
+    stack.pop()
+    if stack:
+        stack[-1][1] = max(stack[-1][1], peak)
+    return max(peak - frame[0], 0)
+
+
+def _instrument(cls):
+    # only attributes defined on this class itself, so inherited methods are wrapped once
+    for attr, value in list(vars(cls).items()):
+        if attr.startswith("_"):
+            continue
+        name = f"{cls.__name__}.{attr}"
+        if isinstance(value, staticmethod):
+            wrapped = staticmethod(_wrap(name, value.__func__))
+        elif isinstance(value, classmethod):
+            wrapped = classmethod(_wrap(name, value.__func__))
+        elif callable(value) and not isinstance(value, type):
+            wrapped = _wrap(name, value)
+        else:
+            continue   # properties and plain attributes stay untouched
+        _originals.append((cls, attr, value))
+        setattr(cls, attr, wrapped)
+
+
+def is_enabled():
+    return bool(_originals)
+
+
+def tracks_allocations():
+    return is_enabled() and _state["allocations"]
+
+
+def enable(classes=DEFAULT_CLASSES, allocations=False):
+    """
+    Start recording calls on the public methods of the given classes
+    allocations : also record the peak bytes allocated per call (starts tracemalloc,
+                  which slows every allocation in the process while it runs)
+    """
+    if is_enabled():
+        disable()
+    _state["allocations"] = allocations
+    if allocations and not tracemalloc.is_tracing():
+        tracemalloc.start()
+        _state["started_tracemalloc"] = True
+    for cls in classes:
+        _instrument(cls)
+
+
+def disable():
+    """Restore the original methods (recorded statistics are kept)"""
+    while _originals:
+        cls, attr, value = _originals.pop()
+        setattr(cls, attr, value)
+    if _state["started_tracemalloc"]:
+        tracemalloc.stop()
+        _state["started_tracemalloc"] = False
+
+
+def reset():
+    """Forget all recorded statistics"""
+    with _lock:
+        for stats in _stats.values():
+            stats.__init__()
+
+
+class profiled:
+    """Context manager: enable() on entry, disable() on exit"""
+
+    def __init__(self, classes=DEFAULT_CLASSES, allocations=False):
+        self._classes = classes
+        self._allocations = allocations
+
+    def __enter__(self):
+        enable(self._classes, self._allocations)
+        return self
+
+    def __exit__(self, *exc):
+        disable()
+        return False
+
+
+def stats():
+    """{"Class.method": summary dict} for every method called at least once"""
+    with _lock:
+        return {name: s.summary() for name, s in _stats.items() if s.calls}
+
+
+def rows(sort_by="total_s"):
+    """Statistics as a list of flat dicts, slowest first (for tables)"""
+    table = [dict(method=name, **summary) for name, summary in stats().items()]
+    table.sort(key=lambda row: row[sort_by], reverse=True)
+    return table
+
+
+def export_json(path=None, indent=2):
+    """Statistics as a JSON string; also written to path when given"""
+    # allocations_tracked describes the latest enable() call
+    text = json.dumps({"allocations_tracked": _state["allocations"], "methods": stats()}, indent=indent)
+    if path is not None:
+        with open(path, "w") as f:
+            f.write(text)
+    return text
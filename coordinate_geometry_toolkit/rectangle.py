@@ -8,21 +8,8 @@ class Rectangle(Shape):
     def __init__(self, p1: Point, p2: Point):
         self._p1 = p1  # Changed to protected attribute
         self._p2 = p2  # Changed to protected attribute
-        self._width = abs(p2.x - p1.x)  # Changed to protected attribute
-        self._height = abs(p2.y - p1.y)  # Changed to protected attribute
-        
-        # Create four corners of the rectangle
-        x1, y1 = p1.x, p1.y
-        x2, y2 = p2.x, p2.y
-        
-        # Create the polygon representation
-        self._polygon = Polygon([
-            Point(x1, y1),  # Bottom-left
-            Point(x2, y1),  # Bottom-right
-            Point(x2, y2),  # Top-right
-            Point(x1, y2)   # Top-left
-        ])
-        
+        self._update_dimensions()
+
     # Getters and setters for encapsulation
     @property
     def p1(self):
@@ -52,22 +39,29 @@ class Rectangle(Shape):
         
     @property
     def polygon(self):
+        # The four-corner Polygon is only built when someone asks for it;
+        # containment and boundary checks work straight from the min/max coordinates
+        if self._polygon is None:
+            self._polygon = Polygon([
+                Point(self._xmin, self._ymin),  # Bottom-left
+                Point(self._xmax, self._ymin),  # Bottom-right
+                Point(self._xmax, self._ymax),  # Top-right
+                Point(self._xmin, self._ymax)   # Top-left
+            ])
         return self._polygon
-        
+
     def _update_dimensions(self):
-        self._width = abs(self._p2.x - self._p1.x)
-        self._height = abs(self._p2.y - self._p1.y)
-        
-        # Update the polygon vertices when dimensions change
+        self._invalidate_bounding_box()
         x1, y1 = self._p1.x, self._p1.y
         x2, y2 = self._p2.x, self._p2.y
-        
-        self._polygon = Polygon([
-            Point(x1, y1),  # Bottom-left
-            Point(x2, y1),  # Bottom-right
-            Point(x2, y2),  # Top-right
-            Point(x1, y2)   # Top-left
-        ])
+        self._xmin, self._xmax = min(x1, x2), max(x1, x2)
+        self._ymin, self._ymax = min(y1, y2), max(y1, y2)
+        self._width = self._xmax - self._xmin
+        self._height = self._ymax - self._ymin
+        self._polygon = None  # rebuilt lazily by the polygon property
+
+    def _compute_bounding_box(self):
+        return (self._xmin, self._ymin, self._xmax, self._ymax)
 
     def __str__(self):
         """String representation of the rectangle
@@ -89,12 +83,28 @@ class Rectangle(Shape):
 
     def is_point_inside(self, point: Point):
         """Check if a point is inside the rectangle
+        Half-open on the right/top edges ([xmin, xmax) x [ymin, ymax)), the same answer
+        the ray-casting test on the corner polygon gives, so tiled rectangles never share a point
+        """
+        return self._xmin <= point.x < self._xmax and self._ymin <= point.y < self._ymax
+
+    def contains_many(self, xs, ys=None):
+        """
+        Batch version of is_point_inside over a list of Points, or over coordinate
+        arrays xs, ys (half-open [xmin, xmax) x [ymin, ymax))
+        Returns a numpy bool array, one entry per point; it returned a list of bools
+        before, so call .tolist() where a list is needed
         """
-        return self._polygon.is_point_inside(point)
+        # numpy is only needed here, so importing rectangle stays light
+        from coordinate_geometry_toolkit.classify import as_columns
+        if ys is None:
+            xs, ys = [p.x for p in xs], [p.y for p in xs]
+        xs, ys = as_columns(xs, ys)
+        return (xs >= self._xmin) & (xs < self._xmax) & (ys >= self._ymin) & (ys < self._ymax)
 
     def is_point_on_boundary(self, point: Point):
         """Check if a point is on the boundary of the rectangle
         """
-        return ((self._p1.x <= point.x <= self._p2.x and (point.y == self._p1.y or point.y == self._p2.y)) or
-                (self._p1.y <= point.y <= self._p2.y and (point.x == self._p1.x or point.x == self._p2.x)))
-    
\ No newline at end of file
+        x, y = point.x, point.y
+        return ((self._xmin <= x <= self._xmax and (y == self._ymin or y == self._ymax)) or
+                (self._ymin <= y <= self._ymax and (x == self._xmin or x == self._xmax)))
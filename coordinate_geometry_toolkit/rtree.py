@@ -0,0 +1,291 @@
+import heapq
+import itertools
+import math
+
+# R-tree spatial index
+# Stores any object that can report bounding_box() -> (xmin, ymin, xmax, ymax)
+# (every Shape, Point, Vector) and answers point, window and nearest queries
+# without looping over everything. Build it in one go with RTree.bulk_load()
+# (Sort-Tile-Recursive packing) or grow it with insert()/delete().
+
+
+def _union(boxes):
+    xmin = ymin = math.inf
+    xmax = ymax = -math.inf
+    for b in boxes:
+        if b[0] < xmin: xmin = b[0]
+        if b[1] < ymin: ymin = b[1]
+        if b[2] > xmax: xmax = b[2]
+        if b[3] > ymax: ymax = b[3]
+    return (xmin, ymin, xmax, ymax)
+
+
+def _area(b):
+    return (b[2] - b[0]) * (b[3] - b[1])
+
+
+def _enlargement(b, extra):
+    merged = (min(b[0], extra[0]), min(b[1], extra[1]), max(b[2], extra[2]), max(b[3], extra[3]))
+    return _area(merged) - _area(b)
+
+
+def _intersects(a, b):
+    return a[0] <= b[2] and b[0] <= a[2] and a[1] <= b[3] and b[1] <= a[3]
+
+
+def _contains_point(b, x, y):
+    return b[0] <= x <= b[2] and b[1] <= y <= b[3]
+
+
+def _min_dist_sq(b, x, y):
+    # squared distance from (x, y) to the nearest point of box b (0 if inside)
+    dx = b[0] - x if x < b[0] else (x - b[2] if x > b[2] else 0.0)
+    dy = b[1] - y if y < b[1] else (y - b[3] if y > b[3] else 0.0)
+    return dx * dx + dy * dy
+
+
+def _center(b):
+    return ((b[0] + b[2]) / 2, (b[1] + b[3]) / 2)
+
+
+class _Node:
+    __slots__ = ("leaf", "entries", "bbox")
+
+    def __init__(self, leaf, entries):
+        self.leaf = leaf
+        self.entries = entries      # list of (bbox, item) in leaves, (bbox, _Node) otherwise
+        self.bbox = _union(e[0] for e in entries)
+
+    def refresh(self):
+        self.bbox = _union(e[0] for e in self.entries)
+
+
+class RTree:
+
+    def __init__(self, max_entries: int = 16):
+        if max_entries < 4:
+            raise ValueError("max_entries must be at least 4")
+        self._max = max_entries
+        self._min = max_entries // 2
+        self._root = _Node(True, [])
+        self._size = 0
+
+    def __len__(self):
+        return self._size
+
+    def __str__(self):
+        return f"RTree with {self._size} items (max {self._max} entries per node)"
+
+    # overall bounding box of everything stored (None when empty)
+    def bounding_box(self):
+        return self._root.bbox if self._size else None
+
+    # ---------- building ----------
+
+    @classmethod
+    def bulk_load(cls, items, max_entries: int = 16):
+        """
+        Build a packed tree with Sort-Tile-Recursive (STR) loading
+        items : iterable of shapes, or of (bbox, item) pairs
+        """
+        tree = cls(max_entries)
+        entries = [cls._entry(it) for it in items]
+        tree._size = len(entries)
+        if not entries:
+            return tree
+
+        leaf = True
+        while True:
+            nodes = [_Node(leaf, group) for group in tree._str_groups(entries)]
+            if len(nodes) == 1:
+                tree._root = nodes[0]
+                return tree
+            entries = [(n.bbox, n) for n in nodes]
+            leaf = False
+
+    def _str_groups(self, entries):
+        # sort by x center into vertical slices, then by y center inside each slice
+        m = self._max
+        pages = math.ceil(len(entries) / m)
+        slices = math.ceil(math.sqrt(pages))
+        per_slice = slices * m
+        entries = sorted(entries, key=lambda e: e[0][0] + e[0][2])
+        for s in range(0, len(entries), per_slice):
+            column = sorted(entries[s:s + per_slice], key=lambda e: e[0][1] + e[0][3])
+            for g in range(0, len(column), m):
+                yield column[g:g + m]
+
+    @staticmethod
+    def _entry(item):
+        if isinstance(item, tuple) and len(item) == 2 and isinstance(item[0], tuple):
+            return (tuple(item[0]), item[1])
+        return (tuple(item.bounding_box()), item)
+
+    def insert(self, item, bbox=None):
+        """Add one item; bbox defaults to item.bounding_box()"""
+        bbox = tuple(bbox) if bbox is not None else tuple(item.bounding_box())
+        self._insert_entry((bbox, item))
+        self._size += 1
+
+    def _insert_entry(self, entry):
+        split = self._insert(self._root, entry)
+        if split is not None:
+            old = self._root
+            self._root = _Node(False, [(old.bbox, old), (split.bbox, split)])
+
+    def _insert(self, node, entry):
+        if node.leaf:
+            node.entries.append(entry)
+        else:
+            index = self._choose_subtree(node, entry[0])
+            child = node.entries[index][1]
+            split = self._insert(child, entry)
+            node.entries[index] = (child.bbox, child)
+            if split is not None:
+                node.entries.append((split.bbox, split))
+        if len(node.entries) > self._max:
+            return self._split(node)
+        node.refresh()
+        return None
+
+    @staticmethod
+    def _choose_subtree(node, bbox):
+        # least enlargement, ties broken by smaller area
+        best, best_key = 0, None
+        for i, (b, _) in enumerate(node.entries):
+            key = (_enlargement(b, bbox), _area(b))
+            if best_key is None or key < best_key:
+                best, best_key = i, key
+        return best
+
+    def _split(self, node):
+        # sort along the axis with the larger spread of centers and cut at the middle
+        centers = [_center(e[0]) for e in node.entries]
+        spread_x = max(c[0] for c in centers) - min(c[0] for c in centers)
+        spread_y = max(c[1] for c in centers) - min(c[1] for c in centers)
+        axis = 0 if spread_x >= spread_y else 1
+        ordered = sorted(node.entries, key=lambda e: e[0][axis] + e[0][axis + 2])
+        half = len(ordered) // 2
+        node.entries = ordered[:half]
+        node.refresh()
+        return _Node(node.leaf, ordered[half:])
+
+    def delete(self, item, bbox=None):
+        """
+        Remove an item (matched by identity); returns True if it was found
+        Pass the bbox it was inserted with if the shape has changed since then
+        """
+        bbox = tuple(bbox) if bbox is not None else tuple(item.bounding_box())
+        path = self._find_leaf(self._root, bbox, item, [])
+        if path is None:
+            return False
+        leaf, index = path[-1]
+        del leaf.entries[index]
+        self._size -= 1
+        self._condense([node for node, _ in path])
+        return True
+
+    def _find_leaf(self, node, bbox, item, path):
+        if node.leaf:
+            for i, (b, it) in enumerate(node.entries):
+                if it is item:
+                    return path + [(node, i)]
+            return None
+        for i, (b, child) in enumerate(node.entries):
+            if _intersects(b, bbox):
+                found = self._find_leaf(child, bbox, item, path + [(node, i)])
+                if found is not None:
+                    return found
+        return None
+
+    def _condense(self, nodes):
+        # walk back up the path: drop underfull nodes and re-insert the items below them
+        orphans = []
+        for depth in range(len(nodes) - 1, 0, -1):
+            node, parent = nodes[depth], nodes[depth - 1]
+            index = next(i for i, e in enumerate(parent.entries) if e[1] is node)
+            if len(node.entries) < self._min:
+                del parent.entries[index]
+                orphans.extend(self._leaf_entries(node))
+            else:
+                node.refresh()
+                parent.entries[index] = (node.bbox, node)
+        nodes[0].refresh()
+
+        # shrink the root while it only has a single child
+        while not self._root.leaf and len(self._root.entries) == 1:
+            self._root = self._root.entries[0][1]
+        if not self._root.entries:
+            self._root = _Node(True, [])
+
+        for entry in orphans:
+            self._insert_entry(entry)
+
+    @staticmethod
+    def _leaf_entries(node):
+        found = []
+        stack = [node]
+        while stack:
+            n = stack.pop()
+            if n.leaf:
+                found.extend(n.entries)
+            else:
+                stack.extend(child for _, child in n.entries)
+        return found
+
+    # ---------- queries ----------
+
+    def query_point(self, x, y):
+        """Items whose bounding box contains (x, y)"""
+        found = []
+        if not self._size:
+            return found
+        stack = [self._root]
+        while stack:
+            node = stack.pop()
+            if node.leaf:
+                found.extend(it for b, it in node.entries if _contains_point(b, x, y))
+            else:
+                stack.extend(child for b, child in node.entries if _contains_point(b, x, y))
+        return found
+
+    def query_window(self, bbox):
+        """Items whose bounding box intersects the window (xmin, ymin, xmax, ymax)"""
+        found = []
+        if not self._size:
+            return found
+        bbox = tuple(bbox)
+        stack = [self._root]
+        while stack:
+            node = stack.pop()
+            if node.leaf:
+                found.extend(it for b, it in node.entries if _intersects(b, bbox))
+            else:
+                stack.extend(child for b, child in node.entries if _intersects(b, bbox))
+        return found
+
+    def nearest(self, x, y, k: int = 1):
+        """
+        The k items whose bounding boxes are closest to (x, y), nearest first
+        Returns a list of (distance, item)
+        """
+        result = []
+        if not self._size or k <= 0:
+            return result
+        tie = itertools.count()
+        heap = [(0.0, next(tie), False, self._root)]
+        while heap and len(result) < k:
+            dist_sq, _, is_item, obj = heapq.heappop(heap)
+            if is_item:
+                result.append((math.sqrt(dist_sq), obj))
+            elif obj.leaf:
+                for b, it in obj.entries:
+                    heapq.heappush(heap, (_min_dist_sq(b, x, y), next(tie), True, it))
+            else:
+                for b, child in obj.entries:
+                    heapq.heappush(heap, (_min_dist_sq(b, x, y), next(tie), False, child))
+        return result
+
+    def items(self):
+        """All stored items (tree order)"""
+        return [it for _, it in self._leaf_entries(self._root)]
@@ -0,0 +1,186 @@
+import itertools
+from coordinate_geometry_toolkit.rtree import RTree
+
+# Scene container
+# Holds any number of shapes under stable integer ids (never reused, even after
+# clear()), keeps their bounding boxes in an R-tree, and records which ids were
+# added, updated or removed since the last changes() call. Viewport, pick and
+# type queries therefore touch only the shapes involved instead of the whole scene.
+#
+# Shapes cache their bounding box, so after mutating a shape in place call
+# update(id) to move it in the index. A shape whose bounding_box() raises (a
+# degenerate shape, or an object without one) is still stored, but kept out of the
+# index: spatial queries never return it, unbounded() lists it.
+
+
+class Scene:
+
+    def __init__(self, max_entries: int = 16):
+        self._shapes = {}        # id -> shape, in insertion (draw) order
+        self._attrs = {}         # id -> dict of caller data (name, color, ...)
+        self._boxes = {}         # id -> (key, bbox): the exact int object and bbox in the R-tree
+        self._unbounded = set()  # ids of shapes kept out of the index
+        self._by_type = {}       # class -> {id: None}, an insertion-ordered set
+        self._index = RTree(max_entries)
+        self._max_entries = max_entries
+        self._next_id = itertools.count(1)
+        self._changed = set()
+        self._removed = set()
+
+    def __len__(self):
+        return len(self._shapes)
+
+    def __contains__(self, shape_id):
+        return shape_id in self._shapes
+
+    def __iter__(self):
+        return iter(list(self._shapes))
+
+    def __str__(self):
+        return f"Scene with {len(self._shapes)} shapes"
+
+    # ---------- editing ----------
+
+    def add(self, shape, **attrs):
+        """Add a shape (plus optional caller data such as name/color); returns its id"""
+        shape_id = next(self._next_id)
+        self._shapes[shape_id] = shape
+        self._attrs[shape_id] = attrs
+        self._by_type.setdefault(type(shape), {})[shape_id] = None
+        self._insert(shape_id, shape_id, shape)
+        self._changed.add(shape_id)
+        return shape_id
+
+    def remove(self, shape_id):
+        """Remove a shape by id and return it"""
+        shape = self.get(shape_id)
+        self._unindex(shape_id)
+        del self._shapes[shape_id]
+        del self._attrs[shape_id]
+        group = self._by_type[type(shape)]
+        del group[shape_id]
+        if not group:
+            del self._by_type[type(shape)]
+        self._changed.discard(shape_id)
+        self._removed.add(shape_id)
+        return shape
+
+    def pop(self):
+        """Remove the most recently added shape; returns (id, shape), or None when empty"""
+        if not self._shapes:
+            return None
+        shape_id = next(reversed(self._shapes))
+        return shape_id, self.remove(shape_id)
+
+    def update(self, shape_id, shape=None):
+        """Replace the shape under an id, or re-index it after it was changed in place"""
+        old = self.get(shape_id)
+        new = old if shape is None else shape
+        key = self._unindex(shape_id)
+        if new is not old:
+            del self._by_type[type(old)][shape_id]
+            if not self._by_type[type(old)]:
+                del self._by_type[type(old)]
+            self._by_type.setdefault(type(new), {})[shape_id] = None
+            self._shapes[shape_id] = new
+        self._insert(shape_id, key, new)
+        self._changed.add(shape_id)
+
+    def clear(self):
+        self._removed.update(self._shapes)
+        self._changed.clear()
+        self._shapes.clear()
+        self._attrs.clear()
+        self._boxes.clear()
+        self._unbounded.clear()
+        self._by_type.clear()
+        self._index = RTree(self._max_entries)
+
+    def _insert(self, shape_id, key, shape):
+        # index the shape under key, or set it aside when it has no bounding box
+        try:
+            bbox = tuple(shape.bounding_box())
+        except Exception:
+            self._unbounded.add(shape_id)
+            return
+        self._boxes[shape_id] = (key, bbox)
+        self._index.insert(key, bbox)
+
+    def _unindex(self, shape_id):
+        # take the shape out of the index; returns the key to reinsert it under
+        entry = self._boxes.pop(shape_id, None)
+        if entry is None:
+            self._unbounded.remove(shape_id)
+            return shape_id
+        key, bbox = entry
+        self._index.delete(key, bbox)
+        return key
+
+    # ---------- lookup ----------
+
+    def get(self, shape_id):
+        try:
+            return self._shapes[shape_id]
+        except KeyError:
+            raise ValueError(f"No shape with id {shape_id} in the scene") from None
+
+    def attrs(self, shape_id):
+        """The caller data stored with add() (a live dict)"""
+        self.get(shape_id)
+        return self._attrs[shape_id]
+
+    def items(self):
+        """(id, shape) pairs in insertion order"""
+        return list(self._shapes.items())
+
+    def bounding_box(self):
+        """Bounding box of the whole scene, None when empty"""
+        return self._index.bounding_box()
+
+    # ---------- queries ----------
+
+    def query_viewport(self, bbox):
+        """Ids of shapes whose bounding box meets the window (xmin, ymin, xmax, ymax), in draw order"""
+        return sorted(self._index.query_window(bbox))
+
+    def unbounded(self):
+        """Ids of shapes kept out of the index (no bounding box), in draw order"""
+        return sorted(self._unbounded)
+
+    def pick(self, x, y, tolerance=0.0):
+        """Ids of shapes whose bounding box is within tolerance of (x, y), topmost (newest) first"""
+        window = (x - tolerance, y - tolerance, x + tolerance, y + tolerance)
+        return sorted(self._index.query_window(window), reverse=True)
+
+    def nearest(self, x, y, k: int = 1):
+        """(distance, id) of the k shapes whose bounding boxes are closest to (x, y)"""
+        return self._index.nearest(x, y, k)
+
+    def of_type(self, *types):
+        """
+        Ids of shapes of the given classes (subclasses included, so Rectangle also finds
+        Squares) or class names (exact match), in draw order
+        """
+        found = []
+        for cls, group in self._by_type.items():
+            for t in types:
+                if (cls.__name__ == t) if isinstance(t, str) else issubclass(cls, t):
+                    found.extend(group)
+                    break
+        return sorted(found)
+
+    # ---------- dirty tracking ----------
+
+    @property
+    def has_changes(self):
+        return bool(self._changed or self._removed)
+
+    def changes(self):
+        """
+        (changed_ids, removed_ids) since the previous call, then start a new round
+        changed covers added and updated shapes that are still in the scene
+        """
+        changed, removed = sorted(self._changed), sorted(self._removed)
+        self._changed = set()
+        self._removed = set()
+        return changed, removed
@@ -0,0 +1,135 @@
+import heapq
+import math
+from coordinate_geometry_toolkit.point import Point
+from coordinate_geometry_toolkit.polygon import Polygon
+
+# Polygon simplification
+# Both routines work on a closed ring of vertices and return the indices of the
+# vertices that survive, so callers can build the smaller Polygon themselves.
+
+METHODS = ("douglas_peucker", "visvalingam_whyatt")
+
+
+def _segment_distance(p: Point, a: Point, b: Point):
+    # perpendicular distance from p to the segment a-b (falls back to endpoint distance)
+    dx = b.x - a.x
+    dy = b.y - a.y
+    seg_sq = dx * dx + dy * dy
+    if seg_sq == 0:
+        return math.hypot(p.x - a.x, p.y - a.y)
+    t = ((p.x - a.x) * dx + (p.y - a.y) * dy) / seg_sq
+    t = max(0.0, min(1.0, t))
+    return math.hypot(p.x - (a.x + t * dx), p.y - (a.y + t * dy))
+
+
+def _triangle_area(a: Point, b: Point, c: Point):
+    return abs((b.x - a.x) * (c.y - a.y) - (c.x - a.x) * (b.y - a.y)) / 2
+
+
+def douglas_peucker(vertices: list[Point], tolerance: float):
+    """
+    Douglas–Peucker simplification of a closed ring
+    tolerance : maximum perpendicular distance a dropped vertex may be from the kept outline
+    Returns the sorted indices of the retained vertices (at least 3 when possible)
+    """
+    n = len(vertices)
+    if n <= 3 or tolerance <= 0:
+        return list(range(n))
+
+    # split the ring at vertex 0 and the vertex farthest from it
+    first = vertices[0]
+    far = max(range(1, n), key=lambda i: first.distance_between_points(vertices[i]))
+
+    keep = [False] * n
+    keep[0] = keep[far] = True
+
+    # iterative stack instead of recursion so huge polygons don't hit the recursion limit
+    stack = [(0, far), (far, n)]
+    while stack:
+        start, end = stack.pop()
+        a, b = vertices[start], vertices[end % n]
+        max_dist, index = 0.0, None
+        for i in range(start + 1, end):
+            d = _segment_distance(vertices[i], a, b)
+            if d > max_dist:
+                max_dist, index = d, i
+        if index is not None and max_dist > tolerance:
+            keep[index] = True
+            stack.append((start, index))
+            stack.append((index, end))
+
+    kept = [i for i in range(n) if keep[i]]
+    if len(kept) < 3:
+        # a polygon needs three vertices, add back the farthest remaining one
+        rest = [i for i in range(n) if not keep[i]]
+        a, b = vertices[kept[0]], vertices[kept[-1]]
+        kept.append(max(rest, key=lambda i: _segment_distance(vertices[i], a, b)))
+        kept.sort()
+    return kept
+
+
+def visvalingam_whyatt(vertices: list[Point], tolerance: float):
+    """
+    Visvalingam–Whyatt simplification of a closed ring
+    tolerance : minimum effective area; vertices whose triangle with their neighbours
+                is smaller than this are removed, smallest first
+    Returns the sorted indices of the retained vertices (at least 3)
+    """
+    n = len(vertices)
+    if n <= 3 or tolerance <= 0:
+        return list(range(n))
+
+    prev = [(i - 1) % n for i in range(n)]
+    nxt = [(i + 1) % n for i in range(n)]
+    removed = [False] * n
+    areas = [_triangle_area(vertices[prev[i]], vertices[i], vertices[nxt[i]]) for i in range(n)]
+    heap = [(areas[i], i) for i in range(n)]
+    heapq.heapify(heap)
+
+    remaining = n
+    while heap and remaining > 3:
+        area, i = heapq.heappop(heap)
+        # stale heap entry (vertex already gone or its area was recomputed)
+        if removed[i] or area != areas[i]:
+            continue
+        if area >= tolerance:
+            break
+        removed[i] = True
+        remaining -= 1
+        p, q = prev[i], nxt[i]
+        nxt[p], prev[q] = q, p
+        # neighbours get a new triangle; never let it drop below the removed area
+        for j in (p, q):
+            areas[j] = max(area, _triangle_area(vertices[prev[j]], vertices[j], vertices[nxt[j]]))
+            heapq.heappush(heap, (areas[j], j))
+
+    return [i for i in range(n) if not removed[i]]
+
+
+def simplify_polygon(polygon: Polygon, tolerance: float, method: str = "douglas_peucker"):
+    """
+    Simplify a Polygon and report how many vertices were kept
+    Returns (Polygon, report) where report is a dict with the method, tolerance,
+    original/retained vertex counts, retention ratio and retained indices
+    """
+    if method not in METHODS:
+        raise ValueError(f"Method must be one of {METHODS}")
+    if tolerance < 0:
+        raise ValueError("Tolerance must be non-negative")
+
+    vertices = polygon.vertices
+    if method == "douglas_peucker":
+        kept = douglas_peucker(vertices, tolerance)
+    else:
+        kept = visvalingam_whyatt(vertices, tolerance)
+
+    n = len(vertices)
+    report = {
+        "method": method,
+        "tolerance": tolerance,
+        "original_vertices": n,
+        "retained_vertices": len(kept),
+        "retention_ratio": len(kept) / n if n else 1.0,
+        "retained_indices": kept,
+    }
+    return Polygon([vertices[i] for i in kept]), report
@@ -52,5 +52,5 @@ class Square(Rectangle):
     def diagonal_length(self):
         return round(math.sqrt(2) * self._side_length, 2)
     
-    # is_point_inside and is_point_on_boundary are inherited from Rectangle
-    # It will work correctly because we are using the polygon implementation
\ No newline at end of file
+    # is_point_inside, contains_many and is_point_on_boundary are inherited from Rectangle
+    # They work from the min/max coordinates, which a square keeps up to date through the setters
\ No newline at end of file
@@ -0,0 +1,183 @@
+import csv
+import math
+import numpy as np
+from coordinate_geometry_toolkit.point import Point
+
+# Streaming polygon metrics
+# Vertices are consumed once, in order, and never stored: the accumulator only
+# keeps the first vertex, the previous vertex and a handful of running sums, so
+# memory stays O(1) (plus one chunk) no matter how many vertices the polygon has.
+
+
+class PolygonStream:
+    """
+    Single-pass accumulator for shoelace area, perimeter, centroid and bounds
+    Feed vertices with add() / add_chunk() in boundary order, then call result()
+    """
+
+    def __init__(self):
+        self._count = 0
+        self._first = None      # (x, y) of the first vertex, needed to close the ring
+        self._prev = None       # (x, y) of the last vertex seen
+        # area/centroid sums use coordinates relative to the first vertex, which keeps
+        # the shoelace terms small (and accurate) for far-from-origin data
+        self._cross = 0.0       # sum of x_i*y_{i+1} - x_{i+1}*y_i  (= 2 * signed area)
+        self._cx = 0.0          # sum of (x_i + x_{i+1}) * cross_i
+        self._cy = 0.0          # sum of (y_i + y_{i+1}) * cross_i
+        self._perimeter = 0.0
+        self._sum_x = 0.0
+        self._sum_y = 0.0
+        self._xmin = self._ymin = math.inf
+        self._xmax = self._ymax = -math.inf
+
+    @property
+    def count(self):
+        return self._count
+
+    def add(self, x, y):
+        """Add one vertex"""
+        x, y = float(x), float(y)
+        if self._prev is None:
+            self._first = (x, y)
+        else:
+            fx, fy = self._first
+            px, py = self._prev[0] - fx, self._prev[1] - fy
+            qx, qy = x - fx, y - fy
+            cross = px * qy - qx * py
+            self._cross += cross
+            self._cx += (px + qx) * cross
+            self._cy += (py + qy) * cross
+            self._perimeter += math.hypot(qx - px, qy - py)
+        self._prev = (x, y)
+        self._count += 1
+        self._sum_x += x
+        self._sum_y += y
+        self._xmin = min(self._xmin, x)
+        self._xmax = max(self._xmax, x)
+        self._ymin = min(self._ymin, y)
+        self._ymax = max(self._ymax, y)
+
+    def add_chunk(self, xs, ys):
+        """Add a block of vertices given as two equal-length coordinate arrays"""
+        xs = np.asarray(xs, dtype=float)
+        ys = np.asarray(ys, dtype=float)
+        if xs.shape != ys.shape or xs.ndim != 1:
+            raise ValueError("xs and ys must be 1-D arrays of the same length")
+        if xs.size == 0:
+            return
+        if self._prev is None:
+            self._first = (float(xs[0]), float(ys[0]))
+            ex, ey = xs, ys
+        else:
+            # prepend the previous vertex so the edge across the chunk boundary is counted
+            ex = np.concatenate(([self._prev[0]], xs))
+            ey = np.concatenate(([self._prev[1]], ys))
+
+        ex = ex - self._first[0]
+        ey = ey - self._first[1]
+        cross = ex[:-1] * ey[1:] - ex[1:] * ey[:-1]
+        self._cross += float(cross.sum())
+        self._cx += float(((ex[:-1] + ex[1:]) * cross).sum())
+        self._cy += float(((ey[:-1] + ey[1:]) * cross).sum())
+        self._perimeter += float(np.hypot(np.diff(ex), np.diff(ey)).sum())
+
+        self._prev = (float(xs[-1]), float(ys[-1]))
+        self._count += xs.size
+        self._sum_x += float(xs.sum())
+        self._sum_y += float(ys.sum())
+        self._xmin = min(self._xmin, float(xs.min()))
+        self._xmax = max(self._xmax, float(xs.max()))
+        self._ymin = min(self._ymin, float(ys.min()))
+        self._ymax = max(self._ymax, float(ys.max()))
+
+    def result(self):
+        """
+        Metrics of the closed polygon seen so far (the closing edge is added here, state is unchanged)
+        Returns a dict with vertices, area, signed_area, perimeter, centroid (area-weighted),
+        vertex_centroid (mean of the vertices, as Polygon.centroid) and bounding_box
+        """
+        if self._count == 0:
+            raise ValueError("No vertices were added")
+
+        # closing edge: last vertex back to the first, which is the local origin,
+        # so it adds nothing to the area sums
+        (px, py), (fx, fy) = self._prev, self._first
+        cross = self._cross
+        perimeter = self._perimeter + math.hypot(fx - px, fy - py)
+
+        vertex_centroid = Point(self._sum_x / self._count, self._sum_y / self._count)
+        if cross == 0:
+            # degenerate (zero-area) polygon has no area centroid, use the vertex mean
+            centroid = vertex_centroid
+        else:
+            centroid = Point(fx + self._cx / (3 * cross), fy + self._cy / (3 * cross))
+
+        return {
+            "vertices": self._count,
+            "area": abs(cross) / 2,
+            "signed_area": cross / 2,
+            "perimeter": perimeter,
+            "centroid": centroid,
+            "vertex_centroid": vertex_centroid,
+            "bounding_box": (self._xmin, self._ymin, self._xmax, self._ymax),
+        }
+
+
+def polygon_metrics(vertices, chunk_size=65536):
+    """
+    Metrics from any iterable of Point objects or (x, y) pairs, consumed lazily in chunks
+    """
+    stream = PolygonStream()
+    xs, ys = [], []
+    for v in vertices:
+        if isinstance(v, Point):
+            xs.append(v.x); ys.append(v.y)
+        else:
+            xs.append(v[0]); ys.append(v[1])
+        if len(xs) >= chunk_size:
+            stream.add_chunk(xs, ys)
+            xs, ys = [], []
+    stream.add_chunk(xs, ys)
+    return stream.result()
+
+
+def polygon_metrics_from_csv(path, chunk_size=65536, delimiter=","):
+    """
+    Metrics from a CSV file with x, y in the first two columns
+    A non-numeric first row is treated as a header and skipped
+    """
+    stream = PolygonStream()
+    xs, ys = [], []
+    with open(path, newline="") as f:
+        for line_no, row in enumerate(csv.reader(f, delimiter=delimiter)):
+            if not row:
+                continue
+            try:
+                x, y = float(row[0]), float(row[1])
+            except (ValueError, IndexError):
+                if line_no == 0:
+                    continue  # header
+                raise ValueError(f"Bad vertex on line {line_no + 1}: {row}")
+            xs.append(x); ys.append(y)
+            if len(xs) >= chunk_size:
+                stream.add_chunk(xs, ys)
+                xs, ys = [], []
+    stream.add_chunk(xs, ys)
+    return stream.result()
+
+
+def polygon_metrics_from_binary(path, dtype="<f8", offset=0, chunk_size=1 << 20):
+    """
+    Metrics from a raw binary file of interleaved x, y values (x0 y0 x1 y1 ...)
+    The file is memory-mapped and walked chunk by chunk, so only the pages of
+    the current chunk need to be resident
+    """
+    data = np.memmap(path, dtype=dtype, mode="r", offset=offset)
+    if data.size % 2:
+        raise ValueError("Binary vertex file must hold an even number of values (x, y pairs)")
+    coords = data.reshape(-1, 2)
+    stream = PolygonStream()
+    for start in range(0, coords.shape[0], chunk_size):
+        chunk = coords[start:start + chunk_size]
+        stream.add_chunk(chunk[:, 0], chunk[:, 1])
+    return stream.result()
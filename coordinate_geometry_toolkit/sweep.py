@@ -0,0 +1,222 @@
+import bisect
+import heapq
+
+# Sweep-line algorithms for many axis-aligned rectangles
+# Inputs can be Rectangle/Square objects, any shape with bounding_box(),
+# or plain (xmin, ymin, xmax, ymax) tuples.
+
+# overlapping_pairs compares a new rectangle with every open one by a plain scan
+# up to this many; beyond it the open rectangles are indexed by y-interval
+SCAN_LIMIT = 256
+
+
+def _boxes(shapes):
+    boxes = []
+    for s in shapes:
+        if isinstance(s, tuple):
+            xmin, ymin, xmax, ymax = s
+        else:
+            xmin, ymin, xmax, ymax = s.bounding_box()
+        boxes.append((xmin, ymin, xmax, ymax))
+    return boxes
+
+
+class _CoverageTree:
+    """
+    Segment tree over the elementary y-intervals [ys[i], ys[i+1]]
+    Each node keeps how many rectangles fully cover it and the covered length below it
+    """
+
+    def __init__(self, ys):
+        self._ys = ys
+        size = max(1, len(ys) - 1)
+        self._count = [0] * (4 * size)
+        self._covered = [0.0] * (4 * size)
+        self._n = size
+
+    def covered(self):
+        return self._covered[1]
+
+    def update(self, lo, hi, delta):
+        # add delta to the cover count of elementary intervals lo .. hi-1
+        if lo < hi:
+            self._update(1, 0, self._n, lo, hi, delta)
+
+    def _update(self, node, left, right, lo, hi, delta):
+        if hi <= left or right <= lo:
+            return
+        if lo <= left and right <= hi:
+            self._count[node] += delta
+        else:
+            mid = (left + right) // 2
+            self._update(2 * node, left, mid, lo, hi, delta)
+            self._update(2 * node + 1, mid, right, lo, hi, delta)
+        if self._count[node] > 0:
+            self._covered[node] = self._ys[right] - self._ys[left]
+        elif right - left == 1:
+            self._covered[node] = 0.0
+        else:
+            self._covered[node] = self._covered[2 * node] + self._covered[2 * node + 1]
+
+
+def union_area(shapes):
+    """
+    Total area covered by the union of the rectangles (overlaps counted once)
+    Sweep a vertical line over the x-edges; a segment tree tracks the covered y-length
+    O(n log n) for n rectangles
+    """
+    boxes = [b for b in _boxes(shapes) if b[2] > b[0] and b[3] > b[1]]
+    if not boxes:
+        return 0.0
+
+    ys = sorted({b[1] for b in boxes} | {b[3] for b in boxes})
+    events = []
+    for xmin, ymin, xmax, ymax in boxes:
+        lo = bisect.bisect_left(ys, ymin)
+        hi = bisect.bisect_left(ys, ymax)
+        events.append((xmin, 1, lo, hi))
+        events.append((xmax, -1, lo, hi))
+    events.sort()
+
+    tree = _CoverageTree(ys)
+    total = 0.0
+    prev_x = events[0][0]
+    for x, delta, lo, hi in events:
+        total += tree.covered() * (x - prev_x)
+        tree.update(lo, hi, delta)
+        prev_x = x
+    return total
+
+
+class _ActiveIntervals:
+    """
+    The y-intervals of the rectangles the sweep line is inside, indexed by position in
+    the sorted distinct y values (leaf t is [ys[t], ys[t+1]))
+    A bottom-up segment tree keeps each interval at its O(log m) canonical nodes for
+    stabbing queries, and counts lower endpoints to find the intervals starting in a range
+    """
+
+    def __init__(self, size):
+        n = 1
+        while n < size:
+            n *= 2
+        self._n = n
+        self._cover = [None] * (2 * n)    # node -> {index: None} of intervals spanning it
+        self._starts = [0] * (2 * n)      # node -> number of intervals starting below it
+        self._by_start = {}               # lower endpoint position -> {index: None}
+
+    def _canonical(self, lo, hi):
+        # the O(log m) nodes whose leaves together are exactly lo .. hi-1
+        nodes = []
+        lo += self._n
+        hi += self._n
+        while lo < hi:
+            if lo & 1:
+                nodes.append(lo)
+                lo += 1
+            if hi & 1:
+                hi -= 1
+                nodes.append(hi)
+            lo >>= 1
+            hi >>= 1
+        return nodes
+
+    def add(self, index, lo, hi):
+        cover = self._cover
+        for node in self._canonical(lo, hi):
+            if cover[node] is None:
+                cover[node] = {}
+            cover[node][index] = None
+        node = lo + self._n
+        while node:
+            self._starts[node] += 1
+            node >>= 1
+        self._by_start.setdefault(lo, {})[index] = None
+
+    def remove(self, index, lo, hi):
+        for node in self._canonical(lo, hi):
+            del self._cover[node][index]
+        node = lo + self._n
+        while node:
+            self._starts[node] -= 1
+            node >>= 1
+        del self._by_start[lo][index]
+
+    def overlapping(self, lo, hi):
+        """Indices of intervals sharing a positive length with positions lo .. hi"""
+        found = []
+        # those spanning leaf lo: every canonical node on the path up from it
+        node = lo + self._n
+        while node:
+            if self._cover[node]:
+                found.extend(self._cover[node])
+            node >>= 1
+        # plus those starting strictly inside (they cannot span leaf lo); only
+        # subtrees holding at least one start are visited
+        starts, n = self._starts, self._n
+        stack = [node for node in self._canonical(lo + 1, hi) if starts[node]]
+        while stack:
+            node = stack.pop()
+            if node >= n:
+                found.extend(self._by_start[node - n])
+            else:
+                if starts[2 * node]:
+                    stack.append(2 * node)
+                if starts[2 * node + 1]:
+                    stack.append(2 * node + 1)
+        return found
+
+
+def overlapping_pairs(shapes):
+    """
+    All pairs of rectangles whose interiors overlap (touching edges do not count)
+    Returns a list of (i, j, intersection_area) with i < j, indices into the input
+    Sort by left edge and sweep. While many rectangles are open in x they are indexed
+    by their y-interval, so each one is compared only with those it overlaps in y as
+    well: O((n + k) log n) for n rectangles and k overlapping pairs, instead of O(n^2)
+    """
+    boxes = _boxes(shapes)
+    # a box with no width or height has no interior and overlaps nothing
+    live = [i for i, b in enumerate(boxes) if b[2] > b[0] and b[3] > b[1]]
+    order = sorted(live, key=lambda i: boxes[i][0])
+    ending = []        # heap of (xmax, index, ymin, ymax) for rectangles the sweep line is still inside
+    index = None       # _ActiveIntervals over them, built the first time there are many
+    rows = None        # index -> (ymin, ymax) as positions among the distinct y values
+    indexed = False
+    pairs = []
+    for i in order:
+        xmin, ymin, xmax, ymax = boxes[i]
+        while ending and ending[0][0] <= xmin:
+            j = heapq.heappop(ending)[1]
+            if indexed:
+                index.remove(j, *rows[j])
+        if indexed and len(ending) <= SCAN_LIMIT // 2:
+            for entry in ending:
+                index.remove(entry[1], *rows[entry[1]])
+            indexed = False
+        if indexed:
+            candidates = [(boxes[j][2], j, boxes[j][1], boxes[j][3]) for j in index.overlapping(*rows[i])]
+        else:
+            candidates = ending
+        for bx1, j, by0, by1 in candidates:
+            dy = (ymax if ymax < by1 else by1) - (ymin if ymin > by0 else by0)
+            if dy > 0:
+                # bx0 <= xmin by sweep order, and bx1 > xmin since it is still open
+                dx = (xmax if xmax < bx1 else bx1) - xmin
+                pairs.append((i, j, dx * dy) if i < j else (j, i, dx * dy))
+        heapq.heappush(ending, (xmax, i, ymin, ymax))
+        if indexed:
+            index.add(i, *rows[i])
+        elif len(ending) > SCAN_LIMIT:
+            # switching back and forth is amortized: the index is only dropped again
+            # after at least SCAN_LIMIT / 2 rectangles have closed
+            if index is None:
+                ys = sorted({boxes[j][1] for j in live} | {boxes[j][3] for j in live})
+                position = {y: k for k, y in enumerate(ys)}
+                rows = {j: (position[boxes[j][1]], position[boxes[j][3]]) for j in live}
+                index = _ActiveIntervals(len(ys))
+            for entry in ending:
+                index.add(entry[1], *rows[entry[1]])
+            indexed = True
+    pairs.sort()
+    return pairs
@@ -0,0 +1,309 @@
+import math
+import numpy as np
+from coordinate_geometry_toolkit.point import Point
+from coordinate_geometry_toolkit.vector import Vector
+from coordinate_geometry_toolkit.line import Line
+from coordinate_geometry_toolkit.circle import Circle
+from coordinate_geometry_toolkit.triangle import Triangle
+from coordinate_geometry_toolkit.rectangle import Rectangle
+from coordinate_geometry_toolkit.square import Square
+from coordinate_geometry_toolkit.polygon import Polygon
+from coordinate_geometry_toolkit.ellipse import Ellipse
+from coordinate_geometry_toolkit.hyperbola import Hyperbola
+from coordinate_geometry_toolkit.parabola import Parabola
+
+# Affine transforms
+# A Transform is a 3x3 homogeneous matrix. Chaining steps multiplies the matrices,
+# so any sequence of translations/rotations/scalings/reflections collapses into one
+# matrix, and apply() moves every vertex of every shape with a single matrix multiply.
+#
+# Shapes come back as new objects (the originals are untouched):
+# - Point, Line, Triangle, Polygon: vertices transformed
+# - Vector: linear part only (a vector is a direction, translation does not move it)
+# - Rectangle/Square: stay rectangles while the transform keeps the axes axis-aligned,
+#   otherwise become a 4-vertex Polygon
+# - Circle/Ellipse/Hyperbola/Parabola: exact new parameters when the transform allows
+#   it (similarity for circles, axis-preserving for the axis-aligned conics).
+#   Otherwise circles and ellipses fall back to a sampled Polygon and the open
+#   conics raise ValueError, since their classes cannot represent the result.
+
+_TOL = 1e-12
+
+
+class Transform:
+
+    def __init__(self, matrix=None):
+        if matrix is None:
+            self._m = np.eye(3)
+        else:
+            m = np.array(matrix, dtype=float)
+            if m.shape == (2, 3):
+                m = np.vstack([m, [0.0, 0.0, 1.0]])
+            if m.shape != (3, 3):
+                raise ValueError("Transform matrix must be 3x3 (or the top 2x3 rows)")
+            self._m = m
+
+    @property
+    def matrix(self):
+        return self._m.copy()
+
+    def __str__(self):
+        a, b, c = self._m[0]
+        d, e, f = self._m[1]
+        return f"Transform [[{a:.4g}, {b:.4g}, {c:.4g}], [{d:.4g}, {e:.4g}, {f:.4g}], [0, 0, 1]]"
+
+    def __repr__(self):
+        return self.__str__()
+
+    def __eq__(self, other):
+        return isinstance(other, Transform) and np.allclose(self._m, other._m)
+
+    # ---------- building blocks ----------
+
+    @classmethod
+    def identity(cls):
+        return cls()
+
+    @classmethod
+    def translation(cls, dx, dy):
+        return cls([[1, 0, dx], [0, 1, dy], [0, 0, 1]])
+
+    @classmethod
+    def rotation(cls, angle_degrees, about: Point = None):
+        """Counter-clockwise rotation, about the origin or about a given point"""
+        theta = math.radians(angle_degrees)
+        c, s = math.cos(theta), math.sin(theta)
+        t = cls([[c, -s, 0], [s, c, 0], [0, 0, 1]])
+        return t._about(about)
+
+    @classmethod
+    def scaling(cls, sx, sy=None, about: Point = None):
+        sy = sx if sy is None else sy
+        return cls([[sx, 0, 0], [0, sy, 0], [0, 0, 1]])._about(about)
+
+    @classmethod
+    def reflection_x_axis(cls):
+        return cls.scaling(1, -1)
+
+    @classmethod
+    def reflection_y_axis(cls):
+        return cls.scaling(-1, 1)
+
+    @classmethod
+    def reflection_origin(cls):
+        return cls.scaling(-1, -1)
+
+    def _about(self, point):
+        # conjugate by a translation so the fixed point is `point` instead of the origin
+        if point is None:
+            return self
+        return Transform.translation(-point.x, -point.y).then(self).then(Transform.translation(point.x, point.y))
+
+    # ---------- composition ----------
+
+    def then(self, other):
+        """This transform followed by other (one combined matrix)"""
+        return Transform(other._m @ self._m)
+
+    def __matmul__(self, other):
+        # matrix convention: (A @ B) applies B first, then A
+        return Transform(self._m @ other._m)
+
+    def inverse(self):
+        if abs(np.linalg.det(self._m[:2, :2])) < _TOL:
+            raise ValueError("Transform is singular and has no inverse")
+        return Transform(np.linalg.inv(self._m))
+
+    # ---------- properties of the linear part ----------
+
+    def _axis_map(self):
+        """
+        ('diagonal', sx, sy) when x stays along x and y along y,
+        ('swap', p, q) when x' = p*y and y' = q*x, otherwise None
+        """
+        (a, b), (c, d) = self._m[:2, :2]
+        if abs(b) < _TOL and abs(c) < _TOL:
+            return ("diagonal", a, d)
+        if abs(a) < _TOL and abs(d) < _TOL:
+            return ("swap", b, c)
+        return None
+
+    def similarity_scale(self):
+        """Uniform scale factor if the linear part is rotation/reflection times a scale, else None"""
+        (a, b), (c, d) = self._m[:2, :2]
+        scale = math.hypot(a, c)
+        rotation = math.isclose(a, d, abs_tol=_TOL) and math.isclose(b, -c, abs_tol=_TOL)
+        reflection = math.isclose(a, -d, abs_tol=_TOL) and math.isclose(b, c, abs_tol=_TOL)
+        if (rotation or reflection) and math.isclose(math.hypot(b, d), scale, rel_tol=1e-9):
+            return scale
+        return None
+
+    # ---------- applying ----------
+
+    def apply_points(self, xs, ys):
+        """Transform coordinate arrays, returns (xs', ys')"""
+        xs = np.asarray(xs, dtype=float)
+        ys = np.asarray(ys, dtype=float)
+        m = self._m
+        return (m[0, 0] * xs + m[0, 1] * ys + m[0, 2],
+                m[1, 0] * xs + m[1, 1] * ys + m[1, 2])
+
+    def apply_point(self, point: Point):
+        m = self._m
+        return Point(m[0, 0] * point.x + m[0, 1] * point.y + m[0, 2],
+                     m[1, 0] * point.x + m[1, 1] * point.y + m[1, 2])
+
+    def apply_shape(self, shape, samples=100):
+        return self.apply([shape], samples=samples)[0]
+
+    def apply(self, shapes, samples=100):
+        """
+        Transform a whole scene in one pass
+        Every control point of every shape is packed into one 3xN buffer,
+        multiplied by the matrix once, and the shapes are rebuilt from the result
+        samples : points used when a circle/ellipse has to become a Polygon
+        """
+        shapes = list(shapes)
+        coords = []      # flat list of x, y pairs
+        plans = []       # (rebuild function, start, count) per shape
+        for shape in shapes:
+            points, rebuild = self._plan(shape, samples)
+            plans.append((rebuild, len(coords), len(points)))
+            coords.extend(points)
+
+        buffer = np.ones((3, len(coords)))
+        if coords:
+            buffer[:2] = np.array(coords, dtype=float).T
+        moved = self._m @ buffer
+        xs, ys = moved[0].tolist(), moved[1].tolist()
+
+        result = []
+        for rebuild, start, count in plans:
+            pts = [Point(xs[i], ys[i]) for i in range(start, start + count)]
+            result.append(rebuild(pts))
+        return result
+
+    def _plan(self, shape, samples):
+        # (control points, function rebuilding the shape from the transformed points)
+        if isinstance(shape, Point):
+            return [(shape.x, shape.y)], lambda pts: pts[0]
+
+        if isinstance(shape, Vector):
+            # directions ignore translation: transform the tip and the origin, take the difference
+            return [(0.0, 0.0), (shape._x, shape._y)], \
+                lambda pts: Vector(pts[1].x - pts[0].x, pts[1].y - pts[0].y)
+
+        if isinstance(shape, Line):
+            return [(shape.p1.x, shape.p1.y), (shape.p2.x, shape.p2.y)], lambda pts: Line(pts[0], pts[1])
+
+        if isinstance(shape, Triangle):
+            return [(p.x, p.y) for p in (shape.p1, shape.p2, shape.p3)], lambda pts: Triangle(*pts)
+
+        if isinstance(shape, Rectangle):
+            xmin, ymin, xmax, ymax = shape.bounding_box()
+            corners = [(xmin, ymin), (xmax, ymin), (xmax, ymax), (xmin, ymax)]
+            return corners, self._rebuild_rectangle(shape)
+
+        if isinstance(shape, Polygon):
+            return [(p.x, p.y) for p in shape.vertices], lambda pts: Polygon(pts)
+
+        if isinstance(shape, Circle):
+            return self._plan_circle(shape, samples)
+
+        if isinstance(shape, Ellipse):
+            return self._plan_ellipse(shape, samples)
+
+        if isinstance(shape, Hyperbola):
+            return self._plan_hyperbola(shape)
+
+        if isinstance(shape, Parabola):
+            return self._plan_parabola(shape)
+
+        raise TypeError(f"Transform cannot be applied to {type(shape).__name__}")
+
+    def _rebuild_rectangle(self, shape):
+        square = isinstance(shape, Square)
+
+        def rebuild(pts):
+            if self._axis_map() is None:
+                return Polygon(pts)
+            xs = [p.x for p in pts]
+            ys = [p.y for p in pts]
+            low, high = Point(min(xs), min(ys)), Point(max(xs), max(ys))
+            if square and math.isclose(high.x - low.x, high.y - low.y, rel_tol=1e-9):
+                return Square(low, high)
+            return Rectangle(low, high)
+        return rebuild
+
+    def _plan_circle(self, circle, samples):
+        center = [(circle.center.x, circle.center.y)]
+        scale = self.similarity_scale()
+        if scale is not None:
+            return center, lambda pts: Circle(pts[0], circle.radius * scale)
+        axes = self._axis_map()
+        if axes is not None:
+            # axis-aligned stretch turns the circle into an axis-aligned ellipse
+            _, p, q = axes
+            rx, ry = abs(p) * circle.radius, abs(q) * circle.radius
+            return center, lambda pts: _axis_ellipse(pts[0], rx, ry)
+        return [(p.x, p.y) for p in circle.generate_points(samples)], lambda pts: Polygon(pts)
+
+    def _plan_ellipse(self, ellipse, samples):
+        center = [(ellipse.center.x, ellipse.center.y)]
+        axes = self._axis_map()
+        if axes is None:
+            return [(p.x, p.y) for p in ellipse.generate_points(samples)[:-1]], lambda pts: Polygon(pts)
+        kind, p, q = axes
+        # extents along x and y before the transform
+        if ellipse.orientation == "horizontal":
+            rx, ry = ellipse.a, ellipse.b
+        else:
+            rx, ry = ellipse.b, ellipse.a
+        if kind == "diagonal":
+            new_rx, new_ry = abs(p) * rx, abs(q) * ry
+        else:
+            new_rx, new_ry = abs(p) * ry, abs(q) * rx
+        return center, lambda pts: _axis_ellipse(pts[0], new_rx, new_ry)
+
+    def _plan_hyperbola(self, hyperbola):
+        axes = self._axis_map()
+        if axes is None:
+            raise ValueError("Hyperbola only supports axis-preserving transforms")
+        kind, p, q = axes
+        horizontal = hyperbola.orientation == "horizontal"
+        # scale applied to the transverse (a) and conjugate (b) directions
+        if kind == "diagonal":
+            sa, sb = (p, q) if horizontal else (q, p)
+        else:
+            sa, sb = (q, p) if horizontal else (p, q)
+            horizontal = not horizontal
+        orientation = "horizontal" if horizontal else "vertical"
+        return [(hyperbola.center.x, hyperbola.center.y)], \
+            lambda pts: Hyperbola(pts[0], abs(sa) * hyperbola.a, abs(sb) * hyperbola.b, orientation)
+
+    def _plan_parabola(self, parabola):
+        axes = self._axis_map()
+        if axes is None:
+            raise ValueError("Parabola only supports axis-preserving transforms")
+        kind, p, q = axes
+        vertical = parabola.orientation == "vertical"
+        a = parabola.a
+        # (x-h)² = 4a(y-k) under x' = p x, y' = q y gives (x'-h')² = 4 (a p²/q)(y'-k'), etc.
+        if kind == "diagonal":
+            new_a = a * p * p / q if vertical else a * q * q / p
+        else:
+            new_a = a * q * q / p if vertical else a * p * p / q
+            vertical = not vertical
+
+        def rebuild(pts):
+            v = pts[0]
+            focus = Point(v.x, v.y + new_a) if vertical else Point(v.x + new_a, v.y)
+            return Parabola(v, focus)
+        return [(parabola.vertex.x, parabola.vertex.y)], rebuild
+
+
+def _axis_ellipse(center, rx, ry):
+    # Ellipse wants a >= b plus an orientation
+    if rx >= ry:
+        return Ellipse(center, rx, ry, "horizontal")
+    return Ellipse(center, ry, rx, "vertical")
@@ -3,6 +3,7 @@
 import math
 from coordinate_geometry_toolkit.point import Point  # added import for Point class
 from coordinate_geometry_toolkit.base import Shape    # added import for Shape class
+from coordinate_geometry_toolkit.cache import copy_point
 
 class Triangle(Shape):
 
@@ -21,6 +22,18 @@ class Triangle(Shape):
     def __repr__(self):
         return self.__str__()
 
+    # the public defining attributes are part of the stamp, so assigning one is seen
+    def _stamp(self):
+        return (self._version, Point.generation, self.p1, self.p2, self.p3)
+
+    def _cache_key(self):
+        return (self.p1.x, self.p1.y, self.p2.x, self.p2.y, self.p3.x, self.p3.y)
+
+    def _compute_bounding_box(self):
+        xs = (self.p1.x, self.p2.x, self.p3.x)
+        ys = (self.p1.y, self.p2.y, self.p3.y)
+        return (min(xs), min(ys), max(xs), max(ys))
+
     def side_length(self):
         a = self.p1.distance_bw_two_points(self.p2)
         b = self.p2.distance_bw_two_points(self.p3)
@@ -101,8 +114,11 @@ class Triangle(Shape):
         y_cod = (self.a * self.p1.y + self.b * self.p2.y + self.c * self.p3.y) / (self.a + self.b + self.c)  # changed _y to y
         return Point(x_cod, y_cod)
 
-# circumcenter of triangle
+# circumcenter of triangle (memoized, see cache.py)
     def circumcenter(self):
+        return self._memoized("circumcenter", (), self._circumcenter, copy_point)
+
+    def _circumcenter(self):
         if self.is_collinear():
             return "Collinear. Can't find circumcenter"
 
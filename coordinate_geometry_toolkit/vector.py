@@ -1,6 +1,16 @@
 import math
+from functools import lru_cache
 from coordinate_geometry_toolkit.point import Point
 
+
+# cos and sin of an angle in degrees
+# cached because animations rotate many vectors by the same few angles
+@lru_cache(maxsize=4096)
+def cos_sin_degrees(angle_degrees):
+    angle_rad = math.radians(angle_degrees)
+    return math.cos(angle_rad), math.sin(angle_rad)
+
+
 class Vector:
     def __init__(self, x, y):
         self._x = x
@@ -48,7 +58,7 @@ class Vector:
     def __mul__(self, scalar):
         return Vector(self._x * scalar, self._y * scalar)
     
-    def __true_div__(self, scalar):
+    def __truediv__(self, scalar):
         if scalar == 0:
             raise ValueError("Cannot divide by zero")
         return Vector(self._x / scalar, self._y / scalar)
@@ -98,6 +108,12 @@ class Vector:
         angle_rad = math.acos(self.dot(other) / mag_product)
         return math.degrees(angle_rad)
 
+    def bounding_box(self):
+        """
+        Bounding box (xmin, ymin, xmax, ymax) of the arrow drawn from the origin to the tip
+        """
+        return (min(0, self._x), min(0, self._y), max(0, self._x), max(0, self._y))
+
     def is_zero_vector(self):
         """
         Checks if the vector is a zero vector (both components are zero)
@@ -200,9 +216,7 @@ class Vector:
         Rotates the vector by a given angle in degrees
         Formula: v' = (x*cos(θ) - y*sin(θ), x*sin(θ) + y*cos(θ))
         """
-        angle_rad = math.radians(angle_degrees)
-        cos_angle = math.cos(angle_rad)
-        sin_angle = math.sin(angle_rad)
+        cos_angle, sin_angle = cos_sin_degrees(angle_degrees)
         new_x = self._x * cos_angle - self._y * sin_angle
         new_y = self._x * sin_angle + self._y * cos_angle
         return Vector(new_x, new_y)
@@ -220,9 +234,7 @@ class Vector:
         translated_y =self._y -point._y
 
         # Step2:Rotate it 
-        angle_rad=  math.radians(angle_degrees)
-        cos_angle =math.cos(angle_rad)
-        sin_angle = math.sin(angle_rad)
+        cos_angle, sin_angle = cos_sin_degrees(angle_degrees)
         rotated_x = translated_x * cos_angle - translated_y * sin_angle
         rotated_y= translated_x * sin_angle + translated_y * cos_angle
 
@@ -238,4 +250,87 @@ class Vector:
         if r == 0:
             return (0.0, None)
         theta = math.degrees(math.atan2(self._y, self._x)) % 360
-        return (r, theta)
\ No newline at end of file
+        return (r, theta)
+
+
+class MutableVector(Vector):
+    """
+    Opt-in mutable vector for simulation loops
+    The in-place operators (+=, -=, *=, /=) and the named iadd/isub/imul/itruediv
+    methods update the components of this object instead of creating a new one,
+    and iadd_scaled does pos += vel * dt without the temporary vel * dt vector.
+    Regular operators (+, -, * ...) still return a new immutable Vector.
+    """
+
+    @classmethod
+    def from_vector(cls, vector: Vector):
+        return cls(vector._x, vector._y)
+
+    def to_vector(self):
+        # immutable snapshot of the current value
+        return Vector(self._x, self._y)
+
+    # Getter and Setter for x
+    @property
+    def x(self):
+        return self._x
+
+    @x.setter
+    def x(self, value):
+        self._x = value
+
+    # Getter and Setter for y
+    @property
+    def y(self):
+        return self._y
+
+    @y.setter
+    def y(self, value):
+        self._y = value
+
+    def set(self, x, y):
+        self._x = x
+        self._y = y
+        return self
+
+    def iadd(self, other):
+        self._x += other._x
+        self._y += other._y
+        return self
+
+    def isub(self, other):
+        self._x -= other._x
+        self._y -= other._y
+        return self
+
+    def imul(self, scalar):
+        self._x *= scalar
+        self._y *= scalar
+        return self
+
+    def itruediv(self, scalar):
+        if scalar == 0:
+            raise ValueError("Cannot divide by zero")
+        self._x /= scalar
+        self._y /= scalar
+        return self
+
+    def iadd_scaled(self, other, scalar):
+        """
+        self += other * scalar, in place (e.g. pos.iadd_scaled(vel, dt))
+        """
+        self._x += other._x * scalar
+        self._y += other._y * scalar
+        return self
+
+    def __iadd__(self, other):
+        return self.iadd(other)
+
+    def __isub__(self, other):
+        return self.isub(other)
+
+    def __imul__(self, scalar):
+        return self.imul(scalar)
+
+    def __itruediv__(self, scalar):
+        return self.itruediv(scalar)
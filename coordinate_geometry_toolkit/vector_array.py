@@ -0,0 +1,370 @@
+import numpy as np
+from coordinate_geometry_toolkit.point import Point
+from coordinate_geometry_toolkit.vector import Vector, cos_sin_degrees
+
+# Columnar vectors
+# VectorArray stores many 2D vectors as two float arrays (x and y) and mirrors the
+# Vector API, but every operation runs over the whole column at once.
+# The other operand can be a VectorArray of the same length or a single Vector/Point,
+# which is broadcast to every row.
+#
+# Methods that produce vectors or numbers take an optional out= argument
+# (a VectorArray, or a float array for scalar results) and write the answer there.
+# out=self updates in place. With out= given, the arithmetic runs through numpy
+# ufuncs into existing buffers (plus two scratch rows cached on the array), so a
+# steady-state loop does not allocate new arrays.
+
+
+class VectorArray:
+
+    def __init__(self, x, y):
+        self._x = np.array(x, dtype=float, copy=True).reshape(-1)
+        self._y = np.array(y, dtype=float, copy=True).reshape(-1)
+        if self._x.shape != self._y.shape:
+            raise ValueError("x and y must have the same length")
+        self._tmp = None     # (2, n) float scratch, created on first out= call
+        self._mask = None    # (n,) bool scratch
+
+    # ---------- construction ----------
+
+    @classmethod
+    def _wrap(cls, x, y):
+        # take ownership of freshly computed arrays without copying them
+        obj = cls.__new__(cls)
+        obj._x, obj._y = x, y
+        obj._tmp = obj._mask = None
+        return obj
+
+    @classmethod
+    def zeros(cls, n):
+        return cls._wrap(np.zeros(n), np.zeros(n))
+
+    @classmethod
+    def empty(cls, n):
+        return cls._wrap(np.empty(n), np.empty(n))
+
+    @classmethod
+    def from_vectors(cls, vectors: list[Vector]):
+        return cls([v._x for v in vectors], [v._y for v in vectors])
+
+    @classmethod
+    def from_points(cls, points: list[Point]):
+        return cls([p.x for p in points], [p.y for p in points])
+
+    def to_vectors(self):
+        return [Vector(float(x), float(y)) for x, y in zip(self._x, self._y)]
+
+    def copy(self):
+        return VectorArray(self._x, self._y)
+
+    # ---------- container protocol ----------
+
+    @property
+    def x(self):
+        return self._x
+
+    @property
+    def y(self):
+        return self._y
+
+    def __len__(self):
+        return self._x.shape[0]
+
+    def __getitem__(self, index):
+        if isinstance(index, (int, np.integer)):
+            return Vector(float(self._x[index]), float(self._y[index]))
+        return VectorArray(self._x[index], self._y[index])
+
+    def __iter__(self):
+        for x, y in zip(self._x, self._y):
+            yield Vector(float(x), float(y))
+
+    def __str__(self):
+        return f"VectorArray of {len(self)} vectors"
+
+    def __repr__(self):
+        return f"VectorArray(x={self._x!r}, y={self._y!r})"
+
+    # ---------- helpers ----------
+
+    @staticmethod
+    def _components(other):
+        # (x, y) of the other operand: arrays for a VectorArray, scalars for a Vector/Point
+        if isinstance(other, VectorArray):
+            return other._x, other._y
+        if isinstance(other, (Vector, Point)):
+            return other._x, other._y
+        raise TypeError(f"Expected VectorArray, Vector or Point, got {type(other).__name__}")
+
+    def _scratch(self):
+        n = len(self)
+        if self._tmp is None or self._tmp.shape[1] != n:
+            self._tmp = np.empty((2, n))
+            self._mask = np.empty(n, dtype=bool)
+        return self._tmp[0], self._tmp[1], self._mask
+
+    def _target(self, out):
+        # VectorArray to write vector results into
+        if out is None:
+            return VectorArray.empty(len(self))
+        if len(out) != len(self):
+            raise ValueError("out must have the same length as this array")
+        return out
+
+    def _scalar_target(self, out):
+        if out is None:
+            return np.empty(len(self))
+        if out.shape != self._x.shape:
+            raise ValueError("out must have the same length as this array")
+        return out
+
+    # ---------- arithmetic ----------
+
+    def add(self, other, out=None):
+        ox, oy = self._components(other)
+        out = self._target(out)
+        np.add(self._x, ox, out=out._x)
+        np.add(self._y, oy, out=out._y)
+        return out
+
+    def subtract(self, other, out=None):
+        ox, oy = self._components(other)
+        out = self._target(out)
+        np.subtract(self._x, ox, out=out._x)
+        np.subtract(self._y, oy, out=out._y)
+        return out
+
+    def scale(self, scalar, out=None):
+        # scalar may be a number or an array with one factor per vector
+        out = self._target(out)
+        np.multiply(self._x, scalar, out=out._x)
+        np.multiply(self._y, scalar, out=out._y)
+        return out
+
+    def divide(self, scalar, out=None):
+        # a plain comparison for one number; np.all reduces an array of factors
+        # without building a temporary mask
+        if (scalar == 0) if np.ndim(scalar) == 0 else not np.all(scalar):
+            raise ValueError("Cannot divide by zero")
+        out = self._target(out)
+        np.divide(self._x, scalar, out=out._x)
+        np.divide(self._y, scalar, out=out._y)
+        return out
+
+    def translate(self, dx, dy, out=None):
+        out = self._target(out)
+        np.add(self._x, dx, out=out._x)
+        np.add(self._y, dy, out=out._y)
+        return out
+
+    def __add__(self, other):
+        return self.add(other)
+
+    def __sub__(self, other):
+        return self.subtract(other)
+
+    def __mul__(self, scalar):
+        return self.scale(scalar)
+
+    def __rmul__(self, scalar):
+        return self.scale(scalar)
+
+    def __truediv__(self, scalar):
+        return self.divide(scalar)
+
+    def __neg__(self):
+        return self.reflect_origin()
+
+    # in-place operators update the existing buffers
+    def __iadd__(self, other):
+        return self.add(other, out=self)
+
+    def __isub__(self, other):
+        return self.subtract(other, out=self)
+
+    def __imul__(self, scalar):
+        return self.scale(scalar, out=self)
+
+    def __itruediv__(self, scalar):
+        return self.divide(scalar, out=self)
+
+    # ---------- products and measures ----------
+
+    def magnitude(self, out=None):
+        # |v| = √(x² + y²)
+        return np.hypot(self._x, self._y, out=self._scalar_target(out))
+
+    def dot(self, other, out=None):
+        # x1*x2 + y1*y2
+        ox, oy = self._components(other)
+        out = self._scalar_target(out)
+        _, t, _ = self._scratch()   # second row, so callers may pass the first as out
+        np.multiply(self._x, ox, out=out)
+        np.multiply(self._y, oy, out=t)
+        np.add(out, t, out=out)
+        return out
+
+    def cross(self, other, out=None):
+        # 2D cross product (scalar): x1*y2 - y1*x2
+        ox, oy = self._components(other)
+        out = self._scalar_target(out)
+        _, t, _ = self._scratch()   # second row, so callers may pass the first as out
+        np.multiply(self._x, oy, out=out)
+        np.multiply(self._y, ox, out=t)
+        np.subtract(out, t, out=out)
+        return out
+
+    def angle_with(self, other, out=None):
+        """
+        Angle with other in degrees, cosθ = (v1·v2) / (|v1||v2|)
+        NaN where either vector is zero (Vector.angle_with returns None there)
+        """
+        ox, oy = self._components(other)
+        out = self.dot(other, out=out)
+        t0, t1, mask = self._scratch()
+        np.hypot(self._x, self._y, out=t0)
+        np.hypot(ox, oy, out=t1)
+        np.multiply(t0, t1, out=t0)
+        np.equal(t0, 0, out=mask)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            np.divide(out, t0, out=out)
+        np.clip(out, -1.0, 1.0, out=out)   # guard acos against rounding just past ±1
+        np.arccos(out, out=out)
+        np.degrees(out, out=out)
+        np.copyto(out, np.nan, where=mask)
+        return out
+
+    def projection_on(self, other, out=None):
+        """
+        Projection of each vector on other: (v1·v2 / |v2|²) * v2
+        Zero vector where |v2| = 0
+        """
+        ox, oy = self._components(other)
+        t0, t1, mask = self._scratch()
+        self.dot(other, out=t0)
+        np.hypot(ox, oy, out=t1)
+        np.square(t1, out=t1)
+        np.equal(t1, 0, out=mask)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            np.divide(t0, t1, out=t0)
+        np.copyto(t0, 0.0, where=mask)
+        out = self._target(out)
+        np.multiply(ox, t0, out=out._x)
+        np.multiply(oy, t0, out=out._y)
+        return out
+
+    def unit_vector(self, out=None):
+        """
+        u = v / |v|, zero vector where |v| = 0
+        """
+        t0, _, mask = self._scratch()
+        np.hypot(self._x, self._y, out=t0)
+        np.equal(t0, 0, out=mask)
+        out = self._target(out)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            np.divide(self._x, t0, out=out._x)
+            np.divide(self._y, t0, out=out._y)
+        np.copyto(out._x, 0.0, where=mask)
+        np.copyto(out._y, 0.0, where=mask)
+        return out
+
+    # ---------- transformations ----------
+
+    def rotate(self, angle_degrees, out=None):
+        """
+        Rotate every vector by angle_degrees (a number, or one angle per vector)
+        Formula: v' = (x*cos(θ) - y*sin(θ), x*sin(θ) + y*cos(θ))
+        """
+        cos_angle, sin_angle = _cos_sin(angle_degrees)
+        return self._rotate(cos_angle, sin_angle, out)
+
+    def _rotate(self, cos_angle, sin_angle, out):
+        t0, t1, _ = self._scratch()
+        out = self._target(out)
+        # keep x*sin and y*sin before out (which may be self) is overwritten
+        np.multiply(self._x, sin_angle, out=t0)
+        np.multiply(self._y, sin_angle, out=t1)
+        np.multiply(self._x, cos_angle, out=out._x)
+        np.subtract(out._x, t1, out=out._x)
+        np.multiply(self._y, cos_angle, out=out._y)
+        np.add(out._y, t0, out=out._y)
+        return out
+
+    def rotate_about_point(self, angle_degrees, point, out=None):
+        """
+        Rotate every vector about point: translate to origin, rotate, translate back
+        point : a single Point/Vector, or a VectorArray with one pivot per vector
+        """
+        px, py = self._components(point)
+        out = self.subtract(point, out=out)
+        out.rotate(angle_degrees, out=out)
+        return out.translate(px, py, out=out)
+
+    def reflect_x_axis(self, out=None):
+        # v' = (x, -y)
+        out = self._target(out)
+        np.copyto(out._x, self._x)
+        np.negative(self._y, out=out._y)
+        return out
+
+    def reflect_y_axis(self, out=None):
+        # v' = (-x, y)
+        out = self._target(out)
+        np.negative(self._x, out=out._x)
+        np.copyto(out._y, self._y)
+        return out
+
+    def reflect_origin(self, out=None):
+        # v' = (-x, -y)
+        out = self._target(out)
+        np.negative(self._x, out=out._x)
+        np.negative(self._y, out=out._y)
+        return out
+
+    def to_polar(self, out=None):
+        """
+        Polar form (r, θ) with θ in degrees in [0, 360); θ is NaN for zero vectors
+        out : optional (r, theta) pair of float arrays
+        """
+        if out is None:
+            r, theta = np.empty(len(self)), np.empty(len(self))
+        else:
+            r, theta = out
+        np.hypot(self._x, self._y, out=r)
+        np.arctan2(self._y, self._x, out=theta)
+        np.degrees(theta, out=theta)
+        np.mod(theta, 360.0, out=theta)
+        _, _, mask = self._scratch()
+        np.equal(r, 0, out=mask)
+        np.copyto(theta, np.nan, where=mask)
+        return r, theta
+
+
+def _cos_sin(angle_degrees):
+    """
+    cos/sin for one angle or an array of angles (degrees)
+    A single angle goes through the cached cos_sin_degrees; arrays use numpy trig,
+    which is faster than any per-angle lookup and leaves the cache alone
+    """
+    if np.ndim(angle_degrees) == 0:
+        return cos_sin_degrees(float(angle_degrees))
+    radians = np.deg2rad(angle_degrees)
+    return np.cos(radians), np.sin(radians)
+
+
+def rotate_many(vectors, angle_degrees, pivots=None, out=None):
+    """
+    Rotate many vectors in one call
+    vectors       : VectorArray or list of Vector
+    angle_degrees : one angle for all, or an array with one angle per vector
+    pivots        : None (origin), a single Point/Vector, or one pivot per vector
+                    (VectorArray, or list of Point/Vector)
+    Returns a VectorArray (written into out when given)
+    """
+    if not isinstance(vectors, VectorArray):
+        vectors = VectorArray.from_vectors(vectors)
+    if pivots is None:
+        return vectors.rotate(angle_degrees, out=out)
+    if isinstance(pivots, (list, tuple)):
+        pivots = VectorArray([p._x for p in pivots], [p._y for p in pivots])
+    return vectors.rotate_about_point(angle_degrees, pivots, out=out)
@@ -1,15 +1,9 @@
 import streamlit as st
-import matplotlib.pyplot as plt
-import numpy as np
 import io
 import json
 import inspect
 import math
 from typing import Any
-from reportlab.lib import colors
-from reportlab.lib.pagesizes import letter
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Image
-from reportlab.lib.styles import getSampleStyleSheet
 import csv
 import sys
 import os
@@ -18,37 +12,44 @@ import os
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 try:
-    # Using absolute imports with the path fix above
-    from coordinate_geometry_toolkit.point import Point
-    from coordinate_geometry_toolkit.line import Line
-    from coordinate_geometry_toolkit.circle import Circle
-    from coordinate_geometry_toolkit.vector import Vector
-    from coordinate_geometry_toolkit.triangle import Triangle
-    from coordinate_geometry_toolkit.rectangle import Rectangle
-    from coordinate_geometry_toolkit.square import Square
-    from coordinate_geometry_toolkit.polygon import Polygon
-    from coordinate_geometry_toolkit.ellipse import Ellipse
-    from coordinate_geometry_toolkit.hyperbola import Hyperbola
-    from coordinate_geometry_toolkit.parabola import Parabola
+    # Using absolute imports with the path fix above; the package loads each class on first use
+    from coordinate_geometry_toolkit import (Point, Line, Circle, Vector, Triangle, Rectangle, Square, Polygon,
+                                             Ellipse, Hyperbola, Parabola, Scene)
 except Exception as e:
     st.error(f"Could not import modules: {str(e)}")
     # Provide a minimal fallback so the rest of the script doesn't crash during inspection.
-    Point = Line = Circle = Vector = Triangle = Rectangle = Square = Polygon = Ellipse = Hyperbola = Parabola = object
+    Point = Line = Circle = Vector = Triangle = Rectangle = Square = Polygon = Ellipse = Hyperbola = Parabola = Scene = object
 
 # Utilities
 
-COLOR_CYCLE = plt.rcParams['axes.prop_cycle'].by_key()['color']
+# matplotlib and reportlab are heavy, so they are imported on first use instead of at startup
+def pyplot():
+    import matplotlib.pyplot as plt
+    return plt
+
+# matplotlib's default property cycle (Tab10), spelled out so adding a shape never imports pyplot
+COLOR_CYCLE = ['#1f77b4', '#ff7f0e', '#2ca02c', '#d62728', '#9467bd',
+               '#8c564b', '#e377c2', '#7f7f7f', '#bcbd22', '#17becf']
+
+# Polygons above this many vertices are plotted from a Douglas–Peucker outline
+LOD_VERTEX_THRESHOLD = 500
+LOD_TOLERANCE_FRACTION = 1e-3  # of the polygon's largest extent
+# Curves are sampled so the drawn polyline stays within this fraction of their size
+PLOT_CURVE_TOLERANCE = 1e-3
 
 def new_color(idx: int) -> str:
     return COLOR_CYCLE[idx % len(COLOR_CYCLE)]
 
-def uid() -> str:
-    import time, random
-    return f"s{int(time.time()*1000)}_{random.randint(0,9999)}"
-
-# Store shapes as dicts: {id, type, obj, name, color}
+# Store shapes as dicts: {id, type, obj, name, color} in drawing order; the scene
+# indexes the same objects under the same ids for bounding-box queries
 if 'shapes' not in st.session_state:
     st.session_state.shapes = []
+if 'scene' not in st.session_state:
+    st.session_state.scene = Scene()
+    for s in st.session_state.shapes:
+        s['id'] = st.session_state.scene.add(s['obj'])
+if 'plot_geometry' not in st.session_state:
+    st.session_state.plot_geometry = {}   # shape id -> shape_geometry(), see plot_all
 if 'last_color_index' not in st.session_state:
     st.session_state.last_color_index = 0
 
@@ -57,7 +58,7 @@ if 'last_color_index' not in st.session_state:
 def add_shape(shape_type: str, obj: Any, name: str = None):
     st.session_state.last_color_index += 1
     entry = {
-        'id': uid(),
+        'id': st.session_state.scene.add(obj),
         'type': shape_type,
         'obj': obj,
         'name': name or f"{shape_type}_{len(st.session_state.shapes)+1}",
@@ -68,74 +69,28 @@ def add_shape(shape_type: str, obj: Any, name: str = None):
 
 def undo_last():
     if st.session_state.shapes:
-        return st.session_state.shapes.pop()
+        entry = st.session_state.shapes.pop()
+        st.session_state.scene.remove(entry['id'])
+        return entry
     return None
 
+def delete_shape(index: int):
+    entry = st.session_state.shapes.pop(index)
+    st.session_state.scene.remove(entry['id'])
+    return entry
+
 def clear_shapes():
     st.session_state.shapes = []
+    st.session_state.scene.clear()
     st.session_state.last_color_index = 0
 
-# Calculate bounding box from shapes using best-effort
+# Calculate bounding box from the scene index (its root box covers every shape)
 def compute_bbox(margin=1.0):
-    xs, ys = [], []
-    for s in st.session_state.shapes:
-        t = s['type']
-        o = s['obj']
-        try:
-            if t == 'Point':
-                xs.append(o.x); ys.append(o.y)
-            elif t == 'Line':
-                xs.extend([o.p1.x, o.p2.x]); ys.extend([o.p1.y, o.p2.y])
-            elif t == 'Circle':
-                xs.extend([o.center.x - o.radius, o.center.x + o.radius]); ys.extend([o.center.y - o.radius, o.center.y + o.radius])
-            elif t == 'Vector':
-                xs.extend([0, o._x]); ys.extend([0, o._y])
-            elif t in ('Triangle','Polygon'):
-                pts = getattr(o, 'vertices', None)
-                if pts is None:
-                    pts = [o.p1, o.p2, getattr(o,'p3',None)]
-                # Filter out None values
-                pts = [p for p in pts if p is not None]
-                for p in pts:
-                    xs.append(p.x); ys.append(p.y)
-            elif t in ('Rectangle','Square'):
-                p1, p2 = o.p1, o.p2
-                xs.extend([p1.x, p2.x]); ys.extend([p1.y, p2.y])
-            elif t == 'Ellipse':
-                xs.extend([o.center.x - o.a, o.center.x + o.a]); ys.extend([o.center.y - o.b, o.center.y + o.b])
-            elif t == 'Hyperbola':
-                xs.extend([o.center.x - o.a*5, o.center.x + o.a*5]); ys.extend([o.center.y - o.b*5, o.center.y + o.b*5])
-            elif t == 'Parabola':
-                pts = []
-                try:
-                    pts = o.generate_points(n=200)
-                except Exception:
-                    # fall back to sampling around vertex and focus if available
-                    try:
-                        v = o.vertex
-                        h, k = v.x, v.y
-                        a = o.a
-                        if o.orientation == "vertical":
-                            tvals = np.linspace(-5,5,200)
-                            xs_vals = [h + tv for tv in tvals]
-                            ys_vals = [((x - h)**2) / (4 * a) + k for x in xs_vals]
-                        else:
-                            tvals = np.linspace(-5,5,200)
-                            ys_vals = [k + tv for tv in tvals]
-                            xs_vals = [((y - k)**2) / (4 * a) + h for y in ys_vals]
-                        xs.extend(xs_vals)
-                        ys.extend(ys_vals)
-                    except Exception:
-                        pass
-                for p in pts:
-                    xs.append(p.x); ys.append(p.y)
-        except Exception:
-            # ignore shape if attributes not as expected
-            pass
-    if not xs or not ys:
+    bbox = st.session_state.scene.bounding_box()
+    if bbox is None:
         return (-5 - margin, 5 + margin, -5 - margin, 5 + margin)
-    xmin, xmax = min(xs) - margin, max(xs) + margin
-    ymin, ymax = min(ys) - margin, max(ys) + margin
+    xmin, xmax = bbox[0] - margin, bbox[2] + margin
+    ymin, ymax = bbox[1] - margin, bbox[3] + margin
     # make square limits for neat view
     mx = max(xmax - xmin, ymax - ymin)
     cx = (xmin + xmax) / 2
@@ -144,7 +99,93 @@ def compute_bbox(margin=1.0):
 
 # ---------- Plotting ----------
 
-def plot_all(show_grid=True, show_axes=True, annotate=True):
+# What plot_all draws for one shape: polylines, point markers, circles, arrows from
+# the origin, and the label (suffix after the name, anchor, offset?). Kept per shape
+# id in st.session_state.plot_geometry, so sampling only reruns for changed shapes.
+def shape_geometry(t, o):
+    g = {'lines': [], 'markers': [], 'circles': [], 'arrows': [], 'label': None}
+    if t == 'Point':
+        g['markers'].append((o.x, o.y))
+        g['label'] = (f" ({o.x:.2f},{o.y:.2f})", (o.x, o.y), True)
+
+    elif t == 'Line':
+        x1, y1 = o.p1.x, o.p1.y
+        x2, y2 = o.p2.x, o.p2.y
+        g['lines'].append(([x1, x2], [y1, y2]))
+        g['label'] = ('', ((x1+x2)/2, (y1+y2)/2), False)
+
+    elif t == 'Circle':
+        g['circles'].append((o.center.x, o.center.y, o.radius))
+        g['label'] = (f" (r={o.radius:.2f})", (o.center.x + o.radius, o.center.y), False)
+
+    elif t == 'Vector':
+        g['arrows'].append((o._x, o._y))
+        g['label'] = ('', (o._x, o._y), False)
+
+    elif t in ('Triangle','Polygon'):
+        pts = getattr(o, 'vertices', None)
+        if pts is None:
+            pts = [o.p1, o.p2, getattr(o,'p3',None)]
+        # Filter out None values
+        pts = [p for p in pts if p is not None]
+        # Large polygons are drawn from a simplified outline (sub-pixel detail is invisible)
+        if t == 'Polygon' and len(pts) > LOD_VERTEX_THRESHOLD:
+            bx0, by0, bx1, by1 = o.bounding_box()
+            span = max(bx1 - bx0, by1 - by0)
+            pts = o.simplify(span * LOD_TOLERANCE_FRACTION)[0].vertices
+        if len(pts) >= 2:
+            xs = [p.x for p in pts] + [pts[0].x]
+            ys = [p.y for p in pts] + [pts[0].y]
+            g['lines'].append((xs, ys))
+            g['label'] = ('', (xs[0], ys[0]), False)
+
+    elif t in ('Rectangle','Square'):
+        p1, p2 = o.p1, o.p2
+        p3 = Point(p1.x, p2.y)
+        p4 = Point(p2.x, p1.y)
+        pts = [p1,p3,p2,p4]
+        xs = [p.x for p in pts] + [pts[0].x]
+        ys = [p.y for p in pts] + [pts[0].y]
+        g['lines'].append((xs, ys))
+        g['label'] = ('', (p1.x, p1.y), False)
+
+    elif t == 'Ellipse':
+        # curvature-adaptive samples, cached per ellipse shape
+        g['lines'].append(o.sample_points(tolerance=o.a * PLOT_CURVE_TOLERANCE, closed=True))
+        g['label'] = ('', (o.center.x + o.a, o.center.y), False)
+
+    elif t == 'Hyperbola':
+        # both branches over the same window as its bounding box, either orientation
+        g['lines'].extend(o.sample_branches(n=200))
+
+    elif t == 'Parabola':
+        pts = []
+        try:
+            pts = o.generate_points(n=400)
+        except Exception:
+            # fall back to sampling around vertex and focus if available
+            try:
+                v = o.vertex
+                h, k = v.x, v.y
+                a = o.a
+                tvals = [-5 + 10 * i / 199 for i in range(200)]
+                if o.orientation == "vertical":
+                    xs = [h + tv for tv in tvals]
+                    ys = [((x - h)**2) / (4 * a) + k for x in xs]
+                else:
+                    ys = [k + tv for tv in tvals]
+                    xs = [((y - k)**2) / (4 * a) + h for y in ys]
+                g['lines'].append((xs, ys))
+            except Exception:
+                pass
+        if pts:
+            g['lines'].append(([p.x for p in pts], [p.y for p in pts]))
+    return g
+
+# window : (xmin, xmax, ymin, ymax) to show, or None to fit every shape. With a
+# window, only the shapes the scene index finds inside it are drawn.
+def plot_all(show_grid=True, show_axes=True, annotate=True, window=None):
+    plt = pyplot()
     fig, ax = plt.subplots(figsize=(7,7))
     ax.set_aspect('equal')
     ax.tick_params(axis='both', which='major', labelsize=9, pad=6)
@@ -159,100 +200,49 @@ def plot_all(show_grid=True, show_axes=True, annotate=True):
         ax.axhline(0, color='#666666', linewidth=1, alpha=0.7, zorder=0)
         ax.axvline(0, color='#666666', linewidth=1, alpha=0.7, zorder=0)
 
-    labels = []
-    for s in st.session_state.shapes:
-        t = s['type']; o = s['obj']; color = s['color']; name = s['name']
-        try:
-            if t == 'Point':
-                ax.plot(o.x, o.y, 'o', color=color, markersize=8)
-                if annotate: ax.annotate(name + f" ({o.x:.2f},{o.y:.2f})", (o.x, o.y), textcoords='offset points', xytext=(4,4), fontsize=8)
-                labels.append(name)
-
-            elif t == 'Line':
-                x1, y1 = o.p1.x, o.p1.y
-                x2, y2 = o.p2.x, o.p2.y
-                ax.plot([x1, x2], [y1, y2], '-', linewidth=2, color=color)
-                if annotate: ax.annotate(name, ((x1+x2)/2, (y1+y2)/2), fontsize=8)
-
-            elif t == 'Circle':
-                circ = plt.Circle((o.center.x, o.center.y), o.radius, fill=False, linewidth=2, color=color)
-                ax.add_artist(circ)
-                if annotate: ax.annotate(name + f" (r={o.radius:.2f})", (o.center.x + o.radius, o.center.y), fontsize=8)
-
-            elif t == 'Vector':
-                ax.quiver(0,0, o._x, o._y, angles='xy', scale_units='xy', scale=1, color=color)
-                if annotate: ax.annotate(name, (o._x, o._y), fontsize=8)
-
-            elif t in ('Triangle','Polygon'):
-                pts = getattr(o, 'vertices', None)
-                if pts is None:
-                    pts = [o.p1, o.p2, getattr(o,'p3',None)]
-                # Filter out None values
-                pts = [p for p in pts if p is not None]
-                if len(pts) >= 2:
-                    xs = [p.x for p in pts] + [pts[0].x]
-                    ys = [p.y for p in pts] + [pts[0].y]
-                    ax.plot(xs, ys, '-', linewidth=2, color=color)
-                    if annotate: ax.annotate(name, (xs[0], ys[0]), fontsize=8)
-
-            elif t in ('Rectangle','Square'):
-                p1, p2 = o.p1, o.p2
-                p3 = Point(p1.x, p2.y)
-                p4 = Point(p2.x, p1.y)
-                pts = [p1,p3,p2,p4]
-                xs = [p.x for p in pts] + [pts[0].x]
-                ys = [p.y for p in pts] + [pts[0].y]
-                ax.plot(xs, ys, '-', linewidth=2, color=color)
-                if annotate: ax.annotate(name, (p1.x, p1.y), fontsize=8)
-
-            elif t == 'Ellipse':
-                tvals = np.linspace(0, 2*np.pi, 200)
-                x = o.center.x + o.a * np.cos(tvals)
-                y = o.center.y + o.b * np.sin(tvals)
-                ax.plot(x, y, '-', linewidth=2, color=color)
-                if annotate: ax.annotate(name, (o.center.x + o.a, o.center.y), fontsize=8)
-
-            elif t == 'Hyperbola':
-                tvals = np.linspace(0.5, 3.0, 200)
-                x1 = o.center.x + o.a*np.cosh(tvals)
-                y1 = o.center.y + o.b*np.sinh(tvals)
-                x2 = o.center.x - o.a*np.cosh(tvals)
-                y2 = o.center.y - o.b*np.sinh(tvals)
-                ax.plot(x1, y1, '-', linewidth=2, color=color)
-                ax.plot(x2, y2, '-', linewidth=2, color=color)
-
-            elif t == 'Parabola':
-                pts = []
-                try:
-                    pts = o.generate_points(n=400)
-                except Exception:
-                    # fall back to sampling around vertex and focus if available
-                    try:
-                        v = o.vertex
-                        f = o.focus
-                        h, k = v.x, v.y
-                        a = o.a
-                        if o.orientation == "vertical":
-                            tvals = np.linspace(-5,5,200)
-                            xs = [h + tv for tv in tvals]
-                            ys = [((x - h)**2) / (4 * a) + k for x in xs]
-                        else:
-                            tvals = np.linspace(-5,5,200)
-                            ys = [k + tv for tv in tvals]
-                            xs = [((y - k)**2) / (4 * a) + h for y in ys]
-                        ax.plot(xs, ys, '-', linewidth=2, color=color)
-                    except Exception:
-                        pass
-                if pts:
-                    xs = [p.x for p in pts]
-                    ys = [p.y for p in pts]
-                    ax.plot(xs, ys, '-', linewidth=2, color=color)
+    scene = st.session_state.scene
+    geometry = st.session_state.plot_geometry
+    # drop the geometry of shapes added, updated or removed since the last render
+    changed, removed = scene.changes()
+    for shape_id in changed + removed:
+        geometry.pop(shape_id, None)
 
-        except Exception:
-            # if plotting of a shape fails, continue with others
-            continue
+    if window is None:
+        window = compute_bbox(margin=1.0)
+        visible = None   # the fitted window holds every shape
+    else:
+        xmin, xmax, ymin, ymax = window
+        visible = set(scene.query_viewport((xmin, ymin, xmax, ymax)))
+        visible.update(scene.unbounded())
 
-    xmin, xmax, ymin, ymax = compute_bbox(margin=1.0)
+    for s in st.session_state.shapes:
+        if visible is not None and s['id'] not in visible:
+            continue
+        g = geometry.get(s['id'])
+        if g is None:
+            try:
+                g = shape_geometry(s['type'], s['obj'])
+            except Exception:
+                # if a shape cannot be sampled, continue with others
+                continue
+            geometry[s['id']] = g
+        color = s['color']
+        for xs, ys in g['lines']:
+            ax.plot(xs, ys, '-', linewidth=2, color=color)
+        for x, y in g['markers']:
+            ax.plot(x, y, 'o', color=color, markersize=8)
+        for cx, cy, r in g['circles']:
+            ax.add_artist(plt.Circle((cx, cy), r, fill=False, linewidth=2, color=color))
+        for x, y in g['arrows']:
+            ax.quiver(0,0, x, y, angles='xy', scale_units='xy', scale=1, color=color)
+        if annotate and g['label'] is not None:
+            suffix, xy, offset = g['label']
+            if offset:
+                ax.annotate(s['name'] + suffix, xy, textcoords='offset points', xytext=(4,4), fontsize=8)
+            else:
+                ax.annotate(s['name'] + suffix, xy, fontsize=8)
+
+    xmin, xmax, ymin, ymax = window
     ax.set_xlim(xmin, xmax); ax.set_ylim(ymin, ymax)
     ax.set_xlabel('X'); ax.set_ylabel('Y')
     ax.set_title('Geometry Toolkit — Visualization')
@@ -435,6 +425,9 @@ with st.sidebar.expander('Export Reports'):
     export_type = st.selectbox('Export as', ['PDF', 'CSV'])
     if st.button('Export'):
         if export_type == 'PDF':
+            from reportlab.lib.pagesizes import letter
+            from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Image
+            from reportlab.lib.styles import getSampleStyleSheet
             pdf_buffer = io.BytesIO()
             doc = SimpleDocTemplate(pdf_buffer, pagesize=letter)
             styles = getSampleStyleSheet()
@@ -468,6 +461,30 @@ with st.sidebar.expander('Export Reports'):
             csv_buffer.seek(0)
             st.download_button('Download CSV Report', data=csv_buffer.getvalue(), file_name='geometry_report.csv', mime='text/csv')
 
+# Per-method profiling (opt-in, see profiling.py)
+# profiling.py imports every shape class, so it is only loaded once profiling is switched on
+with st.sidebar.expander('Profiling'):
+    track_allocs = st.checkbox('Track allocations', False, help="Uses tracemalloc; slows everything down")
+    profile_on = st.checkbox('Enable profiling', False, help="Time every call to the toolkit's shape methods")
+    if not profile_on and 'coordinate_geometry_toolkit.profiling' not in sys.modules:
+        st.caption('No calls recorded yet.')
+    else:
+        from coordinate_geometry_toolkit import profiling
+        if profile_on:
+            if not profiling.is_enabled() or track_allocs != profiling.tracks_allocations():
+                profiling.enable(allocations=track_allocs)
+        elif profiling.is_enabled():
+            profiling.disable()
+        table = profiling.rows()
+        if table:
+            st.dataframe(table, hide_index=True)
+            st.download_button('Download profile (JSON)', profiling.export_json(), file_name='profile.json')
+        else:
+            st.caption('No calls recorded yet.')
+        if st.button('Reset counters'):
+            profiling.reset()
+            st.rerun()
+
 # Visualization toggles
 st.sidebar.markdown("""
 <div class="sidebar-section">
@@ -478,6 +495,18 @@ st.sidebar.markdown("""
 show_grid = st.sidebar.checkbox('Show grid', True, help="Display grid lines on the plot")
 show_axes = st.sidebar.checkbox('Show axes (x=0,y=0)', True, help="Show coordinate axes")
 annotate = st.sidebar.checkbox('Show labels & annotations', True, help="Display shape names and coordinates")
+fit_view = st.sidebar.checkbox('Fit view to all shapes', True, help="Uncheck to show a fixed window; only shapes inside it are drawn")
+view_window = None
+if not fit_view:
+    vc1, vc2 = st.sidebar.columns(2)
+    vx0 = vc1.number_input('View x min', value=-10.0)
+    vx1 = vc2.number_input('View x max', value=10.0)
+    vy0 = vc1.number_input('View y min', value=-10.0)
+    vy1 = vc2.number_input('View y max', value=10.0)
+    if vx0 < vx1 and vy0 < vy1:
+        view_window = (vx0, vx1, vy0, vy1)
+    else:
+        st.sidebar.warning('View window needs min < max; fitting all shapes instead')
 
 # ---------- Main layout ----------
 
@@ -563,9 +592,9 @@ with left:
             for i in range(n):
                 cx, cy = st.columns(2)
                 with cx:
-                    px = st.number_input(f'X{i+1}', value=float(np.cos(2*np.pi*i/n)), key=f'poly_x_{i}')
+                    px = st.number_input(f'X{i+1}', value=math.cos(2*math.pi*i/n), key=f'poly_x_{i}')
                 with cy:
-                    py = st.number_input(f'Y{i+1}', value=float(np.sin(2*np.pi*i/n)), key=f'poly_y_{i}')
+                    py = st.number_input(f'Y{i+1}', value=math.sin(2*math.pi*i/n), key=f'poly_y_{i}')
                 pts.append(Point(px, py))
             if st.form_submit_button('Add Polygon'):
                 add_shape('Polygon', Polygon(pts), name=name or None)
@@ -606,7 +635,7 @@ with right:
     </div>
     """, unsafe_allow_html=True)
     
-    fig = plot_all(show_grid=show_grid, show_axes=show_axes, annotate=annotate)
+    fig = plot_all(show_grid=show_grid, show_axes=show_axes, annotate=annotate, window=view_window)
     st.pyplot(fig)
 
     # Export plot
@@ -636,7 +665,7 @@ with right:
             with cols[1]:
                 if st.button('Delete', key=f"del_{s['id']}", help="Delete this shape"):
                     try:
-                        del st.session_state.shapes[actual_idx]
+                        delete_shape(actual_idx)
                     except Exception:
                         pass
                     st.rerun()
@@ -756,8 +785,8 @@ else:
             ('is_point_on_hyperbola', ['point']), ('focus_directrix_property', ['point']),
         ],
         'Parabola': [
-            ('equation', []), ('focus_point', []), ('directrix', []), ('latus_rectum_length', []),
-            ('axis_of_symmetry', []), ('vertex_form_of_parabola', []), ('point_on_parabola', ['point']),
+            ('describe', []), ('opening', []), ('equation', []), ('focus_point', []), ('directrix', []),
+            ('latus_rectum_length', []), ('axis_of_symmetry', []), ('vertex_form_of_parabola', []), ('point_on_parabola', ['point']),
             ('distance_to_focus', ['point']), ('distance_to_directrix', ['point']), ('is_point_inside', ['point']),
             ('generate_points', ['int']), ('is_point_on_parabola', ['point']), ('focus_directrix_property', ['point']),
         ],
@@ -861,7 +890,7 @@ else:
                         # Numeric → show metric and mini bar
                         if isinstance(res, (int, float)):
                             st.metric(label='Value', value=res)
-                            fign, axn = plt.subplots(figsize=(3.5, 0.6))
+                            fign, axn = pyplot().subplots(figsize=(3.5, 0.6))
                             axn.barh(["result"], [float(res)])
                             axn.set_yticks([])
                             axn.set_xlim(left=min(0.0, float(res)))
@@ -872,13 +901,13 @@ else:
                         elif isinstance(res, dict) and all(isinstance(v, (int, float)) for v in res.values()):
                             labels = list(res.keys())
                             values = [float(res[k]) for k in labels]
-                            figd, axd = plt.subplots(figsize=(4.5, 2.5))
+                            figd, axd = pyplot().subplots(figsize=(4.5, 2.5))
                             axd.bar(labels, values)
                             axd.set_title('Values')
                             st.pyplot(figd)
                         # Tuple/list of numerics → line
                         elif isinstance(res, (list, tuple)) and res and all(isinstance(v, (int, float)) for v in res):
-                            figl, axl = plt.subplots(figsize=(4.5, 2.2))
+                            figl, axl = pyplot().subplots(figsize=(4.5, 2.2))
                             axl.plot(list(range(len(res))), list(map(float, res)), marker='o')
                             axl.set_title('Sequence')
                             st.pyplot(figl)
@@ -0,0 +1,72 @@
+import math
+import unittest
+
+import numpy as np
+
+from coordinate_geometry_toolkit.point import Point
+from coordinate_geometry_toolkit.polygon import Polygon
+from coordinate_geometry_toolkit.rectangle import Rectangle
+from coordinate_geometry_toolkit.square import Square
+
+
+# Rectangle containment is half-open, [xmin, xmax) x [ymin, ymax). That is the
+# answer the ray-casting test on the corner polygon gives, which is what Rectangle
+# used before it compared against its min/max directly.
+def ray_cast(rect):
+    p1, p2 = rect.p1, rect.p2
+    return Polygon([p1, Point(p1.x, p2.y), p2, Point(p2.x, p1.y)]).is_point_inside
+
+
+def probe_points(xmin, ymin, xmax, ymax):
+    # every corner, edge and interior combination, plus one ulp either side of each edge
+    xs = {xmin, xmax, (xmin + xmax) / 2, xmin - 1, xmax + 1}
+    ys = {ymin, ymax, (ymin + ymax) / 2, ymin - 1, ymax + 1}
+    for v in (xmin, xmax):
+        xs.update((math.nextafter(v, -math.inf), math.nextafter(v, math.inf)))
+    for v in (ymin, ymax):
+        ys.update((math.nextafter(v, -math.inf), math.nextafter(v, math.inf)))
+    return [Point(x, y) for x in sorted(xs) for y in sorted(ys)]
+
+
+class RectangleContainmentTest(unittest.TestCase):
+
+    # corners given in every order, plus a Square
+    SHAPES = [
+        Rectangle(Point(-2, -1), Point(3, 4)),
+        Rectangle(Point(3, 4), Point(-2, -1)),
+        Rectangle(Point(-2, 4), Point(3, -1)),
+        Rectangle(Point(0.1, 0.2), Point(0.7, 0.3)),
+        Square(Point(1, 1), Point(3, 3)),
+    ]
+
+    def test_is_point_inside_matches_ray_cast(self):
+        for rect in self.SHAPES:
+            expected = ray_cast(rect)
+            for p in probe_points(*rect.bounding_box()):
+                self.assertEqual(rect.is_point_inside(p), expected(p), (str(rect), str(p)))
+
+    def test_edges_are_half_open(self):
+        rect = Rectangle(Point(3, 4), Point(-2, -1))
+        self.assertTrue(rect.is_point_inside(Point(-2, -1)))     # lower-left corner
+        self.assertFalse(rect.is_point_inside(Point(3, 0)))      # right edge
+        self.assertFalse(rect.is_point_inside(Point(0, 4)))      # top edge
+        self.assertFalse(rect.is_point_inside(Point(3, 4)))      # upper-right corner
+        self.assertTrue(rect.is_point_inside(Point(math.nextafter(3, -math.inf), 0)))
+
+    def test_contains_many_matches_is_point_inside(self):
+        for rect in self.SHAPES:
+            points = probe_points(*rect.bounding_box())
+            expected = [rect.is_point_inside(p) for p in points]
+            inside = rect.contains_many(points)
+            self.assertIsInstance(inside, np.ndarray)
+            self.assertEqual(inside.dtype, bool)
+            self.assertEqual(inside.tolist(), expected)
+            columns = rect.contains_many([p.x for p in points], [p.y for p in points])
+            self.assertEqual(columns.tolist(), expected)
+
+    def test_contains_many_empty(self):
+        self.assertEqual(Rectangle(Point(0, 0), Point(1, 1)).contains_many([]).shape, (0,))
+
+
+if __name__ == "__main__":
+    unittest.main()